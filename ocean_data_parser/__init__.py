@@ -1,9 +1,28 @@
 """This is the main module of the package. It contains the version number and the list of parsers available in the package."""
 
-import re
-from pathlib import Path
-
-PARSERS = re.findall(
-    'parser = "(.*)"', (Path(__file__).parent / "read.py").read_text()
-) + ["dfo.odf.odf", "dfo.odf.as_qo_odf"]
+PARSERS = [
+    "netcdf",
+    "seabird.btl",
+    "seabird.cnv",
+    "electricblue.csv",
+    "onset.csv",
+    "electricblue.log_csv",
+    "star_oddi.dat",
+    "amundsen.int_format",
+    "amundsen.csv_format",
+    "dfo.ios.shell",
+    "dfo.nafc.pcnv",
+    "dfo.nafc.pfile",
+    "dfo.odf.bio_odf",
+    "dfo.odf.mli_odf",
+    "dfo.odf.as_qo_odf",
+    "dfo.odf.odf",
+    "van_essen_instruments.mon",
+    "pme.txt",
+    "rbr.rtext",
+    "sunburst.super_co2_notes",
+    "sunburst.super_co2",
+    "nmea.nmea_0183",
+    "onset.xlsx",
+]
 __version__ = "0.7.0"
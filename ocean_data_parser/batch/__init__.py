@@ -6,6 +6,7 @@ Modules:
     - utils.py: Contains utility functions for batch processing.
     - registry.py: Contains the registry for batch processing functions.
     - config.py: Contains functions to load configuration files.
+    - collection.py: Contains functions to combine profiles in a single ragged array file.
     - default-batch-config.json: Default configuration file for batch processing.
 
 The batch package is responsible for managing and processing multiple files at once.
@@ -0,0 +1,264 @@
+"""Combine multiple profiles into a single CF discrete sampling geometry file.
+
+Profile parsers (`seabird.cnv`, `dfo.odf.*`, `dfo.nafc.pcnv`, `dfo.ios.shell`, ...)
+generate one dataset per cast. This module regroups a collection of those
+profiles within a single
+[CF-1.8 contiguous ragged array](https://cfconventions.org/Data/cf-conventions/cf-conventions-1.8/cf-conventions.html#_contiguous_ragged_array_representation)
+with a `profile` instance dimension and an `obs` sample dimension.
+
+```python
+from ocean_data_parser.batch.collection import write_profile_collection
+
+write_profile_collection("cruise/*.cnv", "cruise_profiles.nc")
+```
+"""
+
+from collections.abc import Iterable
+from glob import glob
+from pathlib import Path
+from typing import Union
+
+import numpy as np
+import xarray as xr
+from loguru import logger
+
+from ocean_data_parser import read
+from ocean_data_parser.parsers.utils import standardize_dataset
+
+DEFAULT_PROFILE_ATTRIBUTES = [
+    "id",
+    "original_filename",
+    "station",
+    "event_number",
+    "source",
+]
+
+
+def _get_fill_value(dtype: np.dtype):
+    """Return fill value and output dtype used for missing observations."""
+    if dtype.kind == "f":
+        return np.nan, dtype
+    elif dtype.kind in "iub":
+        return np.nan, np.dtype("float64")
+    elif dtype.kind == "M":
+        return np.datetime64("NaT"), dtype
+    return "", np.dtype(object)
+
+
+def _concatenate_segments(segments: list, sizes: list) -> np.ndarray:
+    """Concatenate segments in a single array and fill missing ones.
+
+    Args:
+        segments (list): list of numpy arrays or None if the variable is missing
+        sizes (list): size of each segment
+
+    Returns:
+        np.ndarray: concatenated array
+    """
+    dtypes = [segment.dtype for segment in segments if segment is not None]
+    dtype = np.result_type(*dtypes) if len(set(dtypes)) > 1 else dtypes[0]
+    if dtype.kind not in "fiubM":
+        dtype = np.dtype(object)
+
+    if any(segment is None for segment in segments):
+        fill_value, dtype = _get_fill_value(dtype)
+    else:
+        fill_value = None
+
+    output = np.empty(sum(sizes), dtype=dtype)
+    start = 0
+    for segment, size in zip(segments, sizes):
+        if segment is None:
+            output[start : start + size] = fill_value
+        else:
+            output[start : start + size] = segment
+        start += size
+    return output
+
+
+def _get_sample_dimension(ds: xr.Dataset) -> str:
+    if len(ds.dims) != 1:
+        raise ValueError(
+            f"Profile dataset should have a single dimension, received {dict(ds.sizes)}"
+        )
+    return list(ds.dims)[0]
+
+
+def profiles_to_ragged_array(
+    datasets: Iterable[xr.Dataset],
+    profile_attributes: list = None,
+    profile_dimension: str = "profile",
+    sample_dimension: str = "obs",
+) -> xr.Dataset:
+    """Combine profile datasets into a CF contiguous ragged array dataset.
+
+    Each dataset is expected to have a single sample dimension
+    (ex: `index`, `depth`). Scalar variables (ex: `time`, `latitude`, `longitude`)
+    become profile variables, while variables along the sample dimension
+    are appended along the `obs` dimension. Variables missing in some
+    profiles are filled with NaN/NaT or an empty string.
+
+    The datasets are consumed in one pass: only the arrays of each
+    dataset are kept in memory until the final concatenation.
+
+    Args:
+        datasets (Iterable[xr.Dataset]): profile datasets
+        profile_attributes (list, optional): Global attributes stored as
+            profile variables. Defaults to DEFAULT_PROFILE_ATTRIBUTES.
+        profile_dimension (str, optional): Instance dimension name.
+            Defaults to "profile".
+        sample_dimension (str, optional): Sample dimension name.
+            Defaults to "obs".
+
+    Returns:
+        xr.Dataset: Contiguous ragged array dataset
+    """
+    profile_attributes = (
+        DEFAULT_PROFILE_ATTRIBUTES if profile_attributes is None else profile_attributes
+    )
+
+    sizes = []
+    obs_segments, profile_values, variable_attrs, global_attrs = {}, {}, {}, None
+    for index, ds in enumerate(datasets):
+        dim = _get_sample_dimension(ds)
+        sizes.append(ds.sizes[dim])
+
+        for var in ds.variables:
+            # Drop default pandas index which isn't meaningful once combined
+            if var == dim == "index":
+                continue
+            if ds[var].dims == (dim,):
+                segments = obs_segments
+            elif ds[var].dims == ():
+                segments = profile_values
+            else:
+                logger.warning(
+                    "Ignore variable {} with dimensions {}", var, ds[var].dims
+                )
+                continue
+            if var not in segments:
+                segments[var] = [None] * index
+                variable_attrs[var] = dict(ds[var].attrs)
+            segments[var].append(ds[var].values)
+
+        for attr in profile_attributes:
+            if attr not in ds.attrs:
+                continue
+            if attr not in profile_values:
+                profile_values[attr] = [None] * index
+                variable_attrs[attr] = {}
+            profile_values[attr].append(np.asarray(str(ds.attrs[attr])))
+
+        # Retain only the global attributes shared by every profiles
+        if global_attrs is None:
+            global_attrs = {
+                key: value
+                for key, value in ds.attrs.items()
+                if key not in profile_attributes
+            }
+        else:
+            global_attrs = {
+                key: value
+                for key, value in global_attrs.items()
+                if key in ds.attrs and np.array_equal(ds.attrs[key], value)
+            }
+
+        for segments in (obs_segments, profile_values):
+            for var in segments:
+                if len(segments[var]) == index:
+                    segments[var].append(None)
+
+    if not sizes:
+        raise ValueError("No profile provided")
+
+    n_profiles = len(sizes)
+    logger.debug("Combine {} profiles and {} observations", n_profiles, sum(sizes))
+    ragged = xr.Dataset(
+        {
+            var: (sample_dimension, _concatenate_segments(segments, sizes))
+            for var, segments in obs_segments.items()
+        }
+    )
+    for var, values in profile_values.items():
+        ragged[var] = (
+            profile_dimension,
+            _concatenate_segments(values, [1] * n_profiles),
+        )
+    for var, attrs in variable_attrs.items():
+        ragged[var].attrs = attrs
+
+    ragged["profile_id"] = (profile_dimension, np.arange(n_profiles, dtype="int32"))
+    ragged["profile_id"].attrs = {"cf_role": "profile_id"}
+    ragged["rowSize"] = (profile_dimension, np.array(sizes, dtype="int32"))
+    ragged["rowSize"].attrs = {
+        "long_name": "Number of observations for this profile",
+        "sample_dimension": sample_dimension,
+    }
+
+    ragged.attrs = {
+        **global_attrs,
+        "featureType": "profile",
+        "cdm_data_type": "Profile",
+        "cdm_profile_variables": ",".join(
+            var for var in ragged.variables if ragged[var].dims == (profile_dimension,)
+        ),
+        "Conventions": "CF-1.8",
+    }
+    return ragged
+
+
+def _load_profiles(files: list, parser=None, parser_kwargs: dict = None):
+    for file in files:
+        with logger.contextualize(source_file=str(file)):
+            logger.debug("Load profile {}", file)
+            ds = read.file(str(file), parser=parser, **(parser_kwargs or {}))
+            ds.attrs.setdefault("source", str(file))
+            yield ds
+
+
+def write_profile_collection(
+    files: Union[str, list],
+    output_path: Union[str, Path],
+    parser: str = None,
+    parser_kwargs: dict = None,
+    profile_attributes: list = None,
+    **to_netcdf_kwargs,
+) -> Path:
+    """Parse a collection of profile files and save them as a single ragged array file.
+
+    Args:
+        files (str, list): glob expression or list of files to combine.
+        output_path (str, Path): Output NetCDF file path.
+        parser (str, optional): Parser used to parse each file.
+            Defaults to auto detection.
+        parser_kwargs (dict, optional): Keyword arguments passed to the parser.
+        profile_attributes (list, optional): Global attributes stored as
+            profile variables. Defaults to DEFAULT_PROFILE_ATTRIBUTES.
+        **to_netcdf_kwargs: Keyword arguments passed to `xarray.Dataset.to_netcdf`.
+
+    Returns:
+        Path: output path
+    """
+    if isinstance(files, str):
+        files = sorted(glob(files, recursive=True))
+    if not files:
+        raise ValueError("No files to combine")
+
+    ds = profiles_to_ragged_array(
+        _load_profiles(files, parser, parser_kwargs),
+        profile_attributes=profile_attributes,
+    )
+    ds = standardize_dataset(ds)
+
+    # Missing timestamps are encoded by xarray as the int64 minimum
+    # when encoded to float, flag it as the fill value.
+    for var in ds.variables:
+        if ds[var].dtype.kind == "M" and np.isnat(ds[var].values).any():
+            ds[var].encoding["_FillValue"] = float(np.iinfo("int64").min)
+
+    output_path = Path(output_path)
+    if not output_path.parent.exists():
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+    logger.info("Save {} profiles to {}", ds.sizes["profile"], output_path)
+    ds.to_netcdf(output_path, **to_netcdf_kwargs)
+    return output_path
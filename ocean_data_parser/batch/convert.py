@@ -107,6 +107,15 @@ def validate_parser_kwargs(ctx, _, value):
     ),
     callback=validate_parser,
 )
+@click.option(
+    "--redetect",
+    is_flag=True,
+    default=False,
+    help=(
+        "Detect again the parser of each file instead of reusing"
+        " the parsers detected within the registry."
+    ),
+)
 @click.option(
     "--parser-kwargs",
     type=str,
@@ -117,6 +126,11 @@ def validate_parser_kwargs(ctx, _, value):
     default="{}",
     callback=validate_parser_kwargs,
 )
+@click.option(
+    "--dtype-policy",
+    type=click.Choice(utils.DTYPE_POLICIES),
+    help="dtype policy applied to the parsed datasets to reduce memory usage.",
+)
 @click.option(
     "--overwrite",
     type=bool,
@@ -159,6 +173,11 @@ def validate_parser_kwargs(ctx, _, value):
 @click.option(
     "--output-file-suffix", type=click.Path(), help="Output file name suffix to add"
 )
+@click.option(
+    "--output-encoding",
+    type=click.Choice(list(utils.ENCODING_PRESETS.keys())),
+    help="NetCDF compression and chunking encoding preset to apply.",
+)
 @click.option(
     "--config", "-c", type=click.Path(exists=True), help="Path to configuration file"
 )
@@ -406,12 +425,18 @@ class BatchConversion:
             "{}/{} files needs to be converted", len(modified_files), len(files)
         )
 
-        # Load parser
+        # Load parser or detect each file parser
         parser = self._get_parser()
+        if parser is None:
+            parsers = self.registry.detect_file_formats(
+                modified_files, redetect=self.config.get("redetect", False)
+            )
+        else:
+            parsers = dict.fromkeys(modified_files, parser)
 
         # Generate inputs for conversion
         inputs = (
-            (str(file), parser, self.config, attrs)
+            (str(file), parsers[file], self.config, attrs)
             for file, attrs in zip(modified_files, modified_files_attrs)
         )
 
@@ -504,6 +529,7 @@ def convert_file(file: str, parser: str, config: dict, global_attributes=None) -
         parser=parser,
         **(config.get("parser_kwargs") or {}),
         global_attributes=global_attributes,
+        dtype_policy=config.get("dtype_policy") or "default",
     )
     if not isinstance(ds, Dataset):
         raise RuntimeError(
@@ -559,11 +585,22 @@ def convert_file(file: str, parser: str, config: dict, global_attributes=None) -
     # Aggregate flags
     # TODO aggregate ioos_qc and manual flags
 
-    # Standardize output
+    # Standardize output, processing steps may modify the data in place
+    if config.get("xarray_pipe") or config.get("ioos_qc"):
+        ds.encoding.pop(utils.STANDARDIZED_FINGERPRINT, None)
     ds = utils.standardize_dataset(ds)
 
+    # Pack variables and apply compression and chunking encoding
+    output_config = dict(config["output"])
+    packing = output_config.pop("packing", None) or {}
+    if packing.get("enabled"):
+        ds = utils.pack_variables(ds, resolutions=packing.get("resolutions"))
+    encoding = output_config.pop("encoding", None)
+    if encoding:
+        ds = utils.apply_encoding_preset(ds, encoding)
+
     # Save to
-    output_path = generate_output_path(ds, **config["output"])
+    output_path = generate_output_path(ds, **output_config)
     if not output_path.parent.exists():
         logger.debug("Create new directory: {}", output_path.parent)
         output_path.parent.mkdir(parents=True, exist_ok=True)
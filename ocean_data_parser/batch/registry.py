@@ -7,7 +7,8 @@ from typing import Union
 import pandas as pd
 from tqdm import tqdm
 
-tqdm.pandas()
+from ocean_data_parser import read
+
 logger = logging.getLogger(__name__)
 
 EMPTY_FILE_REGISTRY = pd.DataFrame(
@@ -20,6 +21,9 @@ REGISTRY_DTYPE = {
     "hash": str,
     "error_message": str,
     "output_path": str,
+    "parser": str,
+    "detection_version": str,
+    "size": float,
 }
 
 
@@ -138,6 +142,19 @@ class FileConversionRegistry:
         source = Path(source)
         return source.stat().st_mtime if source.exists() else None
 
+    @staticmethod
+    def _get_size(source: str) -> float:
+        """Get file size.
+
+        Args:
+            source (str): source file path
+
+        Returns:
+            float: size in bytes
+        """
+        source = Path(source)
+        return source.stat().st_size if source.exists() else None
+
     @staticmethod
     def _file_exists(file):
         return Path(file).exists() if isinstance(file, (str, Path)) else False
@@ -159,6 +176,7 @@ class FileConversionRegistry:
 
         # Retrieve mtime and hash only if a registry is actually saved
         if self.path:
+            tqdm.pandas()
             logger.info("Get new files mtime")
             mtimes = new_data.index.to_series().progress_apply(self._get_mtime)
             logger.info("Get new files hashes")
@@ -263,6 +281,76 @@ class FileConversionRegistry:
 
         self.data.update(dataframe, overwrite=True)
 
+    def detect_file_formats(
+        self, sources: list = None, redetect: bool = False, **kwargs
+    ) -> dict:
+        """Detect the sources parser and reuse the parsers already detected.
+
+        The detected parser, detection rules version and file size are kept
+        in the registry. A parser is reused if the source mtime (or hash)
+        and size are unchanged and the detection rules are the same.
+
+        Args:
+            sources (list, optional): Subset of file sources to detect.
+                Defaults to all entries.
+            redetect (bool, optional): Ignore the parsers already detected.
+                Defaults to False.
+            **kwargs: Key arguments passed to `read.detect_file_formats`.
+
+        Returns:
+            dict: Parser associated with each source `{source: parser}`,
+                None if no parser matches the source.
+        """
+        sources = self._get_sources(sources)
+        if not sources:
+            return {}
+
+        # Registries generated by previous versions miss the detection columns
+        for column in ("parser", "detection_version", "size"):
+            if column not in self.data:
+                self.data[column] = None
+        data = self.data.loc[sources]
+        detection_version = read.get_detection_rules_version()
+        sizes = data.index.to_series().map(self._get_size)
+        has_same_mtime = data["mtime"] == data.index.map(self._get_mtime)
+        is_cached = (
+            data["parser"].notna()
+            & (data["detection_version"] == detection_version)
+            & (data["size"] == sizes)
+        )
+        if redetect:
+            is_cached.loc[:] = False
+        elif self.hashtype and (is_cached & ~has_same_mtime).any():
+            # Only hash the cached sources with a different mtime
+            is_touched = is_cached & ~has_same_mtime
+            is_cached.loc[is_touched] = (
+                data.loc[is_touched].index.map(self._get_hash)
+                == data.loc[is_touched]["hash"]
+            )
+        else:
+            is_cached &= has_same_mtime
+
+        logger.debug("Reuse %s/%s detected parsers", is_cached.sum(), len(is_cached))
+        detected = read.detect_file_formats(
+            data.index[~is_cached].to_list(), errors="ignore", **kwargs
+        )
+
+        # Keep only the parsers matching the registry sources mtime
+        new_parsers = pd.Series(detected, dtype=object).reindex(data.index)
+        is_new = ~is_cached & has_same_mtime & new_parsers.notna()
+        if is_new.any():
+            self.update_fields(
+                data.index[is_new].to_list(),
+                parser=new_parsers[is_new].to_list(),
+                detection_version=detection_version,
+                size=sizes[is_new].to_list(),
+            )
+        parsers = data["parser"].where(is_cached, new_parsers)
+        return {
+            source: parser if isinstance(parser, str) else None
+            for source, parser in parsers.items()
+        }
+
     def get_modified_source_files(self, overwrite: bool = True) -> list:
         """Return the list of files that needs to be parsed.
 
@@ -3,14 +3,32 @@
 import logging
 import os
 import sys
+from importlib import import_module
 
 import click
 from loguru import logger
 
 from ocean_data_parser import __version__
-from ocean_data_parser.batch import convert
-from ocean_data_parser.inspect import inspect_variables as inspect_variables
 
+# Subcommands are imported only when invoked: {name: (import path, short help)}
+LAZY_SUBCOMMANDS = {
+    "convert": (
+        "ocean_data_parser.batch.convert.cli",
+        "Ocean Data Parser Batch Conversion CLI Interface.",
+    ),
+    "follow": (
+        "ocean_data_parser.follow.follow_cli",
+        "Follow a growing NMEA file and convert the appended lines.",
+    ),
+    "ingest": (
+        "ocean_data_parser.ingest.ingest_cli",
+        "Receive NMEA sentences over UDP or TCP and save them in batches.",
+    ),
+    "inspect-variables": (
+        "ocean_data_parser.inspect.inspect_variables",
+        "Inspect NetCDF files variables and variables attributes.",
+    ),
+}
 LOG_LEVELS = ["TRACE", "DEBUG", "INFO", "WARNING", "ERROR"]
 VERBOSE_LOG_FORMAT = (
     '<level>{level.icon}</level> <blue>"{file.path}"</blue>: '
@@ -57,8 +75,59 @@ logging.basicConfig(
 classic_logger = logging.getLogger()
 
 
+class LazyGroup(click.Group):
+    """Click group importing its subcommands modules only when invoked.
+
+    The `odpy` subcommands depend on the scientific stack (pandas, xarray,
+    parsers, ...) which isn't needed by `odpy --help` or `odpy --version`.
+    """
+
+    def __init__(self, *args, lazy_subcommands: dict = None, **kwargs):
+        """Create a lazy click group.
+
+        Args:
+            *args: Positional arguments passed to click.Group.
+            lazy_subcommands (dict, optional): Mapping of the subcommands names
+                to their `(import path, short help)`.
+            **kwargs: Keyword arguments passed to click.Group.
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx):
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_subcommands and cmd_name not in self.commands:
+            import_path, _ = self.lazy_subcommands[cmd_name]
+            module_name, command_name = import_path.rsplit(".", 1)
+            self.add_command(
+                getattr(import_module(module_name), command_name), cmd_name
+            )
+        return super().get_command(ctx, cmd_name)
+
+    def format_commands(self, ctx, formatter):
+        commands = self.list_commands(ctx)
+        if not commands:
+            return
+        limit = formatter.width - 6 - max(len(name) for name in commands)
+        rows = []
+        for name in commands:
+            if name in self.commands:
+                if self.commands[name].hidden:
+                    continue
+                rows.append((name, self.commands[name].get_short_help_str(limit)))
+            else:
+                command = click.Command(name, help=self.lazy_subcommands[name][1])
+                rows.append((name, command.get_short_help_str(limit)))
+        with formatter.section("Commands"):
+            formatter.write_dl(rows)
+
+
 @click.group(
     name="odpy",
+    cls=LazyGroup,
+    lazy_subcommands=LAZY_SUBCOMMANDS,
     invoke_without_command=True,
     context_settings={"auto_envvar_prefix": "ODPY"},
 )
@@ -174,8 +243,5 @@ def main(
         click.echo(f"log_file_level={log_file_level}")
 
 
-main.add_command(convert.cli)
-main.add_command(inspect_variables)
-
 if __name__ == "__main__":
-    main(auto_envar_prefix="ODPY")
+    main(auto_envvar_prefix="ODPY")
@@ -0,0 +1,126 @@
+"""Follow growing NMEA 0183 log files and convert the appended lines."""
+
+import json
+import time
+from pathlib import Path
+
+import click
+from loguru import logger
+
+from ocean_data_parser.parsers import nmea
+
+
+def follow(
+    path: str,
+    output_dir: str = None,
+    state_file: str = None,
+    interval: float = 10,
+    engine: str = "vectorized",
+    encoding: str = "UTF-8",
+    nmea_delimiter: str = "$",
+    once: bool = False,
+) -> list:
+    """Convert the lines appended to a NMEA file to NetCDF files.
+
+    Each batch of new lines is saved to
+    `{output_dir}/{file stem}_{first row:09d}.nc`. The reading position is
+    saved to the state file after each batch, a restarted follow resumes
+    from the last converted line.
+
+    Args:
+        path (str): Path to the NMEA file to follow.
+        output_dir (str, optional): Directory where to save the NetCDF files.
+            Defaults to the NMEA file directory.
+        state_file (str, optional): Path to the JSON file where the reading
+            position is saved. Defaults to
+            `{output_dir}/{file name}.follow.json`.
+        interval (float, optional): Seconds between each file check.
+            Defaults to 10.
+        engine (str, optional): NMEA parser engine. Defaults to "vectorized".
+        encoding (str, optional): File encoding. Defaults to "UTF-8".
+        nmea_delimiter (str, optional): NMEA string delimiter. Defaults to "$".
+        once (bool, optional): Convert the lines available and stop.
+            Defaults to False.
+
+    Returns:
+        list: Generated NetCDF files.
+    """
+    path = Path(path)
+    output_dir = Path(output_dir) if output_dir else path.parent
+    output_dir.mkdir(parents=True, exist_ok=True)
+    state_file = (
+        Path(state_file) if state_file else output_dir / f"{path.name}.follow.json"
+    )
+
+    state = json.loads(state_file.read_text()) if state_file.exists() else {}
+    if state:
+        logger.info(
+            "Resume {} from row {} (offset={})", path, state["row"], state["offset"]
+        )
+    follower = nmea.NMEAFollower(
+        path,
+        encoding=encoding,
+        nmea_delimiter=nmea_delimiter,
+        engine=engine,
+        offset=state.get("offset", 0),
+        row=state.get("row", 0),
+    )
+
+    outputs = []
+    while True:
+        ds = follower.read()
+        if ds is not None and ds.sizes.get("index"):
+            first_row = int(ds["row"].values[0])
+            output = output_dir / f"{path.stem}_{first_row:09d}.nc"
+            logger.info("Save rows {}-{} to {}", first_row, follower.row - 1, output)
+            ds.to_netcdf(output)
+            outputs.append(output)
+        state_file.write_text(json.dumps(follower.state))
+        if once:
+            return outputs
+        time.sleep(interval)
+
+
+@click.command(name="follow", context_settings={"auto_envvar_prefix": "ODPY_FOLLOW"})
+@click.argument("path", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--output-dir",
+    "-o",
+    type=click.Path(file_okay=False),
+    default=None,
+    help="Directory where to save the NetCDF files. Defaults to the file directory.",
+)
+@click.option(
+    "--state-file",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="JSON file where the reading position is saved. "
+    "Defaults to {output_dir}/{file name}.follow.json",
+)
+@click.option(
+    "--interval",
+    type=float,
+    default=10,
+    show_default=True,
+    help="Seconds between each file check",
+)
+@click.option(
+    "--engine",
+    type=click.Choice(nmea.NMEA_0183_ENGINES),
+    default="vectorized",
+    show_default=True,
+    help="NMEA parser engine",
+)
+@click.option("--encoding", default="UTF-8", show_default=True, help="File encoding")
+@click.option(
+    "--nmea-delimiter", default="$", show_default=True, help="NMEA string delimiter"
+)
+@click.option(
+    "--once",
+    is_flag=True,
+    default=False,
+    help="Convert the lines available and stop",
+)
+def follow_cli(**kwargs):
+    """Follow a growing NMEA file and convert the appended lines."""
+    follow(**kwargs)
@@ -0,0 +1,452 @@
+"""Live ingest of NMEA 0183 sentences received over UDP or TCP."""
+
+import selectors
+import socket
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import click
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from ocean_data_parser.parsers import nmea
+
+INGEST_PROTOCOLS = ("udp", "tcp")
+INGEST_OUTPUT_FORMATS = {"netcdf": "nc", "parquet": "parquet"}
+# Errors raised by the NMEA parsers on sentences they fail to convert
+NMEA_PARSE_ERRORS = (ValueError, KeyError, TypeError)
+
+
+def _utcnow() -> pd.Timestamp:
+    return pd.Timestamp(datetime.now(timezone.utc).replace(tzinfo=None))
+
+
+class NMEAIngest:
+    """Parse NMEA sentences received on a socket in micro-batches.
+
+    Received lines are buffered with their receive time and parsed with
+    `nmea.nmea_0183_text` once the batch reaches `max_lines`, once the first
+    buffered line is older than `max_interval` seconds or once a line is
+    received in a new time partition. Each batch is saved to
+    `{output_dir}/{file_prefix}_{partition}_{first receive time}_{first row}.nc`
+    (or `.parquet`), rows are numbered from the start of the service.
+
+    Lines failing to be parsed are saved to a `.rejected` text file next to
+    their batch. A batch which can't be written is kept and saved again once
+    `max_interval` seconds have passed, the lines received meanwhile beyond
+    `max_lines` or in a new time partition are dropped.
+    """
+
+    def __init__(
+        self,
+        output_dir: str,
+        protocol: str = "udp",
+        host: str = "0.0.0.0",
+        port: int = 10110,
+        output_format: str = "netcdf",
+        max_lines: int = 10000,
+        max_interval: float = 60,
+        partition: str = "1h",
+        file_prefix: str = "nmea",
+        engine: str = "vectorized",
+        encoding: str = "UTF-8",
+        nmea_delimiter: str = "$",
+    ):
+        """Initialize a NMEA ingest service.
+
+        Args:
+            output_dir (str): Directory where to save the parsed batches.
+            protocol (str, optional): Socket protocol, "udp" or "tcp".
+                Defaults to "udp".
+            host (str, optional): Address to listen to. Defaults to "0.0.0.0".
+            port (int, optional): Port to listen to. Defaults to 10110.
+            output_format (str, optional): "netcdf" or "parquet".
+                Defaults to "netcdf".
+            max_lines (int, optional): Maximum number of lines per batch.
+                Defaults to 10000.
+            max_interval (float, optional): Maximum number of seconds a line
+                is buffered. Defaults to 60.
+            partition (str, optional): Time partition of the output files,
+                compatible with pandas.Timestamp.floor. Defaults to "1h".
+            file_prefix (str, optional): Output files prefix. Defaults to "nmea".
+            engine (str, optional): NMEA parser engine. Defaults to "vectorized".
+            encoding (str, optional): Received data encoding. Defaults to "UTF-8".
+            nmea_delimiter (str, optional): NMEA string delimiter.
+                Defaults to "$".
+        """
+        if protocol not in INGEST_PROTOCOLS:
+            raise ValueError(
+                f"Unknown protocol {protocol}, should be one of {INGEST_PROTOCOLS}"
+            )
+        if output_format not in INGEST_OUTPUT_FORMATS:
+            raise ValueError(
+                f"Unknown output format {output_format}, "
+                f"should be one of {list(INGEST_OUTPUT_FORMATS)}"
+            )
+        if engine not in nmea.NMEA_0183_ENGINES:
+            raise ValueError(
+                f"Unknown engine {engine}, should be one of {nmea.NMEA_0183_ENGINES}"
+            )
+        self.output_dir = Path(output_dir)
+        self.protocol = protocol
+        self.host = host
+        self.port = port
+        self.output_format = output_format
+        self.max_lines = max_lines
+        self.max_interval = pd.Timedelta(seconds=max_interval)
+        self.partition = partition
+        self.file_prefix = file_prefix
+        self.engine = engine
+        self.encoding = encoding
+        self.nmea_delimiter = nmea_delimiter
+
+        self.row = 0
+        self.lines = []
+        self.receive_times = []
+        self.partition_start = None
+        self.retry_time = None
+        self.outputs = []
+        self.address = None
+        self._selector = None
+        self._buffers = {}
+        self._running = False
+
+    def add_lines(self, lines: list, receive_time: pd.Timestamp = None) -> list:
+        """Add received lines to the present batch.
+
+        Args:
+            lines (list): Received lines.
+            receive_time (pd.Timestamp, optional): UTC receive time.
+                Defaults to now.
+
+        Returns:
+            list: Files saved while adding the lines.
+        """
+        receive_time = receive_time or _utcnow()
+        partition_start = receive_time.floor(self.partition)
+        outputs = []
+        if self.lines and partition_start != self.partition_start:
+            outputs.append(self._try_flush(receive_time))
+        if not self.lines:
+            self.partition_start = partition_start
+        dropped = 0
+        for line in lines:
+            if self.lines and (
+                len(self.lines) >= self.max_lines
+                or partition_start != self.partition_start
+            ):
+                # The present batch failed to be saved
+                dropped += 1
+                continue
+            self.lines.append(line)
+            self.receive_times.append(receive_time)
+            if len(self.lines) >= self.max_lines:
+                outputs.append(self._try_flush(receive_time))
+                if not self.lines:
+                    self.partition_start = partition_start
+        if dropped:
+            logger.error(
+                "Drop {} NMEA lines received while the present batch can't be saved",
+                dropped,
+            )
+        return [output for output in outputs if output]
+
+    def flush_expired(self, now: pd.Timestamp = None) -> Path:
+        """Flush the present batch if its first line is older than max_interval."""
+        now = now or _utcnow()
+        if self.lines and now - self.receive_times[0] >= self.max_interval:
+            return self._try_flush(now)
+
+    def _try_flush(self, now: pd.Timestamp) -> Path:
+        """Flush the present batch, keep it for a later retry if it fails."""
+        if self.retry_time and now < self.retry_time:
+            return
+        try:
+            output = self.flush()
+        except OSError as error:
+            self.retry_time = now + self.max_interval
+            logger.error(
+                "Failed to save {} NMEA lines, retry at {}: {}",
+                len(self.lines),
+                self.retry_time,
+                error,
+            )
+            return
+        self.retry_time = None
+        return output
+
+    def flush(self) -> Path:
+        """Parse the buffered lines and save them.
+
+        The lines failing to be parsed are saved to a `.rejected` text file.
+        The buffered lines are only cleared once saved.
+
+        Returns:
+            Path: Saved file or None if no line was parsed.
+        """
+        if not self.lines:
+            return
+        lines, receive_times = (
+            self.lines,
+            np.array(self.receive_times, dtype="datetime64[ns]"),
+        )
+        first_row = self.row
+
+        try:
+            ds = self._parse(lines, first_row)
+        except NMEA_PARSE_ERRORS as error:
+            logger.error("Failed to parse NMEA lines: {}", error)
+            rejected = set(self._find_rejected_lines(lines, first_row))
+            # Blank the rejected lines to preserve the rows numbering
+            lines = [
+                "\n" if index in rejected else line for index, line in enumerate(lines)
+            ]
+            try:
+                ds = self._parse(lines, first_row)
+            except NMEA_PARSE_ERRORS:
+                rejected, ds = set(range(len(lines))), None
+            self._save_rejected(
+                [self.lines[index] for index in sorted(rejected)],
+                receive_times,
+                first_row,
+            )
+        if ds is None or not ds.sizes.get("index"):
+            logger.warning("No NMEA sentence parsed from {} lines", len(lines))
+            self._clear(len(lines))
+            return
+        ds["receive_time"] = (
+            "index",
+            receive_times[ds["row"].values.astype(int) - first_row],
+        )
+        ds["receive_time"].attrs["long_name"] = "Receive Time"
+
+        output = self._get_output_path(
+            receive_times, first_row, INGEST_OUTPUT_FORMATS[self.output_format]
+        )
+        logger.info("Save {} NMEA sentences to {}", ds.sizes["index"], output)
+        if self.output_format == "parquet":
+            ds.to_dataframe().to_parquet(output)
+        else:
+            ds.to_netcdf(output)
+        self._clear(len(lines))
+        self.outputs.append(output)
+        return output
+
+    def _clear(self, n_lines: int):
+        self.lines, self.receive_times = [], []
+        self.row += n_lines
+
+    def _parse(self, lines: list, first_row: int):
+        return nmea.nmea_0183_text(
+            "".join(lines),
+            nmea_delimiter=self.nmea_delimiter,
+            engine=self.engine,
+            first_row=first_row,
+        )
+
+    def _find_rejected_lines(self, lines: list, first_row: int) -> list:
+        """Find by bisection the index of the lines failing to be parsed."""
+        if len(lines) == 1:
+            return [0]
+        rejected = []
+        middle = len(lines) // 2
+        for start, chunk in ((0, lines[:middle]), (middle, lines[middle:])):
+            try:
+                self._parse(chunk, first_row + start)
+            except NMEA_PARSE_ERRORS:
+                rejected += [
+                    start + index
+                    for index in self._find_rejected_lines(chunk, first_row + start)
+                ]
+        return rejected
+
+    def _save_rejected(self, lines: list, receive_times: np.ndarray, first_row: int):
+        output = self._get_output_path(receive_times, first_row, "rejected")
+        logger.warning("Save {} rejected NMEA lines to {}", len(lines), output)
+        output.write_text("".join(lines), encoding=self.encoding)
+
+    def _get_output_path(
+        self, receive_times: np.ndarray, first_row: int, suffix: str
+    ) -> Path:
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        return self.output_dir / (
+            f"{self.file_prefix}_{self.partition_start:%Y%m%dT%H%M%SZ}_"
+            f"{pd.Timestamp(receive_times[0]):%Y%m%dT%H%M%S}_{first_row:09d}."
+            f"{suffix}"
+        )
+
+    def bind(self) -> tuple:
+        """Open the listening socket.
+
+        Returns:
+            tuple: Address the socket is bound to.
+        """
+        self._selector = selectors.DefaultSelector()
+        sock = socket.socket(
+            socket.AF_INET,
+            socket.SOCK_DGRAM if self.protocol == "udp" else socket.SOCK_STREAM,
+        )
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((self.host, self.port))
+        if self.protocol == "tcp":
+            sock.listen()
+        sock.setblocking(False)
+        self._selector.register(sock, selectors.EVENT_READ, "listen")
+        self.address = sock.getsockname()
+        logger.info("Listen to NMEA {} on {}:{}", self.protocol, *self.address)
+        return self.address
+
+    def _receive(self, sock, kind):
+        if kind == "listen" and self.protocol == "tcp":
+            try:
+                connection, address = sock.accept()
+            except OSError as error:
+                logger.warning("Failed to accept connection: {}", error)
+                return
+            connection.setblocking(False)
+            self._selector.register(connection, selectors.EVENT_READ, "client")
+            self._buffers[connection] = b""
+            logger.info("New connection from {}:{}", *address)
+            return
+        elif kind == "listen":
+            try:
+                data, _ = sock.recvfrom(65535)
+            except OSError as error:
+                logger.warning("Failed to receive datagram: {}", error)
+                return
+            # Each datagram contains complete sentences
+            lines = data.splitlines()
+        else:
+            try:
+                data = sock.recv(65535)
+            except OSError as error:
+                logger.warning("Close connection after error: {}", error)
+                data = b""
+            if not data:
+                self._close(sock)
+                return
+            *lines, self._buffers[sock] = (self._buffers[sock] + data).split(b"\n")
+        self.add_lines(
+            [
+                line.rstrip(b"\r").decode(self.encoding, errors="replace") + "\n"
+                for line in lines
+                if line.strip()
+            ]
+        )
+
+    def _close(self, sock):
+        self._selector.unregister(sock)
+        remaining = self._buffers.pop(sock, b"")
+        if remaining.strip():
+            self.add_lines([remaining.decode(self.encoding, errors="replace") + "\n"])
+        sock.close()
+
+    def serve(self, duration: float = None):
+        """Receive and parse NMEA sentences until stopped.
+
+        The data already received and the buffered lines are saved when the
+        service stops.
+
+        Args:
+            duration (float, optional): Seconds to run the service.
+                Defaults to run until `stop` is called or interrupted.
+        """
+        if self._selector is None:
+            self.bind()
+        end = time.monotonic() + duration if duration else None
+        self._running = True
+        try:
+            while self._running and (end is None or time.monotonic() < end):
+                for key, _ in self._selector.select(timeout=0.1):
+                    self._receive(key.fileobj, key.data)
+                self.flush_expired()
+        except KeyboardInterrupt:
+            logger.info("Stop NMEA ingest")
+        finally:
+            # Read the data already received before closing the sockets
+            while events := self._selector.select(timeout=0):
+                for key, _ in events:
+                    self._receive(key.fileobj, key.data)
+            for key in list(self._selector.get_map().values()):
+                if key.data == "client":
+                    self._close(key.fileobj)
+                else:
+                    self._selector.unregister(key.fileobj)
+                    key.fileobj.close()
+            self._selector.close()
+            self._selector = None
+            self.retry_time = None
+            self._try_flush(_utcnow())
+
+    def stop(self):
+        """Stop the service after the present iteration."""
+        self._running = False
+
+
+@click.command(name="ingest", context_settings={"auto_envvar_prefix": "ODPY_INGEST"})
+@click.option(
+    "--output-dir",
+    "-o",
+    type=click.Path(file_okay=False),
+    required=True,
+    help="Directory where to save the parsed batches",
+)
+@click.option(
+    "--protocol",
+    type=click.Choice(INGEST_PROTOCOLS),
+    default="udp",
+    show_default=True,
+    help="Socket protocol",
+)
+@click.option(
+    "--host", default="0.0.0.0", show_default=True, help="Address to listen to"
+)
+@click.option(
+    "--port", type=int, default=10110, show_default=True, help="Port to listen to"
+)
+@click.option(
+    "--output-format",
+    type=click.Choice(list(INGEST_OUTPUT_FORMATS)),
+    default="netcdf",
+    show_default=True,
+    help="Output files format (parquet requires pyarrow)",
+)
+@click.option(
+    "--max-lines",
+    type=int,
+    default=10000,
+    show_default=True,
+    help="Maximum number of lines per file",
+)
+@click.option(
+    "--max-interval",
+    type=float,
+    default=60,
+    show_default=True,
+    help="Maximum number of seconds a line is buffered before being saved",
+)
+@click.option(
+    "--partition",
+    default="1h",
+    show_default=True,
+    help="Time partition of the output files (pandas frequency)",
+)
+@click.option(
+    "--file-prefix", default="nmea", show_default=True, help="Output files prefix"
+)
+@click.option(
+    "--engine",
+    type=click.Choice(nmea.NMEA_0183_ENGINES),
+    default="vectorized",
+    show_default=True,
+    help="NMEA parser engine",
+)
+@click.option("--encoding", default="UTF-8", show_default=True, help="Data encoding")
+@click.option(
+    "--nmea-delimiter", default="$", show_default=True, help="NMEA string delimiter"
+)
+def ingest_cli(**kwargs):
+    """Receive NMEA sentences over UDP or TCP and save them in batches."""
+    NMEAIngest(**kwargs).serve()
@@ -8,6 +8,7 @@ the [Amundsen Science](https://amundsenscience.com/) and
 
 import re
 from collections import Counter
+from io import StringIO
 from pathlib import Path
 
 import pandas as pd
@@ -15,7 +16,11 @@ import xarray as xr
 from gsw import z_from_p
 from loguru import logger
 
-from ocean_data_parser.parsers.utils import apply_function, standardize_dataset
+from ocean_data_parser.parsers.utils import (
+    apply_dtype_policy,
+    apply_function,
+    standardize_dataset,
+)
 from ocean_data_parser.vocabularies.load import amundsen_vocabulary
 
 string_attributes = ["Cruise_Number", "Cruise_Name", "Station"]
@@ -127,9 +132,9 @@ def _convert_timestamp(df: pd.DataFrame) -> pd.DataFrame:
     Fix the issue with the 60 seconds in the Hour column
     which is not supported by pandas.
     """
-    is_60 = df["Hour"].str.contains(":60$")
-    df.loc[is_60, "Hour"] = df.loc[is_60, "Hour"].str.replace(":60$", ":00", regex=True)
-    df["time"] = pd.to_datetime(df["Date"] + "T" + df["Hour"], utc=True)
+    is_60 = df["Hour"].str.endswith(":60")
+    hour = df["Hour"].where(~is_60, df["Hour"].str[:-2] + "00")
+    df["time"] = pd.to_datetime(df["Date"] + "T" + hour, utc=True)
     df.loc[is_60, "time"] += pd.Timedelta(seconds=60)
     return df
 
@@ -178,6 +183,7 @@ def int_format(
     generate_depth: bool = True,
     separator: str = r"\s+",
     encoding_error="strict",
+    dtype_policy: str = "default",
 ) -> xr.Dataset:
     r"""Parse Amundsen INT format.
 
@@ -188,6 +194,8 @@ def int_format(
         generate_depth (bool, optional): Generate depth variable. Defaults to True.
         separator (str, optional): Separator for the data. Defaults to r"\s+".
         encoding_error (str, optional): Encoding error handling. Defaults to "strict".
+        dtype_policy (str, optional): dtype policy applied to the data
+            (see `utils.apply_dtype_policy`). Defaults to "default".
 
     Returns:
         xr.Dataset
@@ -202,7 +210,7 @@ def int_format(
     logger.debug("Read {}", path)
     with open(path, encoding=encoding, errors=encoding_error) as file:
         # Parse header
-        for header_line_idx, line in enumerate(file):
+        for line in file:
             line = line.rstrip()
             if re.match(r"^%\s*$", line) or not line:
                 continue
@@ -228,36 +236,38 @@ def int_format(
         if metadata == default_global_attributes:
             logger.warning("No metadata was captured in the header of the INT file.")
 
-    # Parse data
-    if separator == r"\s+":
-        # Fix problematic variable names
-        for name, fixed_name in REPLACE_VARIABLES.items():
-            line = line.replace(name, fixed_name)
-        names = re.split(r"\s+", line.strip())
-    elif separator == ",":
-        names = line.strip().split(",")
-
-    if len(set(names)) != len(names):
-        duplicated = {name: n for name, n in Counter(names).items() if n > 1}
-        logger.warning("Duplicated variable names detected: {}", duplicated)
-        # Add index to duplicate names
-        new_names = []
-        for name in names:
-            if name not in new_names:
-                new_names.append(name)
-            else:
-                new_names.append(f"{name}_{new_names.count(name)}")
-        names = new_names
+        # Parse data
+        if separator == r"\s+":
+            # Fix problematic variable names
+            for name, fixed_name in REPLACE_VARIABLES.items():
+                line = line.replace(name, fixed_name)
+            names = re.split(r"\s+", line.strip())
+        elif separator == ",":
+            names = line.strip().split(",")
+
+        if len(set(names)) != len(names):
+            duplicated = {name: n for name, n in Counter(names).items() if n > 1}
+            logger.warning("Duplicated variable names detected: {}", duplicated)
+            # Add index to duplicate names
+            new_names = []
+            for name in names:
+                if name not in new_names:
+                    new_names.append(name)
+                else:
+                    new_names.append(f"{name}_{new_names.count(name)}")
+            names = new_names
+
+        # Read the data from the present position of the file
+        data = file
+        if separator == r"\s+":
+            # Drop the dashed line below the variable names
+            next_line = file.readline()
+            if not re.fullmatch(r"[\s-]*", next_line):
+                data = StringIO(next_line + file.read())
+        df = apply_dtype_policy(
+            pd.read_csv(data, header=None, sep=separator, names=names), dtype_policy
+        )
 
-    df = pd.read_csv(
-        path,
-        encoding=encoding,
-        header=header_line_idx,
-        skiprows=[header_line_idx] if separator == r"\s+" else [],
-        sep=separator,
-        names=names,
-        encoding_errors=encoding_error,
-    )
     if len(df.columns) != len(names):
         raise ValueError(
             f"Number of columns ({len(df.columns)}) doesn't match the number of variables ({len(names)})"
@@ -16,6 +16,7 @@ import logging
 import re
 import struct
 from datetime import datetime, timedelta
+from functools import lru_cache
 from io import StringIO
 
 import fortranformat as ff
@@ -32,7 +33,6 @@ logger = logging.getLogger(__name__)
 logger = logging.LoggerAdapter(logger, {"file": None})
 
 VERSION = __version__
-DFO_IOS_SHELL_VOCABULARY = dfo_ios_vocabulary()
 vocabulary_attributes = [
     "ios_name",
     "long_name",
@@ -83,6 +83,12 @@ global_attributes = {
 }
 
 
+@lru_cache(maxsize=1)
+def _get_ios_vocabulary() -> pd.DataFrame:
+    """Load the DFO IOS vocabulary on first use."""
+    return dfo_ios_vocabulary()
+
+
 def get_dtype_from_ios_type(ios_type):
     if not ios_type or ios_type.strip() == "":
         return
@@ -721,10 +727,7 @@ class IosFile:
             datetime = pd.to_datetime(
                 [date.replace(" ", "") + " " + time for date, time in zip(dates, times)]
             )
-            self.obs_time = datetime
-            self.obs_time = [
-                timezone("UTC").localize(i + timedelta(hours=0)) for i in self.obs_time
-            ]
+            self.obs_time = datetime.tz_localize("UTC")
         elif "date" in chn_list:
             if isinstance(self.data[0, chn_list.index("date")], bytes):
                 dates = [
@@ -734,10 +737,7 @@ class IosFile:
             else:
                 dates = [i.strip() for i in self.data[:, chn_list.index("date")]]
             datetime = pd.to_datetime(dates)
-            self.obs_time = datetime
-            self.obs_time = [
-                timezone("UTC").localize(i + timedelta(hours=0)) for i in self.obs_time
-            ]
+            self.obs_time = datetime.tz_localize("UTC")
         else:
             logger.error("Unable to find date/time columns in variables")
             return 0
@@ -746,10 +746,10 @@ class IosFile:
 
     def get_obs_time_from_time_increment(self):
         time_increment = self.get_dt()
-        self.obs_time = [
-            self.start_dateobj + timedelta(seconds=time_increment * (i))
-            for i in range(int(self.file["NUMBER OF RECORDS"]))
-        ]
+        n_records = int(self.file["NUMBER OF RECORDS"])
+        self.obs_time = pd.Timestamp(self.start_dateobj) + pd.to_timedelta(
+            np.arange(n_records) * time_increment, unit="s"
+        ).round("us")
         # Test result
         self.compare_obs_time_to_star_date()
 
@@ -763,7 +763,7 @@ class IosFile:
 
     def add_ios_vocabulary(self):
         def match_term(reference, value):
-            if reference in (None, np.nan):
+            if pd.isna(reference):
                 return False
             if (
                 ("None" in reference.split("|") and value in (None, "n/a", ""))
@@ -775,7 +775,8 @@ class IosFile:
 
         # Filter vocabulary to handle only file extension and global terms
         vocab = (
-            DFO_IOS_SHELL_VOCABULARY.query(
+            _get_ios_vocabulary()
+            .query(
                 f"ios_file_extension == '{self.get_file_extension().lower()}' or "
                 "ios_file_extension.isna()"
             )
@@ -1175,9 +1176,13 @@ class IosFile:
             ds = ds_sub
 
         # coordinates
-        if self.obs_time and replace_date_time_variables:
+        if (
+            self.obs_time is not None
+            and len(self.obs_time)
+            and replace_date_time_variables
+        ):
             ds = ds.drop_vars([var for var in ds if var in ["Date", "Time"]])
-            ds["time"] = (ds.dims, pd.Series(self.obs_time))
+            ds["time"] = (ds.dims, self.obs_time.tz_convert("UTC").tz_localize(None))
             # ds["time"].encoding["units"] = "seconds since 1970-01-01T00:00:00Z"
         elif self.start_dateobj:
             ds["time"] = self.start_dateobj
@@ -11,21 +11,62 @@ from pathlib import Path
 from typing import Union
 
 import gsw
-import numpy as np
 import pandas as pd
 import xarray as xr
 from loguru import logger
 
 from ocean_data_parser.parsers import seabird
-from ocean_data_parser.parsers.utils import standardize_dataset
+from ocean_data_parser.parsers.utils import read_whitespace_table, standardize_dataset
 from ocean_data_parser.vocabularies.load import (
     dfo_nafc_p_file_vocabulary,
     dfo_platforms,
 )
 
 MODULE_PATH = Path(__file__).parent
-p_file_vocabulary = dfo_nafc_p_file_vocabulary()
-p_file_shipcode = dfo_platforms().drop(columns=["accepted_platform_name"])
+
+
+@lru_cache(maxsize=1)
+def _get_p_file_vocabulary() -> pd.DataFrame:
+    """Load the NAFC p file vocabulary on first use."""
+    return dfo_nafc_p_file_vocabulary()
+
+
+@lru_cache(maxsize=1)
+def _get_p_file_vocabulary_index() -> tuple:
+    """Index the p file vocabulary by legacy p code.
+
+    The legacy p codes are split into exact matches and regex patterns.
+
+    Returns:
+        tuple: vocabulary records, dictionary of the records rows by lower case
+            legacy p code and list of (row, compiled pattern) for the regex
+            legacy p codes.
+    """
+    vocabulary = _get_p_file_vocabulary()
+    exact_codes, patterns = {}, []
+    for row, code in enumerate(vocabulary["legacy_p_code"]):
+        if re.escape(code) == code:
+            exact_codes.setdefault(code.lower(), []).append(row)
+        else:
+            patterns.append((row, re.compile(code, re.IGNORECASE)))
+    return vocabulary.to_dict(orient="records"), exact_codes, patterns
+
+
+@lru_cache(maxsize=1)
+def _get_platforms_index() -> tuple:
+    """Index the platforms by NAFC platform code and name.
+
+    Returns:
+        tuple: dictionaries of the first platform matching each NAFC
+            platform code and name.
+    """
+    platforms = dfo_platforms().drop(columns=["accepted_platform_name"])
+    by_code, by_name = {}, {}
+    for platform in platforms.to_dict(orient="records"):
+        by_code.setdefault(platform["dfo_nafc_platform_code"], platform)
+        by_name.setdefault(platform["dfo_nafc_platform_name"], platform)
+    return by_code, by_name
+
 
 global_attributes = {
     "Conventions": "CF-1.6,CF-1.7,CF-1.8,ACDD-1.3,IOOS 1.2",
@@ -55,6 +96,8 @@ METQA_DTYPES = {
     "ice_bergs": pd.Int64Dtype(),
     "ice_sit_and_trend": pd.Int64Dtype(),
 }
+# Maximum number of metqa tables indexes and directories listings kept in memory
+METQA_CACHE_SIZE = 32
 
 
 def _traceback_error_line():
@@ -290,23 +333,17 @@ def _get_platform_by_nafc_platform_code(platform_code: Union[int, str]) -> dict:
         if isinstance(platform_code, int)
         else platform_code.upper()
     )
-    if p_file_shipcode["dfo_nafc_platform_code"].str.match(platform_code).any():
-        return (
-            p_file_shipcode.query(f"dfo_nafc_platform_code == '{platform_code}'")
-            .iloc[0]
-            .to_dict()
-        )
+    platforms_by_code, _ = _get_platforms_index()
+    if platform_code in platforms_by_code:
+        return platforms_by_code[platform_code].copy()
     logger.warning("Unknown dfo_nafc_platform_code={}", platform_code)
     return {}
 
 
 def _get_platform_by_nafc_platform_name(platform_name: str) -> dict:
-    if platform_name in p_file_shipcode["dfo_nafc_platform_name"].tolist():
-        return (
-            p_file_shipcode.query(f"dfo_nafc_platform_name == '{platform_name}'")
-            .iloc[0]
-            .to_dict()
-        )
+    _, platforms_by_name = _get_platforms_index()
+    if platform_name in platforms_by_name:
+        return platforms_by_name[platform_name].copy()
     logger.warning("Unknown dfo_nafc_platform_name={}", platform_name)
     return {}
 
@@ -340,26 +377,31 @@ def _pfile_history_to_cf(lines: list) -> str:
     return "".join([f"{timestamp} - {line}" for line in lines[1:]])
 
 
+@lru_cache
+def _match_pfile_variable_vocabulary(variable: str, instrument: str = None) -> tuple:
+    """Retrieve the vocabulary rows matching a variable and instrument."""
+    records, exact_codes, patterns = _get_p_file_vocabulary_index()
+    rows = exact_codes.get(variable.lower(), []) + [
+        row for row, pattern in patterns if pattern.fullmatch(variable)
+    ]
+    return tuple(
+        row
+        for row in sorted(rows)
+        if pd.isna(records[row]["accepted_instruments"])
+        or records[row]["accepted_instruments"] == (instrument or "")
+    )
+
+
 def _get_pfile_variable_vocabulary(variable: str, instrument: str = None) -> dict:
     """Retrieve variable vocabulary."""
     if variable == "xxx":
         return []
-    matched_legacy_p_code = p_file_vocabulary.apply(
-        lambda x: re.fullmatch(x["legacy_p_code"], variable, re.IGNORECASE), axis=1
-    ).notna()
-
-    if not any(matched_legacy_p_code):
-        logger.warning("No vocabulary is available for variable={}", variable)
-        return []
-
-    matching_vocabulary = p_file_vocabulary.loc[matched_legacy_p_code].query(
-        f"(accepted_instruments.isna() or "
-        f"accepted_instruments in '{instrument or ''}' )"
-    )
-    if matching_vocabulary.empty:
+    rows = _match_pfile_variable_vocabulary(variable, instrument)
+    if not rows:
         logger.warning("No vocabulary is available for variable={}", variable)
         return []
-    return matching_vocabulary.to_dict(orient="records")
+    records, _, _ = _get_p_file_vocabulary_index()
+    return [records[row].copy() for row in rows]
 
 
 def pfile(
@@ -368,6 +410,7 @@ def pfile(
     rename_variables: bool = True,
     generate_extra_variables: bool = True,
     encoding_errors: str = "strict",
+    engine: str = "pandas-c",
 ) -> xr.Dataset:
     """Parse DFO NAFC oceanography p-file format.
 
@@ -379,6 +422,8 @@ def pfile(
         generate_extra_variables (bool, optional): Generate extra
             BODC mapping variables. Defaults to True.
         encoding_errors (str, optional): Encoding errors handling.
+        engine (str, optional): Engine used to read the data
+            (see `utils.read_whitespace_table`). Defaults to "pandas-c".
 
     Raises:
         TypeError: File provided isn't a p file.
@@ -453,12 +498,13 @@ def pfile(
 
         # Read data section
         # TODO confirm that 5+12 character width is constant
-        ds = pd.read_csv(
+        ds = read_whitespace_table(
             file_handle,
-            sep=r"\s+",
-            engine="python",
             names=names,
             dtype={name: _get_dtype(name) for name in names},
+            engine=engine,
+            float_precision="round_trip",
+            encoding=encoding,
             encoding_errors=encoding_errors,
         ).to_xarray()
 
@@ -561,7 +607,7 @@ def pfile(
                         },
                     },
                 )
-                if apply_func not in (None, np.nan)
+                if not pd.isna(apply_func)
                 else var
             )
             ds.attrs["history"] += (
@@ -602,18 +648,50 @@ def _get_metqa_table(file) -> pd.DataFrame:
     return df
 
 
-def _add_metqa_info_to_pcvn(file: Path, match_metqa_file) -> Path:
+@lru_cache(maxsize=METQA_CACHE_SIZE)
+def _get_metqa_index(file) -> dict:
+    """Index NAFC metqa table weather data by station."""
+    df = _get_metqa_table(file)
+    if df is None:
+        return {}
+    index = {}
+    for _, row in df.iterrows():
+        index.setdefault(row["station"], row.dropna().to_dict())
+    return index
+
+
+def _list_metqa_files(directory: Path) -> dict:
+    """List the metqa tables of a directory by their pcnv file prefix.
+
+    The listing is cached until the directory modification time changes.
+    """
+    return _list_directory_metqa_files(directory, directory.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=METQA_CACHE_SIZE)
+def _list_directory_metqa_files(directory: Path, modified_time: int) -> dict:
+    metqa_files = {}
+    for file in directory.glob("*_metqa_*.csv"):
+        for match in re.finditer("_metqa_", file.name):
+            metqa_files.setdefault(file.name[: match.start()], []).append(file)
+    return metqa_files
+
+
+def _add_metqa_info_to_pcvn(file: Path, match_metqa_file, metqa_file=None) -> Path:
     """Find the matching metqa table to the pcnv file."""
     glob_expression = f"{file.stem.rsplit('_', 1)[0]}_metqa_*.csv"
-    metqa_file = list(file.parent.glob(glob_expression))
+    metqa_file = (
+        [Path(metqa_file)]
+        if metqa_file
+        else _list_metqa_files(file.parent).get(file.stem.rsplit("_", 1)[0], [])
+    )
     if metqa_file and len(metqa_file) == 1:
         logger.debug("Load weather data from metqa file={}", metqa_file[0])
-        df = _get_metqa_table(metqa_file[0])
-        metadata = df.query(f"station == '{file.stem}'")
-        if metadata.empty:
+        metadata = _get_metqa_index(metqa_file[0]).get(file.stem)
+        if metadata is None:
             logger.warning("No station={} in metqa file={}", file.stem, metqa_file)
             return {}
-        return metadata.iloc[0].dropna().to_dict()
+        return metadata.copy()
     elif metqa_file and len(metqa_file) > 1:
         logger.error(
             "Multiple metqa files found={} for path={},glob={}",
@@ -640,6 +718,7 @@ def pcnv(
     encoding: str = "UTF-8",
     encoding_errors: str = "strict",
     match_metqa_table: bool = False,
+    metqa_file: str = None,
 ) -> xr.Dataset:
     """DFO NAFC pcnv file format parser.
 
@@ -657,6 +736,10 @@ def pcnv(
         encoding_errors (str, optional): Encoding errors handling.
         match_metqa_table (bool, optional): Match metqa table to the file if
             available within same directory. Defaults to True.
+        metqa_file (str, optional): metqa table to use instead of searching
+            the file directory. Each table is loaded and indexed by station
+            once per process, a batch configuration can share it between
+            files through its `parser_kwargs`. Defaults to None.
 
     Returns:
         xr.Dataset
@@ -672,9 +755,11 @@ def pcnv(
             logger.error("No matching attribute found in {}", names)
 
     def get_vocabulary(**kwargs):
-        return p_file_vocabulary.query(
-            " and ".join(f"{key} == '{value}'" for key, value in kwargs.items())
-        ).to_dict(orient="records")
+        return (
+            _get_p_file_vocabulary()
+            .query(" and ".join(f"{key} == '{value}'" for key, value in kwargs.items()))
+            .to_dict(orient="records")
+        )
 
     path = Path(path)
     ds = seabird.cnv(
@@ -724,14 +809,13 @@ def pcnv(
             "vnet": ds.attrs.pop("vnet", None),
             "do2": ds.attrs.pop("do2", None),
             "bottles": _int(ds.attrs.pop("bottles", None)),
-            **_add_metqa_info_to_pcvn(path, match_metqa_table),
+            **_add_metqa_info_to_pcvn(path, match_metqa_table, metqa_file),
             **(global_attributes or {}),
         }
     )
 
     # Move coordinates to variables
     coords = ["time", "latitude", "longitude"]
-    p_file_vocabulary
     for coord in coords:
         if coord in ds.attrs:
             ds[coord] = ds.attrs[coord]
@@ -72,7 +72,11 @@ as_dfo_global_attributes = {
 
 
 def bio_odf(
-    path: str, global_attributes: dict = None, encoding="Windows-1252"
+    path: str,
+    global_attributes: dict = None,
+    encoding="Windows-1252",
+    engine: str = "pandas-c",
+    dtype_policy: str = "default",
 ) -> xarray.Dataset:
     """Bedford Institute of Ocean ODF format parser.
 
@@ -80,6 +84,8 @@ def bio_odf(
         path (str): Path to the odf file to parse
         global_attributes (dict): file specific global attributes
         encoding (str): Encoding format of the file (default: Windows-1252)
+        engine (str): Engine used to read the data (default: pandas-c)
+        dtype_policy (str): dtype policy applied to the data (default: default)
 
     Returns:
         dataset (xarray dataset): Parsed xarray dataset
@@ -89,11 +95,17 @@ def bio_odf(
         vocabularies=["BIO", "GF3"],
         global_attributes={**bio_global_attributes, **(global_attributes or {})},
         encoding=encoding,
+        engine=engine,
+        dtype_policy=dtype_policy,
     )
 
 
 def mli_odf(
-    path: str, global_attributes: dict = None, encoding="Windows-1252"
+    path: str,
+    global_attributes: dict = None,
+    encoding="Windows-1252",
+    engine: str = "pandas-c",
+    dtype_policy: str = "default",
 ) -> xarray.Dataset:
     """Maurice Lamontagne Institute ODF format parser.
 
@@ -101,6 +113,8 @@ def mli_odf(
         path (str): Path to the odf file to parse
         global_attributes (dict): file specific global attributes
         encoding (str): Encoding format of the file (default: Windows-1252)
+        engine (str): Engine used to read the data (default: pandas-c)
+        dtype_policy (str): dtype policy applied to the data (default: default)
 
     Returns:
         dataset (xarray dataset): Parsed xarray dataset
@@ -110,11 +124,17 @@ def mli_odf(
         vocabularies=["MLI", "GF3"],
         global_attributes={**mli_global_attributes, **(global_attributes or {})},
         encoding=encoding,
+        engine=engine,
+        dtype_policy=dtype_policy,
     )
 
 
 def as_qo_odf(
-    path: str, global_attributes: dict = None, encoding="UTF-8"
+    path: str,
+    global_attributes: dict = None,
+    encoding="UTF-8",
+    engine: str = "pandas-c",
+    dtype_policy: str = "default",
 ) -> xarray.Dataset:
     """AS QO ODF format parser.
 
@@ -122,6 +142,8 @@ def as_qo_odf(
         path (str): Path to the odf file to parse
         global_attributes (dict): file specific global attributes
         encoding (str): Encoding format of the file (default: UTF-8)
+        engine (str): Engine used to read the data (default: pandas-c)
+        dtype_policy (str): dtype policy applied to the data (default: default)
 
     Returns:
         dataset (xarray dataset): Parsed xarray dataset
@@ -132,6 +154,8 @@ def as_qo_odf(
         global_attributes={**as_dfo_global_attributes, **(global_attributes or {})},
         encoding=encoding,
         filename_convention=None,  # TODO there was maybe a convention for AS QO
+        engine=engine,
+        dtype_policy=dtype_policy,
     )
 
 
@@ -141,6 +165,8 @@ def odf(
     global_attributes: dict = None,
     encoding: str = "Windows-1252",
     filename_convention=FILE_NAME_CONVENTIONS,
+    engine: str = "pandas-c",
+    dtype_policy: str = "default",
 ) -> xarray.Dataset:
     """ODF format parser.
 
@@ -151,6 +177,8 @@ def odf(
         encoding (str): Encoding format of the file (default: Windows-1252)
         filename_convention (str): File name convention to extract attributes.
             Should be a regex expression.
+        engine (str): Engine used to read the data (default: pandas-c)
+        dtype_policy (str): dtype policy applied to the data (default: default)
 
     Returns:
         dataset (xarray dataset): Parsed xarray dataset
@@ -161,4 +189,6 @@ def odf(
         global_attributes={**odf_global_attributes, **(global_attributes or {})},
         encoding=encoding,
         filename_convention=filename_convention,
+        engine=engine,
+        dtype_policy=dtype_policy,
     )
@@ -3,6 +3,7 @@ import logging
 import re
 from datetime import datetime, timezone
 from difflib import get_close_matches
+from functools import lru_cache
 
 import pandas as pd
 
@@ -16,12 +17,6 @@ logger = logging.getLogger(__name__)
 
 stationless_programs = ("Maritime Region Ecosystem Survey",)
 
-# Transform platform name to a list of accepted platform names
-reference_platforms = dfo_platforms()
-reference_platforms["accepted_platform_name"] = reference_platforms[
-    "accepted_platform_name"
-].str.split("|")
-reference_platforms = reference_platforms.explode("accepted_platform_name")
 
 section_prefix = {
     "EVENT_HEADER": "event_",
@@ -36,10 +31,20 @@ global_odf_to_cf = {
 }
 
 
+@lru_cache(maxsize=1)
+def _get_reference_platforms() -> pd.DataFrame:
+    """Load the DFO platforms with one row per accepted platform name."""
+    reference_platforms = dfo_platforms()
+    # Transform platform name to a list of accepted platform names
+    reference_platforms["accepted_platform_name"] = reference_platforms[
+        "accepted_platform_name"
+    ].str.split("|")
+    return reference_platforms.explode("accepted_platform_name")
+
+
 def _generate_platform_attributes(platform: str) -> dict:
     """Review ODF CRUISE_HEADER:PLATFORM and match to closest."""
-    if reference_platforms is None:
-        return {}
+    reference_platforms = _get_reference_platforms()
     platform = re.sub(
         r"CCGS_*\s*|CGCB\s*|FRV\s*|NGCC\s*|^_|MV\s*", "", platform
     ).strip()
@@ -8,10 +8,12 @@ by the DFO offices BIO and MLI.
 import logging
 import re
 from datetime import datetime, timezone
+from functools import lru_cache
 
 import gsw_xarray as gsw
 import pandas as pd
 
+from ocean_data_parser.parsers.utils import apply_dtype_policy, read_whitespace_table
 from ocean_data_parser.vocabularies.load import dfo_odf_vocabulary
 
 no_file_logger = logging.getLogger(__name__)
@@ -28,7 +30,6 @@ odf_dtypes = {
     "QQQQ": "int32",
 }
 
-odf_vocabulary = dfo_odf_vocabulary()
 vocabulary_attribute_list = [
     "long_name",
     "units",
@@ -112,7 +113,7 @@ def history_input(comment, date=datetime.now(timezone.utc)):
     return f"{date.strftime('%Y-%m-%dT%H:%M:%SZ')} {comment}\n"
 
 
-def read(filename, encoding="Windows-1252"):
+def read(filename, encoding="Windows-1252", engine="pandas-c", dtype_policy="default"):
     """Read ODF file format.
 
     `odf_source.parser.read` parse the odf format used by some DFO organisation to python list of
@@ -128,7 +129,7 @@ def read(filename, encoding="Windows-1252"):
             d. Each section items are grouped as a dictionary
             e. dictionary items are converted to datetime (deactivated), string, integer or
                 float format.
-        2. Read the data  following the header with Pandas.read_csv() method
+        2. Read the data  following the header with `utils.read_whitespace_table`
             a. Use defined separator  to distinguish columns (default multiple white spaces).
             b. Convert each column of the pandas data frame to the matching format specified in
             the TYPE attribute of the ODF associated PARAMETER_HEADER
@@ -142,6 +143,10 @@ def read(filename, encoding="Windows-1252"):
     Args:
         filename (str): ODF file path
         encoding (str): ODF encoding format
+        engine (str): engine used to read the data table
+            (see `utils.read_whitespace_table`)
+        dtype_policy (str): dtype policy applied to the data, using the
+            PRINT_DECIMAL_PLACES resolution (see `utils.apply_dtype_policy`)
 
     Returns:
         tuple: metadata and dataset
@@ -264,18 +269,22 @@ def read(filename, encoding="Windows-1252"):
             if var_name.startswith("SYTM") or att["TYPE"] == "SYTM":
                 time_columns += [var_name]
 
-        # Read Data with Pandas
-        df = pd.read_csv(
+        # Read Data
+        df = read_whitespace_table(
             f,
-            delimiter=r"\s+",
+            names=list(variable_attributes.keys()),
+            dtype=None,
             quotechar="'",
-            header=None,
-            names=variable_attributes.keys(),
             na_values={
                 key: att.pop("null_value") for key, att in variable_attributes.items()
             },
-            converters={var: _convert_odf_time for var in time_columns},
+            engine=engine,
             encoding=encoding,
+            **(
+                {"converters": {var: _convert_odf_time for var in time_columns}}
+                if time_columns
+                else {}
+            ),
         )
 
     # Review N variables
@@ -286,10 +295,19 @@ def read(filename, encoding="Windows-1252"):
     dataset = df.to_xarray()
     for variable, attrs in variable_attributes.items():
         dataset[variable].attrs = attrs
+    dataset = apply_dtype_policy(dataset, dtype_policy)
 
     return metadata, dataset
 
 
+@lru_cache(maxsize=1)
+def _get_odf_vocabulary() -> pd.DataFrame:
+    """Load the DFO ODF vocabulary on first use."""
+    odf_vocabulary = dfo_odf_vocabulary()
+    odf_vocabulary["apply_function"] = odf_vocabulary["apply_function"].fillna("x")
+    return odf_vocabulary
+
+
 def add_vocabulary_attributes(
     ds,
     vocabularies=None,
@@ -348,6 +366,7 @@ def add_vocabulary_attributes(
         - long_name
         - global instrument_type instrument_model.
         """
+        odf_vocabulary = _get_odf_vocabulary()
         # Among these matching terms find matching ones
         match_vocabulary = odf_vocabulary["Vocabulary"].isin(vocabularies)
         match_code = (
@@ -399,7 +418,6 @@ def add_vocabulary_attributes(
     # vocabulary["instrument"] = vocabulary["accepted_instrument"].str.split("|").str[0]
 
     # Find matching vocabulary
-    odf_vocabulary["apply_function"] = odf_vocabulary["apply_function"].fillna("x")
     new_variables_mapping = {}
     new_variables = {}
     new_variables_attributes = {}
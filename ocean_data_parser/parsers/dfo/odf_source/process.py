@@ -48,6 +48,8 @@ def parse_odf(
     generate_new_vocabulary_variables: bool = True,
     encoding: str = "Windows-1252",
     filename_convention=FILE_NAME_CONVENTIONS,
+    engine: str = "pandas-c",
+    dtype_policy: str = "default",
 ) -> xr.Dataset:
     """Convert an ODF file to an xarray object.
 
@@ -64,12 +66,18 @@ def parse_odf(
         encoding (str, optional): Encoding format of the file. Defaults to "Windows-1252".
         filename_convention (str, optional): File name convention to extract attributes.
             Should be a regex expression.
+        engine (str, optional): Engine used to read the data
+            (see `utils.read_whitespace_table`). Defaults to "pandas-c".
+        dtype_policy (str, optional): dtype policy applied to the data
+            (see `utils.apply_dtype_policy`). Defaults to "default".
 
     Returns:
         xr.Dataset: Parsed dataset
     """
     # Parse the ODF file with the CIOOS python parsing tool
-    metadata, dataset = odf_parser.read(odf_path, encoding=encoding)
+    metadata, dataset = odf_parser.read(
+        odf_path, encoding=encoding, engine=engine, dtype_policy=dtype_policy
+    )
 
     # Review ODF data type compatible with ODF parser
     if metadata["EVENT_HEADER"]["DATA_TYPE"] not in ODF_COMPATIBLE_DATA_TYPES:
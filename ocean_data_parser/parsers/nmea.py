@@ -5,16 +5,31 @@ and navigation systems to exchange data between different electronic devices.
 It stands for "National Marine Electronics Association 0183.".
 """
 
+import io
 import logging
+import os
+import re
 from datetime import datetime
+from typing import TextIO
 
 import numpy as np
 import pandas as pd
 import pynmea2
 import xarray
+from pynmea2.nmea import TalkerSentence
 
 logger = logging.getLogger(__name__)
 
+NMEA_0183_ENGINES = ("pynmea2", "vectorized")
+
+# Talker sentences handled by the vectorized engine, proprietary (P...) and
+# query (....Q,...) sentences are left to pynmea2 (see pynmea2.NMEASentence.sentence_re)
+nmea_talker_sentence = re.compile(
+    r"^(?!P)(?!\w{4}Q,\w{3})(?P<talker>\w{2})(?P<sentence_type>\w{3}),"
+    r"(?P<data>[^*]*)(?:[*](?P<checksum>[A-F0-9]{2}))?\s*[\r\n]*$",
+    re.IGNORECASE,
+)
+
 
 NMEA_0183_DTYPES = {
     "row": float,
@@ -144,6 +159,12 @@ NMEA_0183_DTYPES = {
     "nav_status": str,
 }
 
+MWV_WIND_SPEED_UNITS = {
+    "N": ("knots", "knots"),
+    "M": ("m/s", "m_s"),
+    "K": ("km/h", "km_h"),
+}
+
 
 def _generate_extra_terms(nmea):
     """Generate extra terms from NMEA information.
@@ -185,15 +206,9 @@ def _generate_extra_terms(nmea):
         )
 
     if nmea["sentence_type"] == "MWV" and nmea["reference"] == "R":
-        if nmea["wind_speed_units"] == "N":
-            units = ("knots", "knots")
-        elif nmea["wind_speed_units"] == "M":
-            units = ("m/s", "m_s")
-        elif nmea["wind_speed_units"] == "K":
-            units = ("km/h", "km_h")
-        else:
+        units = MWV_WIND_SPEED_UNITS.get(nmea["wind_speed_units"])
+        if units is None:
             logger.error("unknown units for MWV: %s", nmea["wind_speed_units"])
-            units = None
         if units:
             extra.update(
                 {
@@ -210,76 +225,533 @@ def _generate_extra_terms(nmea):
     return extra
 
 
+def _rename_variable(name):
+    """Rename variable based on variable mapping dictionary or return name."""
+    if name == ("Heave", "heading"):
+        # fix in https://github.com/Knio/pynmea2/pull/129 but not included in pipy yet
+        return ("Heave", "heave")
+    return name
+
+
+def _parse_nmea_line(row: int, line: str, nmea_delimiter: str, long_names: dict):
+    """Parse a NMEA line with pynmea2.
+
+    Args:
+        row (int): line number
+        line (str): line to parse
+        nmea_delimiter (str): NMEA string delimiter
+        long_names (dict): long names of the parsed fields, updated in place
+
+    Returns:
+        dict: parsed line or None if the line can't be parsed
+    """
+    if not line:
+        return
+    elif nmea_delimiter and nmea_delimiter not in line:
+        logger.warning(
+            "Missing NMEA deliminter %s - ignore line %s",
+            nmea_delimiter,
+            line[:-1],
+        )
+        return
+    try:
+        prefix, nmea_string = line.split(nmea_delimiter, 1)
+        parsed_line = pynmea2.parse(nmea_delimiter + nmea_string)
+
+        # Retrieve long_names from nmea fields
+        long_names.update({field[1]: field[0] for field in parsed_line.fields})
+        parsed_items = parsed_line.__dict__
+        parsed_dict = {
+            "row": row,
+            "prefix": prefix,
+            "talker": parsed_items.get("talker"),
+            "sentence_type": parsed_items.get("sentence_type"),
+            "subtype": parsed_items.get("subtype"),
+            "manufacturer": parsed_items.get("manufacturer"),
+            **{
+                _rename_variable(field[1]): value
+                for field, value in zip(parsed_line.fields, parsed_line.data)
+            },
+        }
+        # Get extra fields
+        extra = _generate_extra_terms(parsed_dict)
+        if extra:
+            long_names.update(
+                {short_name: long_names for long_names, short_name in extra}
+            )
+            # add extra fields
+            parsed_dict.update(
+                {short_name: value for (_, short_name), value in extra.items()}
+            )
+        return parsed_dict
+    except (pynmea2.ParseError, AttributeError, ValueError, KeyError):
+        logger.error("Unable to parse line: %s", line[:-1])
+
+
+def _to_float(values: np.ndarray) -> tuple:
+    """Convert strings to float, return the values and the failed conversions."""
+    try:
+        return values.astype(float), np.zeros(len(values), dtype=bool)
+    except (TypeError, ValueError):
+        pass
+    floats = np.full(len(values), np.nan)
+    failed = np.zeros(len(values), dtype=bool)
+    for index, value in enumerate(values):
+        try:
+            floats[index] = float(value)
+        except (TypeError, ValueError):
+            failed[index] = True
+    return floats, failed
+
+
+def _strptime(values: pd.Series, date_format: str, strict_format: str) -> tuple:
+    """Parse timestamps, return the datetime64 values and the failed conversions.
+
+    Values matching the strict_format regex are parsed with pandas, the others
+    with datetime.strptime.
+    """
+    times = np.full(len(values), np.datetime64("NaT"), dtype="datetime64[ns]")
+    failed = np.zeros(len(values), dtype=bool)
+    is_strict = values.str.fullmatch(strict_format).to_numpy(dtype=bool)
+    times[is_strict] = pd.to_datetime(
+        values[is_strict], format=date_format, errors="coerce"
+    ).to_numpy()
+    for index in np.flatnonzero(~is_strict | np.isnat(times)):
+        try:
+            times[index] = datetime.strptime(values.iloc[index], date_format)
+        except ValueError:
+            failed[index] = True
+    return times, failed
+
+
+def _generate_extra_terms_vectorized(sentence_type: str, fields: dict) -> tuple:
+    """Generate extra terms of a group of sentences of the same type.
+
+    Vectorized version of `_generate_extra_terms`, missing fields are None.
+
+    Returns:
+        tuple: extra terms {(long_name, short_name): (values, mask)} and
+            the sentences for which `_generate_extra_terms` would fail.
+    """
+    n_rows = len(next(iter(fields.values()))) if fields else 0
+    extra = {}
+    failed = np.zeros(n_rows, dtype=bool)
+
+    def _get(name):
+        values = fields.get(name)
+        if values is None:
+            return np.full(n_rows, None, dtype=object), np.zeros(n_rows, dtype=bool)
+        return values, pd.notna(values)
+
+    if sentence_type in ("GGA", "RMC", "GLL"):
+        coordinates = {}
+        for name, degrees_width in (("lat", 2), ("lon", 3)):
+            values, has_value = _get(name)
+            direction, has_direction = _get(f"{name}_dir")
+            failed |= ~has_value | ~has_direction
+            text = pd.Series(np.where(failed, "0", values), dtype=object)
+            degrees, degrees_failed = _to_float(
+                text.str[:degrees_width].to_numpy(dtype=object)
+            )
+            minutes, minutes_failed = _to_float(
+                text.str[degrees_width:].to_numpy(dtype=object)
+            )
+            failed |= degrees_failed | minutes_failed
+            sign = np.where(direction == ("S" if name == "lat" else "W"), -1, 1)
+            coordinates[name] = sign * (degrees + minutes / 60)
+        extra[("Latitude", "latitude_degrees_north")] = (coordinates["lat"], ~failed)
+        extra[("Longitude", "longitude_degrees_east")] = (coordinates["lon"], ~failed)
+
+    if sentence_type == "ZDA":
+        missing = np.zeros(n_rows, dtype=bool)
+        items = {}
+        for name in ("year", "month", "day", "timestamp"):
+            items[name], has_value = _get(name)
+            missing |= ~has_value
+        failed |= missing
+        timestamp = pd.Series(np.where(missing, "", items["timestamp"]), dtype=object)
+        text = (
+            pd.Series(np.where(missing, "", items["year"]), dtype=object)
+            + "-"
+            + pd.Series(np.where(missing, "", items["month"]), dtype=object)
+            + "-"
+            + pd.Series(np.where(missing, "", items["day"]), dtype=object)
+            + "T"
+            + timestamp
+        )
+        times, time_failed = _strptime_by_precision(
+            text, timestamp, "%Y-%m-%dT%H%M%S", r"\d{4}-\d{2}-\d{2}T\d{6}"
+        )
+        failed |= time_failed & ~missing
+        extra[("GPS Time", "gps_datetime")] = (times, ~failed)
+
+    if sentence_type == "RMC":
+        timestamp, has_timestamp = _get("timestamp")
+        datestamp, has_datestamp = _get("datestamp")
+        has_time = has_timestamp & has_datestamp & (timestamp != "") & (datestamp != "")
+        timestamp = pd.Series(np.where(has_time, timestamp, ""), dtype=object)
+        text = pd.Series(np.where(has_time, datestamp, ""), dtype=object) + "T"
+        times, time_failed = _strptime_by_precision(
+            text + timestamp, timestamp, "%d%m%yT%H%M%S", r"\d{6}T\d{6}"
+        )
+        failed |= time_failed & has_time
+        extra[("GPS Time", "gps_datetime")] = (times, has_time & ~failed)
+
+    if sentence_type == "MWV":
+        reference, has_reference = _get("reference")
+        units, has_units = _get("wind_speed_units")
+        wind_speed, has_wind_speed = _get("wind_speed")
+        wind_angle, has_wind_angle = _get("wind_angle")
+        is_relative = has_reference & (reference == "R")
+        failed |= ~has_reference | (is_relative & ~has_units)
+        has_wind = np.zeros(n_rows, dtype=bool)
+        for unit, (long_unit, short_unit) in MWV_WIND_SPEED_UNITS.items():
+            has_unit = is_relative & has_units & (units == unit)
+            if not has_unit.any():
+                continue
+            failed |= has_unit & (~has_wind_speed | ~has_wind_angle)
+            extra[
+                (
+                    f"Wind Speed Relative To Platform [{long_unit}]",
+                    f"wind_speed_relative_to_platform_{short_unit}",
+                )
+            ] = (wind_speed, has_unit)
+            has_wind |= has_unit
+        if has_wind.any():
+            extra[
+                (
+                    "Wind Direction Relative To Platform",
+                    "wind_direction_relative_to_platform",
+                )
+            ] = (wind_angle, has_wind)
+        unknown_units = (
+            is_relative & has_units & ~np.isin(units, list(MWV_WIND_SPEED_UNITS))
+        )
+        for index in np.flatnonzero(unknown_units & ~failed):
+            logger.error("unknown units for MWV: %s", units[index])
+
+    extra = {key: (values, mask & ~failed) for key, (values, mask) in extra.items()}
+    return extra, failed
+
+
+def _strptime_by_precision(
+    text: pd.Series, timestamp: pd.Series, date_format: str, strict_format: str
+) -> tuple:
+    """Parse timestamps with or without fraction of seconds."""
+    times = np.full(len(text), np.datetime64("NaT"), dtype="datetime64[ns]")
+    failed = np.zeros(len(text), dtype=bool)
+    has_fraction = (timestamp.str.len() > 6).to_numpy()
+    for selection, fraction_format, fraction_regex in (
+        (~has_fraction, "", ""),
+        (has_fraction, ".%f", r"\.\d{1,6}"),
+    ):
+        if not selection.any():
+            continue
+        times[selection], failed[selection] = _strptime(
+            text[selection],
+            date_format + fraction_format,
+            strict_format + fraction_regex,
+        )
+    return times, failed
+
+
+def _get_checksums(nmea_strings: list) -> np.ndarray:
+    """Compute the NMEA checksum (xor of the characters) of each string."""
+    if not nmea_strings:
+        return np.array([], dtype=np.uint32)
+    lengths = np.fromiter(map(len, nmea_strings), dtype=np.int64)
+    text = "".join(nmea_strings)
+    try:
+        codes = np.frombuffer(text.encode("latin-1"), dtype=np.uint8)
+    except UnicodeEncodeError:
+        codes = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+    offsets = np.concatenate([[0], np.cumsum(lengths[:-1])])
+    return np.bitwise_xor.reduceat(codes, offsets).astype(np.uint32)
+
+
+def _get_nmea_column_order(signatures: list) -> list:
+    """Retrieve the columns order of the parsed sentences.
+
+    Follow pandas.DataFrame(list of dict) columns order: columns are
+    ordered by their first appearance.
+    """
+    columns = {}
+    for _, keys in sorted(signatures, key=lambda item: item[0]):
+        columns.update(dict.fromkeys(keys))
+    return list(columns)
+
+
+def _finalize_nmea_column(name: str, values: np.ndarray) -> np.ndarray:
+    """Cast a parsed column like the pynmea2 engine."""
+    dtype = NMEA_0183_DTYPES.get(name)
+    if dtype is datetime:
+        return values
+    values[values == ""] = None
+    if dtype is float:
+        values = values.astype(float)
+        is_nan = np.isnan(values)
+        if is_nan.any():
+            values = values.astype(object)
+            values[is_nan] = None
+        return values
+    elif dtype is bool:
+        return values.astype(bool)
+    values[values == "None"] = None
+    return values
+
+
+def _nmea_0183_vectorized(
+    text: str, nmea_delimiter: str, first_row: int = 0
+) -> xarray.Dataset:
+    """Parse NMEA 0183 text with the vectorized engine.
+
+    Produces the same dataset as the pynmea2 engine.
+    """
+    lines = text.split("\n")
+    lines = [line + "\n" for line in lines[:-1]] + ([lines[-1]] if lines[-1] else [])
+    items = pd.Series(lines, dtype=object).str.partition(nmea_delimiter)
+    prefix, rest = items[0].to_numpy(dtype=object), items[2]
+    has_delimiter = (items[1] != "").to_numpy()
+    for row in np.flatnonzero(~has_delimiter):
+        logger.warning(
+            "Missing NMEA deliminter %s - ignore line %s",
+            nmea_delimiter,
+            lines[row][:-1],
+        )
+
+    # Retrieve talker sentences handled by pynmea2 base TalkerSentence
+    sentences = rest.str.extract(nmea_talker_sentence)
+    sentence_type = sentences["sentence_type"].str.upper()
+    is_vectorized = (
+        has_delimiter
+        & (nmea_delimiter == "$")
+        & sentence_type.isin(list(TalkerSentence.sentence_types)).to_numpy()
+    )
+
+    # Validate checksums in bulk
+    has_checksum = np.flatnonzero(is_vectorized & sentences["checksum"].notna())
+    checksums = sentences["checksum"].iloc[has_checksum].apply(int, base=16)
+    nmea_strings = (
+        sentences["talker"] + sentences["sentence_type"] + "," + sentences["data"]
+    ).iloc[has_checksum]
+    is_vectorized[
+        has_checksum[_get_checksums(nmea_strings.to_list()) != checksums.to_numpy()]
+    ] = False
+
+    # Parse each sentence type
+    talker = sentences["talker"].str.upper().to_numpy(dtype=object)
+    groups = []
+    long_names_updates = []
+    signatures = []
+    vectorized_rows = np.flatnonzero(is_vectorized)
+    vectorized_types = sentence_type.iloc[vectorized_rows]
+    for sentence, positions in vectorized_types.groupby(
+        vectorized_types
+    ).indices.items():
+        rows = vectorized_rows[positions]
+        sentence_class = TalkerSentence.sentence_types[sentence]
+        data = sentences["data"].iloc[rows].reset_index(drop=True)
+        values = data.str.split(",", expand=True)
+        n_keys = np.minimum(
+            len(sentence_class.fields), data.str.count(",").to_numpy() + 1
+        )
+        fields = {
+            _rename_variable(field[1]): values[index].to_numpy(dtype=object)
+            for index, field in enumerate(sentence_class.fields[: values.shape[1]])
+        }
+        long_names_updates.append(
+            (
+                rows[-1],
+                0,
+                {field[1]: field[0] for field in sentence_class.fields},
+            )
+        )
+
+        extra, failed = _generate_extra_terms_vectorized(sentence, fields)
+        for row in rows[failed]:
+            logger.error("Unable to parse line: %s", lines[row][:-1])
+        kept = ~failed
+        columns = {
+            "row": (rows + first_row).astype(float),
+            "prefix": prefix[rows],
+            "talker": talker[rows],
+            "sentence_type": np.full(len(rows), sentence, dtype=object),
+            "subtype": np.full(len(rows), None, dtype=object),
+            "manufacturer": np.full(len(rows), None, dtype=object),
+            **fields,
+        }
+        masks = {name: index < n_keys for index, name in enumerate(fields)}
+        for (long_name, short_name), (extra_values, mask) in extra.items():
+            columns[short_name] = extra_values
+            masks[short_name] = mask
+            if mask.any():
+                long_names_updates.append(
+                    (rows[np.flatnonzero(mask)[-1]], 1, {short_name: long_name})
+                )
+
+        # Retrieve the keys of each sentences signature
+        base_keys = [
+            "row",
+            "prefix",
+            "talker",
+            "sentence_type",
+            "subtype",
+            "manufacturer",
+        ]
+        signature = pd.DataFrame({name: mask[kept] for name, mask in masks.items()})
+        for position in signature.drop_duplicates().index:
+            signatures.append(
+                (
+                    rows[kept][position],
+                    base_keys + [name for name in masks if masks[name][kept][position]],
+                )
+            )
+        groups.append((rows[kept], columns, masks, kept))
+
+    # Parse the other sentences with pynmea2
+    fallback = {}
+    for row in np.flatnonzero(has_delimiter & ~is_vectorized):
+        long_names = {}
+        parsed_dict = _parse_nmea_line(
+            row + first_row, lines[row], nmea_delimiter, long_names
+        )
+        long_names_updates.append((row, 0, long_names))
+        if parsed_dict:
+            fallback[row] = parsed_dict
+            signatures.append((row, list(parsed_dict)))
+
+    # Combine sentences
+    output_rows = np.sort(
+        np.concatenate(
+            [rows for rows, *_ in groups]
+            + [np.fromiter(fallback, dtype=np.int64, count=len(fallback))]
+        )
+    )
+    n_rows = len(output_rows)
+    output = {}
+    for name in _get_nmea_column_order(signatures):
+        if NMEA_0183_DTYPES.get(name) is datetime:
+            output[name] = np.full(n_rows, np.datetime64("NaT"), "datetime64[ns]")
+        else:
+            output[name] = np.full(n_rows, None, dtype=object)
+    for rows, columns, masks, kept in groups:
+        positions = np.searchsorted(output_rows, rows)
+        for name, values in columns.items():
+            mask = masks.get(name, np.ones(len(kept), dtype=bool))[kept]
+            output[name][positions[mask]] = values[kept][mask]
+    for row, parsed_dict in fallback.items():
+        position = np.searchsorted(output_rows, row)
+        for name, value in parsed_dict.items():
+            output[name][position] = value
+
+    unknown_variables_dtype = [var for var in output if var not in NMEA_0183_DTYPES]
+    if unknown_variables_dtype:
+        logger.warning("unknown dtype for nmea columns: %s", unknown_variables_dtype)
+
+    ds = xarray.Dataset(
+        {
+            name: ("index", _finalize_nmea_column(name, values))
+            for name, values in output.items()
+        },
+        coords={"index": np.arange(n_rows)},
+    )
+    ds.attrs = global_attributes
+
+    long_names = {}
+    for *_, update in sorted(long_names_updates, key=lambda item: item[:2]):
+        long_names.update(update)
+    for var in ds:
+        if var in long_names:
+            ds[var].attrs["long_name"] = long_names[var]
+    return ds
+
+
 global_attributes = {"Convention": "CF-1.6"}
 
 
 def nmea_0183(
-    path: str, encoding: str = "UTF-8", nmea_delimiter: str = "$"
+    path: str,
+    encoding: str = "UTF-8",
+    nmea_delimiter: str = "$",
+    engine: str = "pynmea2",
 ) -> xarray.Dataset:
     """Parse NMEA 0183 standard protocol file into a pandas dataframe.
 
+    Available engines:
+        - pynmea2: parse each line with pynmea2
+        - vectorized: validate the checksums in bulk, group the talker
+          sentences by type and split their fields with the pynmea2 fields
+          layout. Other sentences fall back to pynmea2.
+
     Args:
         path (str): [description]
         encoding (str, optional): [description]. Defaults to "UTF-8".
         nmea_delimiter (str, optional): [description]. Defaults to "$".
+        engine (str, optional): engine used to parse the NMEA sentences.
+            Defaults to "pynmea2".
 
     Returns:
         xarray.Dataset: [description]
     """
     """Parse a file containing NMEA information into a pandas dataframe"""
 
-    def rename_variable(name):
-        """Rename variable based on variable mapping dictionary or return name."""
-        if name == ("Heave", "heading"):
-            # fix in https://github.com/Knio/pynmea2/pull/129 but not included in pipy yet
-            return ("Heave", "heave")
-        return name
+    if engine not in NMEA_0183_ENGINES:
+        raise ValueError(
+            f"Unknown engine {engine}, should be one of {NMEA_0183_ENGINES}"
+        )
+
+    with open(path, encoding=encoding) as f:
+        return _parse_nmea_0183(f, nmea_delimiter, engine)
+
+
+def nmea_0183_text(
+    text: str,
+    nmea_delimiter: str = "$",
+    engine: str = "pynmea2",
+    first_row: int = 0,
+) -> xarray.Dataset:
+    """Parse NMEA 0183 lines from a string.
+
+    Args:
+        text (str): NMEA lines
+        nmea_delimiter (str, optional): NMEA string delimiter. Defaults to "$".
+        engine (str, optional): engine used to parse the NMEA sentences.
+            Defaults to "pynmea2".
+        first_row (int, optional): row number of the first line. Defaults to 0.
+
+    Returns:
+        xarray.Dataset: parsed dataset
+    """
+    if engine not in NMEA_0183_ENGINES:
+        raise ValueError(
+            f"Unknown engine {engine}, should be one of {NMEA_0183_ENGINES}"
+        )
+    return _parse_nmea_0183(io.StringIO(text), nmea_delimiter, engine, first_row)
+
+
+def _parse_nmea_0183(
+    lines: TextIO, nmea_delimiter: str, engine: str, first_row: int = 0
+) -> xarray.Dataset:
+    """Parse NMEA 0183 lines with the given engine.
+
+    Args:
+        lines (TextIO): text stream of NMEA lines
+        nmea_delimiter (str): NMEA string delimiter
+        engine (str): engine used to parse the NMEA sentences
+        first_row (int, optional): row number of the first line. Defaults to 0.
+
+    Returns:
+        xarray.Dataset: parsed dataset
+    """
+    if engine == "vectorized":
+        return _nmea_0183_vectorized(lines.read(), nmea_delimiter, first_row)
 
     nmea = []
     long_names = {}
-    with open(path, encoding=encoding) as f:
-        for row, line in enumerate(f):
-            if not line:
-                continue
-            elif nmea_delimiter and nmea_delimiter not in line:
-                logger.warning(
-                    "Missing NMEA deliminter %s - ignore line %s",
-                    nmea_delimiter,
-                    line[:-1],
-                )
-                continue
-            try:
-                prefix, nmea_string = line.split(nmea_delimiter, 1)
-                parsed_line = pynmea2.parse(nmea_delimiter + nmea_string)
-
-                # Retrieve long_names from nmea fields
-                long_names.update({field[1]: field[0] for field in parsed_line.fields})
-                parsed_items = parsed_line.__dict__
-                parsed_dict = {
-                    "row": row,
-                    "prefix": prefix,
-                    "talker": parsed_items.get("talker"),
-                    "sentence_type": parsed_items.get("sentence_type"),
-                    "subtype": parsed_items.get("subtype"),
-                    "manufacturer": parsed_items.get("manufacturer"),
-                    **{
-                        rename_variable(field[1]): value
-                        for field, value in zip(parsed_line.fields, parsed_line.data)
-                    },
-                }
-                # Get extra fields
-                extra = _generate_extra_terms(parsed_dict)
-                if extra:
-                    long_names.update(
-                        {short_name: long_names for long_names, short_name in extra}
-                    )
-                    # add extra fields
-                    parsed_dict.update(
-                        {short_name: value for (_, short_name), value in extra.items()}
-                    )
-                nmea += [parsed_dict]
-            except (pynmea2.ParseError, AttributeError, ValueError, KeyError):
-                logger.error("Unable to parse line: %s", line[:-1])
+    for row, line in enumerate(lines, start=first_row):
+        parsed_dict = _parse_nmea_line(row, line, nmea_delimiter, long_names)
+        if parsed_dict:
+            nmea += [parsed_dict]
 
     # Convert NMEA to a dataframe
     df = pd.DataFrame(nmea).replace({np.nan: None, "": None})
@@ -313,3 +785,89 @@ def nmea_0183(
         if var in long_names:
             ds[var].attrs["long_name"] = long_names[var]
     return ds
+
+
+class NMEAFollower:
+    """Incrementally parse a growing NMEA 0183 file.
+
+    The follower keeps the byte offset of the last complete line parsed and
+    the trailing partial line, so that each call to `read` only parses the
+    lines appended to the file since the previous call.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        encoding: str = "UTF-8",
+        nmea_delimiter: str = "$",
+        engine: str = "vectorized",
+        offset: int = 0,
+        row: int = 0,
+    ):
+        """Initialize a NMEA file follower.
+
+        Args:
+            path (str): path to the NMEA file
+            encoding (str, optional): file encoding. Defaults to "UTF-8".
+            nmea_delimiter (str, optional): NMEA string delimiter. Defaults to "$".
+            engine (str, optional): engine used to parse the NMEA sentences.
+                Defaults to "vectorized".
+            offset (int, optional): byte offset of the first line to parse.
+                Defaults to 0.
+            row (int, optional): row number of the line at the given offset.
+                Defaults to 0.
+        """
+        if engine not in NMEA_0183_ENGINES:
+            raise ValueError(
+                f"Unknown engine {engine}, should be one of {NMEA_0183_ENGINES}"
+            )
+        self.path = path
+        self.encoding = encoding
+        self.nmea_delimiter = nmea_delimiter
+        self.engine = engine
+        self.offset = offset
+        self.row = row
+        self.buffer = b""
+
+    @property
+    def state(self) -> dict:
+        """Reading position which can be given back to a new follower."""
+        return {"path": str(self.path), "offset": self.offset, "row": self.row}
+
+    def read(self) -> xarray.Dataset:
+        """Parse the complete lines appended since the last call.
+
+        If the file is smaller than the present reading position, the file is
+        considered truncated or rotated and is read again from the beginning.
+
+        Returns:
+            xarray.Dataset: parsed new lines or None if no new complete line
+                is available.
+        """
+        position = self.offset + len(self.buffer)
+        if os.path.getsize(self.path) < position:
+            logger.warning(
+                "File %s is smaller than the last read position, "
+                "read it again from the beginning",
+                self.path,
+            )
+            self.offset, self.row, self.buffer = 0, 0, b""
+            position = 0
+
+        with open(self.path, "rb") as file_handle:
+            file_handle.seek(position)
+            data = self.buffer + file_handle.read()
+
+        end = data.rfind(b"\n") + 1
+        self.buffer = data[end:]
+        if not end:
+            return None
+
+        # Decode with universal newlines like nmea_0183
+        text = io.TextIOWrapper(io.BytesIO(data[:end]), encoding=self.encoding).read()
+        ds = _parse_nmea_0183(
+            io.StringIO(text), self.nmea_delimiter, self.engine, self.row
+        )
+        self.offset += end
+        self.row += text.count("\n")
+        return ds
@@ -10,14 +10,16 @@ data formats generated by the HOBOware and HOBOconnect softwares.
 
 import logging
 import re
+from contextlib import closing
 from csv import reader
 from datetime import datetime
 
+import openpyxl
 import pandas as pd
 import xarray
 
 from ocean_data_parser.parsers.checks import check_daylight_saving
-from ocean_data_parser.parsers.utils import standardize_dataset
+from ocean_data_parser.parsers.utils import apply_dtype_policy, standardize_dataset
 
 GLOBAL_ATTRIBUTES = {"instrument_manufacturer": "Onset", "Convention": "CF-1.6"}
 
@@ -94,6 +96,38 @@ def _get_time_format(time):
     return None
 
 
+def _parse_mixed_datetime(times: pd.Series) -> pd.Series:
+    """Parse timestamps with different formats.
+
+    Each timestamp is parsed with the format of the first matching
+    DATETIME_REGEX_FORMATS pattern, like `_get_time_format`. The timestamps are
+    grouped by pattern and each group is parsed with a single `pd.to_datetime`
+    call.
+
+    Args:
+        times (pd.Series): timestamps strings
+
+    Returns:
+        pd.Series: parsed timestamps
+    """
+    parsed_times = pd.Series(pd.NaT, index=times.index, dtype="datetime64[ns]")
+    is_unmatched = pd.Series(True, index=times.index)
+    for regex, datetime_format in DATETIME_REGEX_FORMATS:
+        is_format = is_unmatched & times.str.fullmatch(regex).fillna(False)
+        if is_format.any():
+            parsed_times[is_format] = pd.to_datetime(
+                times[is_format], format=datetime_format
+            )
+            is_unmatched &= ~is_format
+        if not is_unmatched.any():
+            return parsed_times
+
+    for time in times[is_unmatched]:
+        logger.warning("Unknown datetime format: %s", time)
+    parsed_times[is_unmatched] = times[is_unmatched].apply(pd.to_datetime)
+    return parsed_times
+
+
 def _parse_onset_csv_header(header_lines):
     full_header = "\n".join(header_lines)
     header = {
@@ -164,6 +198,7 @@ def csv(
     errors: str = "strict",
     timezone: str = None,
     ambiguous_timestamps: str = "raise",
+    dtype_policy: str = "default",
 ) -> xarray.Dataset:
     """Parses the Onset CSV format generate by HOBOware into a xarray object.
 
@@ -176,6 +211,9 @@ def csv(
         errors: Error handling. Defaults to "strict"
         timezone: Timezone to localize the time variable, overwrites the timezone in header
         ambiguous_timestamps: How to handle ambiguous time stamps. Defaults to "raise"
+        dtype_policy: dtype policy applied to the data
+            (see `utils.apply_dtype_policy`). Defaults to "default".
+
     Returns:
         xarray.Dataset
     """
@@ -218,25 +256,27 @@ def csv(
         encoding_errors=errors,
         encoding=encoding,
     )
+    df = apply_dtype_policy(df, dtype_policy)
 
     # Add timezone to time variables
     if df["Date Time"].dtype == "object":
         logger.warning(
             "Date Time column is not in a consistent format. Trying to convert"
         )
-        df["Date Time"] = df["Date Time"].apply(
-            lambda x: pd.to_datetime(x, format=_get_time_format(x))
-        )
+        df["Date Time"] = _parse_mixed_datetime(df["Date Time"])
     df["Date Time"] = df["Date Time"].dt.tz_localize(
         timezone or header["timezone"], ambiguous=ambiguous_timestamps
     )
     check_daylight_saving(df["Date Time"], ambiguous_timestamps)
+    # Store UTC datetime64 values rather than timezone aware timestamp objects
+    df["Date Time"] = df["Date Time"].dt.tz_convert("UTC").dt.tz_localize(None)
 
     # Convert to dataset
     ds = df.to_xarray()
     ds.attrs = {**GLOBAL_ATTRIBUTES, **header}
     for var in ds:
         ds[var].attrs = variables[var]
+    ds["Date Time"].attrs["timezone"] = "UTC"
 
     if standardize_variable_names:
         ds = ds.rename_vars(_standardized_variable_mapping(ds))
@@ -335,6 +375,31 @@ def _farenheit_to_celsius(farenheit):
     return (farenheit - 32.0) / 1.8000
 
 
+def is_hoboconnect_xlsx(path: str) -> bool:
+    """Check if a xlsx file was generated by HOBOconnect.
+
+    The workbook is opened in read-only mode and only the Details sheet rows
+    up to the HOBOconnect app name are read.
+
+    Args:
+        path (str): The path to the XLSX file
+
+    Returns:
+        bool: True if the file was generated by HOBOconnect
+    """
+    with closing(
+        openpyxl.load_workbook(path, read_only=True, data_only=True, keep_links=False)
+    ) as workbook:
+        if not all(
+            sheet in workbook.sheetnames for sheet in ("Data", "Events", "Details")
+        ):
+            return False
+        return any(
+            len(row) > 3 and row[3] == "HOBOconnect"
+            for row in workbook["Details"].iter_rows(min_row=2, values_only=True)
+        )
+
+
 def xlsx(
     path: str, timezone: str = None, ambiguous_timestamps: str = "infer"
 ) -> xarray.Dataset:
@@ -369,18 +434,16 @@ def xlsx(
         return column[0], column[1].replace(")", "")
 
     # Read the different sheets from the xlsx file
-    data = pd.read_excel(path, sheet_name="Data", engine="openpyxl")
-    events = pd.read_excel(path, sheet_name="Events", engine="openpyxl")
-    details = (
-        pd.read_excel(
-            path,
-            sheet_name="Details",
-            engine="openpyxl",
-            names=["group", "subgroup", "parameter", "value"],
+    with pd.ExcelFile(path, engine="openpyxl") as excel_file:
+        data = excel_file.parse("Data")
+        events = excel_file.parse("Events")
+        details = (
+            excel_file.parse(
+                "Details", names=["group", "subgroup", "parameter", "value"]
+            )
+            .ffill(axis=0)
+            .dropna(subset=["parameter", "value"])
         )
-        .ffill(axis=0)
-        .dropna(subset=["parameter", "value"])
-    )
     details_attrs = {
         _format_detail_key(f"{row['subgroup']}_{row['parameter']}"): row["value"]
         for id, row in details.iterrows()
@@ -416,10 +479,12 @@ def xlsx(
         .dt.tz_convert("UTC")
     )
     check_daylight_saving(data["time"])
+    data["time"] = data["time"].dt.tz_localize(None)
 
     ds = data.to_xarray()
     for var in variable_attributes:
         ds[var].attrs = variable_attributes[var]
+    ds["time"].attrs["timezone"] = "UTC"
     ds.attrs = {**GLOBAL_ATTRIBUTES, "events": events.to_json(), **details_attrs}
     ds["instrument_type"] = _detect_instrument_type(ds)
     ds = standardize_dataset(ds)
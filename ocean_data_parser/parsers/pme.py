@@ -6,6 +6,8 @@ PME is a company that manufactures instruments to measure different water proper
 import logging
 import re
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Union
 
 import pandas as pd
@@ -87,32 +89,10 @@ def _rename_variable(variable: str) -> str:
         return variable.split("(")[0].strip().replace(" ", "_").lower()
 
 
-def txt(
-    path: str,
-    rename_variables: bool = True,
-    encoding: str = "utf-8",
-    errors: str = "strict",
-    timezone: str = "UTC",
-    global_attributes: dict = None,
-) -> xr.Dataset:
-    """Parse PME MiniDot txt file.
-
-    Args:
-        path (str): txt file path to read
-        rename_variables (bool, optional): _description_. Defaults to True.
-        encoding (str, optional): File encoding. Defaults to 'utf-8'.
-        errors (str, optional): Error handling. Defaults to 'strict'.
-        timezone (str, optional): Timezone to localize the time. Defaults to 'UTC'.
-        global_attributes (dict, optional): Global attributes to add to the dataset. Defaults to {}.
-
-    Returns:
-        xarray.Dataset
-    """
-
-    def _append_to_history(msg):
-        ds.attrs["history"] += f"{pd.Timestamp.utcnow():%Y-%m-%dT%H:%M:%SZ} {msg}"
-
-    # Read MiniDot
+def _read_txt(
+    path: str, encoding: str = "utf-8", errors: str = "strict", timezone: str = "UTC"
+) -> tuple:
+    """Read the header metadata and the time sorted data of a MiniDot txt file."""
     with open(
         path,
         encoding=encoding,
@@ -137,7 +117,7 @@ def txt(
 
         if metadata is None:
             warnings.warn("Failed to read: {path}", RuntimeWarning)
-            return pd.DataFrame(), None
+            return None, pd.DataFrame()
 
         # Parse column names
         columns = [item.strip() for item in header[-1].split(",")]
@@ -145,19 +125,37 @@ def txt(
         # Read the data with pandas
         df = pd.read_csv(
             f,
-            converters={0: lambda x: pd.Timestamp(int(x), unit="s")},
             encoding=encoding,
             encoding_errors=errors,
             names=columns,
             header=None,
         )
-        ds = df.to_xarray()
 
-    ds["Time (sec)"] = (
-        ds.dims,
-        ds["Time (sec)"].to_index().tz_localize(timezone),
-        {"timezone": timezone},
+    # Store UTC datetime64 values rather than timezone aware timestamp objects
+    df["Time (sec)"] = (
+        pd.to_datetime(df["Time (sec)"], unit="s")
+        .dt.tz_localize(timezone)
+        .dt.tz_convert("UTC")
+        .dt.tz_localize(None)
     )
+    if not df["Time (sec)"].is_monotonic_increasing:
+        df = df.sort_values("Time (sec)", kind="stable", ignore_index=True)
+    return metadata, df
+
+
+def _txt_dataset(
+    df: pd.DataFrame,
+    metadata: dict,
+    rename_variables: bool = True,
+    global_attributes: dict = None,
+) -> xr.Dataset:
+    """Generate the MiniDot dataset from the data read from txt files."""
+
+    def _append_to_history(msg):
+        ds.attrs["history"] += f"{pd.Timestamp.utcnow():%Y-%m-%dT%H:%M:%SZ} {msg}"
+
+    ds = df.to_xarray()
+    ds["Time (sec)"].attrs["timezone"] = "UTC"
 
     # Global attributes
     ds.attrs = {
@@ -206,20 +204,69 @@ def txt(
         ds.attrs["history"] += (
             f"\n{pd.Timestamp.now().isoformat()} Rename variables: {variable_mapping}"
         )
+    return ds
 
+
+def txt(
+    path: str,
+    rename_variables: bool = True,
+    encoding: str = "utf-8",
+    errors: str = "strict",
+    timezone: str = "UTC",
+    global_attributes: dict = None,
+) -> xr.Dataset:
+    """Parse PME MiniDot txt file.
+
+    Args:
+        path (str): txt file path to read
+        rename_variables (bool, optional): _description_. Defaults to True.
+        encoding (str, optional): File encoding. Defaults to 'utf-8'.
+        errors (str, optional): Error handling. Defaults to 'strict'.
+        timezone (str, optional): Timezone to localize the time. Defaults to 'UTC'.
+        global_attributes (dict, optional): Global attributes to add to the dataset. Defaults to {}.
+
+    Returns:
+        xarray.Dataset
+    """
+    metadata, df = _read_txt(path, encoding=encoding, errors=errors, timezone=timezone)
+    if metadata is None:
+        return df, None
+    ds = _txt_dataset(
+        df,
+        metadata,
+        rename_variables=rename_variables,
+        global_attributes=global_attributes,
+    )
     ds = standardize_dataset(ds)
     return ds
 
 
 def txts(
-    paths: Union[list, str], encoding: str = "utf-8", errors: str = "strict"
+    paths: Union[list, str],
+    rename_variables: bool = True,
+    encoding: str = "utf-8",
+    errors: str = "strict",
+    timezone: str = "UTC",
+    global_attributes: dict = None,
+    max_workers: int = None,
 ) -> xr.Dataset:
     """Parse PME Minidots txt files.
 
+    The files are read concurrently and their time sorted records are
+    concatenated into a single time indexed dataset. Records of
+    overlapping files are sorted and duplicated times are dropped,
+    keeping the record of the file starting first.
+
     Args:
         paths (listorstr): List of file paths to read.
+        rename_variables (bool, optional): Rename variables to their mapped
+            names. Defaults to True.
         encoding (str, optional): File encoding. Defaults to 'utf-8'.
         errors (str, optional): Error handling. Defaults to 'strict'.
+        timezone (str, optional): Timezone to localize the time. Defaults to 'UTC'.
+        global_attributes (dict, optional): Global attributes to add to the dataset. Defaults to {}.
+        max_workers (int, optional): Maximum number of threads used to read
+            the files. Defaults to ThreadPoolExecutor default.
 
     Returns:
         xr.Dataset: xarray dataset which is compliant with CF-1.6
@@ -228,16 +275,53 @@ def txts(
     if isinstance(paths, str):
         paths = [paths]
 
-    datasets = []
+    txt_paths = []
     for path in paths:
         # Ignore concatenated Cat.TXT files or not TXT file
         if path.endswith("Cat.TXT") or not path.endswith(("TXT", "txt")):
-            print(f"Ignore {path}")
+            logger.info("Ignore %s", path)
             continue
-        # Read txt file
-        datasets += minidot_txt(path, encoding=encoding, errors=errors)
-
-    return xr.merge(datasets)
+        txt_paths.append(path)
+    if not txt_paths:
+        raise ValueError("No PME txt file to read")
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        files = list(
+            executor.map(
+                partial(_read_txt, encoding=encoding, errors=errors, timezone=timezone),
+                txt_paths,
+            )
+        )
+    # Order the files by their first record
+    files = [file for file in files if not file[1].empty]
+    if not files:
+        raise ValueError("No PME txt file to read")
+    files.sort(key=lambda file: file[1]["Time (sec)"].iloc[0])
+    metadata = files[0][0]
+    df = pd.concat([df for _, df in files], ignore_index=True)
+
+    # Files following each other are already sorted once concatenated
+    is_contiguous = all(
+        previous["Time (sec)"].iloc[-1] < df["Time (sec)"].iloc[0]
+        for (_, previous), (_, df) in zip(files[:-1], files[1:])
+    )
+    if not is_contiguous:
+        df = df.sort_values("Time (sec)", kind="stable", ignore_index=True)
+        duplicated = df["Time (sec)"].duplicated()
+        if duplicated.any():
+            logger.info("Drop %s overlapping records", duplicated.sum())
+            df = df.loc[~duplicated].reset_index(drop=True)
+
+    ds = _txt_dataset(
+        df,
+        metadata,
+        rename_variables=rename_variables,
+        global_attributes=global_attributes,
+    )
+    time = _rename_variable("Time (sec)") if rename_variables else "Time (sec)"
+    ds = ds.swap_dims({"index": time}).drop_vars("index")
+    ds = standardize_dataset(ds)
+    return ds
 
 
 def cat(path: str, encoding: str = "utf-8", errors: str = "strict") -> xr.Dataset:
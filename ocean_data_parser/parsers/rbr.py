@@ -6,11 +6,10 @@ including temperature, salinity, pressure, and more.
 
 import re
 
-import pandas as pd
 from loguru import logger
 from xarray import Dataset
 
-from ocean_data_parser.parsers.utils import standardize_dataset
+from ocean_data_parser.parsers.utils import read_whitespace_table, standardize_dataset
 
 
 def rtext(
@@ -18,6 +17,7 @@ def rtext(
     encoding="UTF-8",
     header_end: str = "NumberOfSamples",
     errors: str = "raise",
+    engine: str = "pandas-c",
 ) -> Dataset:
     """Read RBR legacy R-Text Engineering format.
 
@@ -27,6 +27,8 @@ def rtext(
         header_end (str, optional): End of the metadata header.
             Defaults to "NumberOfSamples".
         errors (str, optional): Error handling. Defaults to "raise".
+        engine (str, optional): Engine used to read the data
+            (see `utils.read_whitespace_table`). Defaults to "pandas-c".
 
     Raises:
         RuntimeError: File length do not match expected Number of Samples
@@ -68,7 +70,19 @@ def rtext(
         metadata["number_of_samples"] = int(line.rsplit("=")[1])
 
         # Read data
-        ds = pd.read_csv(fid, sep=r"\s\s+", engine="python").to_xarray()
+        # Columns are separated by at least two spaces since the
+        # timestamps contain a single space
+        line = fid.readline()
+        while line and not line.strip():
+            line = fid.readline()
+        ds = read_whitespace_table(
+            fid,
+            names=re.split(r"\s\s+", line.strip()),
+            dtype=None,
+            engine=engine,
+            min_gap=2,
+            encoding=encoding,
+        ).to_xarray()
 
         # Make sure that line count is good
         if ds.dims["index"] != metadata["number_of_samples"]:
@@ -8,15 +8,25 @@ and is supported by [Seabird Scientific](https://www.seabird.com).
 import difflib
 import json
 import logging
+import os
 import re
+from copy import deepcopy
 from datetime import datetime
+from functools import lru_cache
+from io import BytesIO, TextIOWrapper
 from pyexpat import ExpatError
 
+import numpy as np
 import pandas as pd
 import xarray
 import xmltodict
 
-from ocean_data_parser.parsers.utils import convert_datetime_str, standardize_dataset
+from ocean_data_parser.parsers.utils import (
+    apply_dtype_policy,
+    convert_datetime_str,
+    read_whitespace_table,
+    standardize_dataset,
+)
 from ocean_data_parser.vocabularies.load import seabird_vocabulary
 
 logger = logging.getLogger(__name__)
@@ -27,12 +37,19 @@ var_dtypes = {
     "stats": str,
     "scan": int,
 }
+SBE_BAD_FLAG = -9.99e-29
+SBE_XML_CACHE_SIZE = 64
 SBE_TIME_FORMAT = "%b %d %Y %H:%M:%S"  # Jun 23 2016 13:51:30
 sbe_time = re.compile(
     r"(?P<time>\w\w\w\s+\d{1,2}\s+\d{1,4}\s+\d\d\:\d\d\:\d\d)(?P<comment>.*)"
 )
 
-seabird_variable_attributes = seabird_vocabulary()
+
+@lru_cache(maxsize=1)
+def _get_seabird_vocabulary() -> dict:
+    """Load the Seabird vocabulary on first use."""
+    return seabird_vocabulary()
+
 
 IGNORED_HEADER_LINES = [
     "* GetHD\n",
@@ -52,6 +69,7 @@ IGNORED_HEADER_LINES = [
     "* S>\n",
     "*\n",
 ]
+_ignored_header_lines = frozenset(IGNORED_HEADER_LINES)
 
 SBE_DATA_PROCESSING_MODULES = [
     "datcnv",
@@ -75,6 +93,50 @@ is_seabird_processing_stage = re.compile(
     r"_(?P<parameter>[^\s\:]+)( = |: )(?P<value>.*)"
 )
 
+# Header line classifier, the first matching group define the line type
+sbe_header_line_type = re.compile(
+    r"(?P<xml>[\*\#]\s*\<)|(?P<comment>\*\* )|(?P<asterisk>\* )|(?P<hash>\# )"
+    r"|(?P<bottle>\s*Bottle\s+Date)"
+)
+sbe_xml_line_start = {"*": re.compile(r"\*\s*\<"), "#": re.compile(r"\#\s*\<")}
+sbe_xml_line_end = re.compile(r"\>\s*$")
+sbe_comment_attribute = re.compile(r"\*\* (?P<key>[^:=]*)(\:|\=)(?P<value>.*)")
+sbe_instrument_type = re.compile(r"\* Sea-Bird (.*) Data File\:?|\* SBE (.*)")
+sbe_software_version = re.compile(r"\* Software version (.*)", re.IGNORECASE)
+sbe_sensor_calibration = re.compile(
+    r"\* (?P<variable>temperature|conductivity|pressure|rtc):\s*"
+    r"(?P<calibration_date>\d\d-\w\w\w-\d\d)"
+)
+sbe_pressure_sensor = re.compile(
+    r"\* pressure sensor = (?P<type>[\w\s]+), range = (?P<range>.*)"
+)
+sbe_pressure_serial_number = re.compile(
+    r"\* pressure S\/N = (?P<serial_number>\d+), range = (?P<range>[^:]):"
+    r"(?P<calibration_date>.+)"
+)
+sbe_volt_calibration = re.compile(r"\* volt\s*(?P<channel>\d)+:\s(?P<extra>.*)")
+sbe_calibration_coefficient = re.compile(r"\*\s{4,}[A-Z0-9]+ = [0-9\.e\-\+]+")
+sbe_asterisk_attribute = re.compile(r"\*\s[\w\s\(\)]+\=")
+sbe_variable_name = re.compile(
+    r"\# name (?P<id>\d+) = (?P<sbe_variable>[^\s]+)\: (?P<long_name>.*)"
+    r"( \[(?P<units>.*)\](?P<comments>.*))*"
+)
+sbe_variable_span = re.compile(r"\# span (?P<id>\d+) = (?P<span>.*)")
+
+
+@lru_cache(maxsize=SBE_XML_CACHE_SIZE)
+def _parse_cached_xml(xml: str) -> dict:
+    """Parse XML with xmltodict, cached by the XML section hash.
+
+    The returned dictionary is shared between calls and shouldn't be modified.
+    """
+    return xmltodict.parse(xml)
+
+
+def _parse_xml(xml: str) -> dict:
+    """Parse Seabird XML section, identical sections are parsed once per process."""
+    return deepcopy(_parse_cached_xml(xml))
+
 
 def _convert_to_netcdf_var_name(var_name):
     """Convert seabird variable name to a netcdf compatible format."""
@@ -82,6 +144,7 @@ def _convert_to_netcdf_var_name(var_name):
 
 
 def _add_seabird_vocabulary(variable_attributes: dict) -> dict:
+    seabird_variable_attributes = _get_seabird_vocabulary()
     for var in variable_attributes.keys():
         var_lower = var.lower()
         if var_lower in seabird_variable_attributes:
@@ -103,6 +166,8 @@ def cnv(
     xml_parsing_error_level="ERROR",
     generate_instrument_variables: bool = False,
     save_orginal_header: bool = False,
+    engine: str = "pandas-c",
+    dtype_policy: str = "default",
 ) -> xarray.Dataset:
     """Parse Seabird CNV format.
 
@@ -115,27 +180,45 @@ def cnv(
         generate_instrument_variables (bool, optional): Generate instrument
             variables following the IOOS 1.2 standard. Defaults to False.
         save_orginal_header (bool, optional): Save original header. Defaults to False.
+        engine (str, optional): Engine used to read the ascii data
+            (see `utils.read_whitespace_table`). Defaults to "pandas-c".
+        dtype_policy (str, optional): dtype policy applied to the data
+            (see `utils.apply_dtype_policy`). Defaults to "default".
+
+    Binary CNV files (`# file_type = binary`) are decoded directly from a
+    memory map of the little-endian float32 data block and their variables
+    are kept as float32.
 
     Returns:
         xarray.Dataset: Dataset
     """
-    """Import Seabird cnv format as an xarray dataset."""
-
-    with open(file_path, encoding=encoding, errors=encoding_errors) as f:
+    with open(file_path, "rb") as f:
+        header_block = _read_seabird_header_block(f)
         header = _parse_seabird_file_header(
-            f, xml_parsing_error_level=xml_parsing_error_level
+            TextIOWrapper(
+                BytesIO(header_block), encoding=encoding, errors=encoding_errors
+            ),
+            xml_parsing_error_level=xml_parsing_error_level,
         )
         header["variables"] = _add_seabird_vocabulary(header["variables"])
-        df = pd.read_csv(
-            f,
-            delimiter=r"\s+",
-            names=header["variables"].keys(),
-            dtype={
-                var: var_dtypes.get(var, float) for var in header["variables"].keys()
-            },
-            na_values=["-1.#IO", "-9.99E-29"],
-            encoding_errors=encoding_errors,
-        )
+        if header.get("file_type") == "binary":
+            df = _read_binary_cnv_data(
+                file_path, offset=f.tell(), variables=header["variables"]
+            )
+        else:
+            df = read_whitespace_table(
+                f,
+                names=list(header["variables"].keys()),
+                dtype={
+                    var: var_dtypes.get(var, float)
+                    for var in header["variables"].keys()
+                },
+                na_values=["-1.#IO", "-9.99E-29"],
+                engine=engine,
+                encoding=encoding,
+                encoding_errors=encoding_errors,
+            )
+    df = apply_dtype_policy(df, dtype_policy)
 
     header = _generate_seabird_cf_history(header)
 
@@ -180,17 +263,24 @@ def btl(
             dtype={var: var_dtypes.get(var, float) for var in variable_list},
         )
 
-    # Split statistical data info separate dateframes
+    # Pivot each statistic rows to separate columns ({var}_{stats})
     df["bottle"] = df["bottle"].ffill().astype(int)
-    df["stats"] = df["stats"].str.extract(r"\((.*)\)")
-    df = df.set_index("bottle")
-    df_grouped = df.query("stats=='avg'")
-    for stats in df.query("stats!='avg'")["stats"].drop_duplicates().to_list():
-        df_grouped = df_grouped.join(df.query("stats==@stats").add_suffix(f"_{stats}"))
-    df = df_grouped
+    df["stats"] = df["stats"].str.extract(r"\((.*)\)", expand=False)
+    stats = ["avg"] + [item for item in df["stats"].unique() if item != "avg"]
+    columns = [(var, item) for item in stats for var in df.columns if var != "bottle"]
+    df = (
+        df.assign(stats_column=df["stats"])
+        .pivot(index="bottle", columns="stats_column")
+        .reindex(index=df["bottle"].unique(), columns=columns)
+    )
+    df.columns = [var if item == "avg" else f"{var}_{item}" for var, item in columns]
 
     # Generate time variable
-    df["time"] = pd.to_datetime(df.filter(like="date").apply(" ".join, axis="columns"))
+    date_columns = [col for col in df if col.startswith("date")]
+    df["time"] = pd.to_datetime(
+        df[date_columns[0]].str.cat(df[date_columns[1:]], sep=" "),
+        format=SBE_TIME_FORMAT,
+    )
 
     # Ignore extra variables
     drop_columns = [col for col in df if re.search("^date|^stats|^bottle_", col)]
@@ -234,6 +324,66 @@ def btl(
     return standardize_dataset(ds)
 
 
+def _read_seabird_header_block(f) -> bytes:
+    """Read the seabird header lines from a binary file object.
+
+    The file is left positioned at the start of the data block.
+    """
+    header_block = b""
+    while line := f.readline():
+        header_block += line
+        if b"*END*" in line or not line.startswith((b"*", b"#")):
+            break
+    return header_block
+
+
+def _read_binary_cnv_data(file_path, offset: int, variables: dict) -> pd.DataFrame:
+    """Read Seabird binary CNV data block.
+
+    Each scan is stored as little-endian float32 values, one per variable.
+
+    Args:
+        file_path (str): file path
+        offset (int): position of the data block in the file
+        variables (dict): variables listed in the file header
+
+    Returns:
+        pd.DataFrame: parsed data
+    """
+    n_variables = len(variables)
+    record_size = 4 * n_variables
+    data_size = os.path.getsize(file_path) - offset
+    n_records, extra_bytes = divmod(data_size, record_size)
+    if extra_bytes:
+        logger.warning(
+            "Binary data block isn't a multiple of the record size (%s bytes), "
+            "the last %s bytes are ignored",
+            record_size,
+            extra_bytes,
+        )
+    if n_records == 0:
+        records = np.empty((0, n_variables), dtype="<f4")
+    else:
+        records = np.memmap(
+            file_path,
+            dtype="<f4",
+            mode="r",
+            offset=offset,
+            shape=(n_records, n_variables),
+        )
+
+    columns = {}
+    bad_flag = np.float32(SBE_BAD_FLAG)
+    for index, var in enumerate(variables):
+        values = records[:, index]
+        if var_dtypes.get(var) is int:
+            columns[var] = values.astype(int)
+        else:
+            columns[var] = np.where(values == bad_flag, np.float32(np.nan), values)
+    del records
+    return pd.DataFrame(columns)
+
+
 def _convert_sbe_dataframe_to_dataset(df, header):
     """Convert Parsed DataFrame to a dataset."""
     # Convert column names to netcdf compatible format
@@ -243,7 +393,12 @@ def _convert_sbe_dataframe_to_dataset(df, header):
         for var, attrs in header["variables"].items()
     }
 
-    ds = df.to_xarray()
+    # Build the dataset from the columns arrays, pandas.to_xarray aligns each column
+    dim = df.index.name or "index"
+    ds = xarray.Dataset(
+        {var: (dim, df[var].to_numpy()) for var in df.columns},
+        coords={dim: df.index.to_numpy()},
+    )
     variable_attributes = header.pop("variables")
     for var, attrs in variable_attributes.items():
         if var not in ds:
@@ -264,8 +419,7 @@ def _parse_seabird_file_header(f, xml_parsing_error_level="ERROR"):
 
     def read_comments(line):
         """Read comments(**) in seabird header."""
-        if re.match(r"\*\* .*(\:|\=).*", line):
-            result = re.match(r"\*\* (?P<key>[^:=]*)(\:|\=)(?P<value>.*)", line)
+        if result := sbe_comment_attribute.match(line):
             key, _, value = result.groups()
             # Standardize key to match NetCDF requirements
             key = standardize_attribute(key)
@@ -287,18 +441,14 @@ def _parse_seabird_file_header(f, xml_parsing_error_level="ERROR"):
         if line.startswith((r"* Sea-Bird", r"* SBE ")) and not line.startswith(
             "* SBE 38 = "
         ):
-            instrument_type = re.search(
-                r"\* Sea-Bird (.*) Data File\:?|\* SBE (.*)", line
-            ).groups()
+            instrument_type = sbe_instrument_type.search(line).groups()
             header["instrument_type"] += "".join(
                 [item for item in instrument_type if item]
             )
-        elif re.match(r"\* Turo XBT Data File:", line):
+        elif line.startswith("* Turo XBT Data File:"):
             header["instrument_type"] += "Turo XBT"
-        elif re.match(r"\* Software version .*", line, re.IGNORECASE):
-            header["software_version"] = re.search(
-                r"\* Software version (.*)", line, re.IGNORECASE
-            )[1]
+        elif software_version := sbe_software_version.match(line):
+            header["software_version"] = software_version[1]
         elif (
             line.startswith(
                 (
@@ -319,34 +469,24 @@ def _parse_seabird_file_header(f, xml_parsing_error_level="ERROR"):
             header["instrument_firmware"] = line[10:].split("SERIAL")[0].strip()
         elif line.startswith("* cast"):
             header["processing"].append({"module": "cast", "message": line[2:]})
-        elif sensor_calibration := re.match(
-            r"\* (?P<variable>temperature|conductivity|pressure|rtc):\s*(?P<calibration_date>\d\d-\w\w\w-\d\d)",
-            line,
-        ):
+        elif sensor_calibration := sbe_sensor_calibration.match(line):
             header["calibration"][sensor_calibration["variable"]] = {
                 "calibration_date": sensor_calibration["calibration_date"]
             }
-        elif pressure_sensor := re.match(
-            r"\* pressure sensor = (?P<type>[\w\s]+), range = (?P<range>.*)", line
-        ):
+        elif pressure_sensor := sbe_pressure_sensor.match(line):
             if "pressure" not in header["calibration"]:
                 header["calibration"]["pressure"] = {}
             header["calibration"]["pressure"].update(pressure_sensor.groupdict())
-        elif pressure_sensor := re.match(
-            r"\* pressure S\/N = (?P<serial_number>\d+), range = (?P<range>[^:]):(?P<calibration_date>.+)",
-            line,
-        ):
+        elif pressure_sensor := sbe_pressure_serial_number.match(line):
             if "pressure" not in header["calibration"]:
                 header["calibration"]["pressure"] = {}
             header["calibration"]["pressure"].update(pressure_sensor.groupdict())
-        elif volt_calibration := re.match(
-            r"\* volt\s*(?P<channel>\d)+:\s(?P<extra>.*)", line
-        ):
+        elif volt_calibration := sbe_volt_calibration.match(line):
             header["calibration"][f"volt {volt_calibration['channel']}"] = dict(
                 [item.split(" = ") for item in volt_calibration["extra"].split(", ")]
             )
 
-        elif re.match(r"\*\s{4,}[A-Z0-9]+ = [0-9\.e\-\+]+", line):
+        elif sbe_calibration_coefficient.match(line):
             attr, value = line[2:].split(" = ", 1)
             # Retrieve the last sensor added to calibration
             sensor = list(header["calibration"].keys())[-1]
@@ -359,7 +499,7 @@ def _parse_seabird_file_header(f, xml_parsing_error_level="ERROR"):
             for attr in line[2:].split(", "):
                 attr, value = attr.split(" = ", 1)
                 header[standardize_attribute(attr)] = value.strip()
-        elif re.match(r"\*\s[\w\s\(\)]+\=", line):
+        elif sbe_asterisk_attribute.match(line):
             attr, value = line[2:].split("=", 1)
             header[standardize_attribute(attr)] = value.strip()
         else:
@@ -368,14 +508,10 @@ def _parse_seabird_file_header(f, xml_parsing_error_level="ERROR"):
     def read_hash_line(line):
         """Read hash(#) line in seabird header."""
         if line.startswith("# name"):
-            attrs = re.search(
-                r"\# name (?P<id>\d+) = (?P<sbe_variable>[^\s]+)\: (?P<long_name>.*)"
-                + r"( \[(?P<units>.*)\](?P<comments>.*))*",
-                line,
-            ).groupdict()
+            attrs = sbe_variable_name.search(line).groupdict()
             header["variables"][int(attrs["id"])] = attrs
         elif line.startswith("# span"):
-            span = re.search(r"\# span (?P<id>\d+) = (?P<span>.*)", line)
+            span = sbe_variable_span.search(line)
             values = [
                 float(value) if re.search(r".|e", value) else int(value)
                 for value in span["span"].split(",")
@@ -429,7 +565,7 @@ def _parse_seabird_file_header(f, xml_parsing_error_level="ERROR"):
     def parse_xml(xml_section, error_level="ERROR"):
         """Parse XML section."""
         try:
-            return xmltodict.parse(f"<temp>{xml_section}</temp>")["temp"]
+            return _parse_xml(f"<temp>{xml_section}</temp>")["temp"]
         except ExpatError:
             logger.log(
                 logging.getLevelName(error_level),
@@ -467,6 +603,11 @@ def _parse_seabird_file_header(f, xml_parsing_error_level="ERROR"):
         "comments": [],
         "seabird_header": "",
     }
+    line_readers = {
+        "comment": read_comments,
+        "asterisk": read_asterisk_line,
+        "hash": read_hash_line,
+    }
     read_next_line = True
     while "*END*" not in line and line.startswith(("*", "#")):
         if read_next_line:
@@ -475,23 +616,27 @@ def _parse_seabird_file_header(f, xml_parsing_error_level="ERROR"):
             read_next_line = True
 
         # Ignore empty lines or last header line
-        if line in IGNORED_HEADER_LINES or "*END*" in line:
+        if line in _ignored_header_lines or "*END*" in line:
             continue
-        elif re.match(r"(\*|\#)\s*\<", line):
+
+        line_type = sbe_header_line_type.match(line)
+        line_type = line_type.lastgroup if line_type else None
+        if line_type == "xml":
             # Load XML header
             # Retriveve the whole block of XML header
             xml_section = ""
             first_character = line[0]
+            xml_line_start = sbe_xml_line_start[first_character]
             while (
-                re.match(rf"\{first_character}\s*\<", line)
-                or re.search(r"\>\s*$", line)
+                xml_line_start.match(line)
+                or sbe_xml_line_end.search(line)
                 or line.startswith("** ")
                 or line.startswith("* cast")
-                or line in IGNORED_HEADER_LINES
+                or line in _ignored_header_lines
             ):
                 if "**" in line:
                     read_comments(line)
-                elif line in IGNORED_HEADER_LINES:
+                elif line in _ignored_header_lines:
                     line = _read_next_line()
                     continue
                 elif line.startswith("* cast"):
@@ -511,15 +656,11 @@ def _parse_seabird_file_header(f, xml_parsing_error_level="ERROR"):
                 header[section_name] = xml_dictionary
 
             read_next_line = False
-        elif line.startswith("** "):
-            read_comments(line)
-        elif line.startswith("* "):
-            read_asterisk_line(line)
-        elif line.startswith("# "):
-            read_hash_line(line)
-        elif re.match(r"\s*Bottle\s+Date", line):
+        elif line_type == "bottle":
             _parse_seabird_bottle_header(line)
             break
+        elif line_type in line_readers:
+            line_readers[line_type](line)
         else:
             logger.warning("Unknown line format: %s", line.strip())
     # Remap variables to seabird variables
@@ -612,6 +753,10 @@ seabird_to_bodc = {
     "User Polynomial, 3": [],
     "Nitrate": ["NTRAZZXX"],
 }
+seabird_to_bodc_urns = {
+    name: [f"SDN:P01::{code}" for code in codes]
+    for name, codes in seabird_to_bodc.items()
+}
 
 
 def _get_seabird_instrument_from_header(seabird_header: str) -> str:
@@ -723,7 +868,7 @@ def _generate_instruments_variables_from_xml(
 
     # Read XML and commented lines, drop encoding line
     try:
-        sensors = xmltodict.parse(calibration_xml)["Sensors"]["sensor"]
+        sensors = _parse_xml(calibration_xml)["Sensors"]["sensor"]
     except ExpatError:
         logger.error("Failed to parsed Sea-Bird Instrument Calibration XML")
         return ds, {}
@@ -827,6 +972,22 @@ def _generate_instruments_variables_from_sensor(
     return dataset
 
 
+def _get_variables_by_attribute(ds: xarray.Dataset, attribute: str) -> dict:
+    """Index the dataset data variables by the value of a given attribute."""
+    variables_index = {}
+    for var, variable in ds.data_vars.items():
+        value = variable.attrs.get(attribute)
+        if isinstance(value, str):
+            variables_index.setdefault(value, []).append(var)
+    return variables_index
+
+
+@lru_cache(maxsize=256)
+def _get_closest_long_names(name: str, long_names: tuple) -> list:
+    """Retrieve the variables long names the closest to a sensor name."""
+    return difflib.get_close_matches(name, long_names)
+
+
 def _add_seabird_instruments(
     ds: xarray.Dataset, seabird_header: str, match_by: str = "long_name"
 ) -> xarray.Dataset:
@@ -848,18 +1009,19 @@ def _add_seabird_instruments(
         return ds
 
     # Match instrument variables to their associated variables
+    variables_index = _get_variables_by_attribute(ds, match_by)
     for name, sensor_variable in sensors_map.items():
         if match_by == "sdn_parameter_urn":
-            if name not in seabird_to_bodc:
+            if name not in seabird_to_bodc_urns:
                 logger.warning("Missing Seabird to BODC mapping of: %s", name)
                 continue
-            values = [f"SDN:P01::{item}" for item in seabird_to_bodc[name]]
+            values = seabird_to_bodc_urns[name]
         else:
             values = [name]
 
         has_matched = False
         for value in values:
-            matched_variables = ds.filter_by_attrs(**{match_by: value})
+            matched_variables = variables_index.get(value, [])
 
             # Some variables are not necessearily BODC specifc
             # we'll try to match them based on the long_name
@@ -869,19 +1031,14 @@ def _add_seabird_instruments(
                 and ("Fluorometer" in name or "Turbidity" in name)
             ):
                 # Find the closest match based on the file name
-                var_longname = difflib.get_close_matches(
+                var_longname = _get_closest_long_names(
                     name,
-                    [
-                        matched_variables[var].attrs["long_name"]
-                        for var in matched_variables
-                    ],
+                    tuple(ds[var].attrs["long_name"] for var in matched_variables),
                 )
-                matched_variables = matched_variables[
-                    [
-                        var
-                        for var in matched_variables
-                        if ds[var].attrs["long_name"] in var_longname
-                    ]
+                matched_variables = [
+                    var
+                    for var in matched_variables
+                    if ds[var].attrs["long_name"] in var_longname
                 ]
 
                 # If there's still multiple matches give a warning
@@ -11,6 +11,8 @@ import re
 import pandas as pd
 import xarray
 
+from ocean_data_parser.parsers.utils import apply_dtype_policy
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_GLOBAL_ATTRIBUTES = {"instrument_manufacturer": "Star-Oddi", "source": None}
@@ -39,18 +41,24 @@ VARIABLES_ATTRIBUTES = {
 }
 
 
-def DAT(path: str, encoding: str = "cp1252") -> xarray.Dataset:  # noqa
+def DAT(  # noqa
+    path: str, encoding: str = "cp1252", dtype_policy: str = "default"
+) -> xarray.Dataset:
     """Deprecated Star-Oddi DAT files parser."""
     logger.warning("Function name DAT is deprecated, use dat instead.")
-    return dat(path, encoding)
+    return dat(path, encoding, dtype_policy=dtype_policy)
 
 
-def dat(path: str, encoding: str = "cp1252") -> xarray.Dataset:
+def dat(
+    path: str, encoding: str = "cp1252", dtype_policy: str = "default"
+) -> xarray.Dataset:
     """Parse Star-Oddi DAT files.
 
     Args:
         path (str): DAT file path
         encoding (str, optional): Encoding used. Defaults to "cp1252".
+        dtype_policy (str, optional): dtype policy applied to the data
+            (see `utils.apply_dtype_policy`). Defaults to "default".
 
     Returns:
         xarray.Dataset: Dataset
@@ -121,6 +129,7 @@ def dat(path: str, encoding: str = "cp1252") -> xarray.Dataset:
             date_format=date_format,
             dayfirst=True,
         )
+        df = apply_dtype_policy(df, dtype_policy)
         if "time" in df:
             df = df.set_index(["time"])
 
@@ -1,8 +1,11 @@
 import json
 import logging
 import re
+import weakref
 from datetime import datetime
-from io import StringIO
+from io import BytesIO, StringIO
+from pathlib import Path
+from typing import Union
 
 import numpy as np
 import pandas as pd
@@ -17,6 +20,47 @@ time_variables_default_encoding = {
 
 object_variables_default_encoding = {"dtype": "str"}
 
+# NetCDF compression/chunking presets applied to numeric and time variables.
+#  - chunk_size: maximum number of elements per chunk
+#  - chunk_dimension: dimension favoured when generating the chunks
+ENCODING_PRESETS = {
+    "fast-write": {"zlib": False, "contiguous": True},
+    "small": {"zlib": True, "complevel": 9, "shuffle": True, "chunk_size": 2**20},
+    "timeseries-read": {
+        "zlib": True,
+        "complevel": 4,
+        "shuffle": True,
+        "chunk_size": 2**16,
+        "chunk_dimension": "time",
+    },
+}
+PACKED_DTYPES = ("int16", "int32")
+DTYPE_POLICIES = ("default", "compact")
+# Maximum number of decimals inferred from the values of a float variable
+MAX_DECIMALS = 8
+# Longest strings stored as fixed width bytes by the compact dtype policy,
+# which are never larger than the object array references
+MAX_COMPACT_STRING_LENGTH = 8
+# Dataset encoding key used to store the state of the last standardization
+STANDARDIZED_FINGERPRINT = "standardized_fingerprint"
+# Dataset encoding key used to cache the variables statistics
+VARIABLE_STATISTICS = "variable_statistics"
+STATISTICS_CHUNK_SIZE = 2**16
+# Number of values compared to detect the data modified in place
+FINGERPRINT_SAMPLE_SIZE = 1024
+COVERAGE_VARIABLES = ("time", "latitude", "longitude", "depth")
+# Engines available to read whitespace delimited data tables
+TEXT_READER_ENGINES = ("pandas-c", "pyarrow", "numpy-fixed-width")
+BLANK_CHARACTERS = (0, ord("\t"), ord("\r"), ord(" "))
+NETCDF_ENCODING_KEYS = (
+    "zlib",
+    "complevel",
+    "shuffle",
+    "chunksizes",
+    "contiguous",
+    "fletcher32",
+)
+
 
 def test_attribute_names(dataset):
     """Test if attributes names are valid."""
@@ -129,6 +173,7 @@ def generate_variables_encoding(
     object_variables_encoding=None,
     time_variables_encoding: dict = None,
     utc: bool = True,
+    encoding_preset: Union[str, dict] = None,
 ):
     """Generate time variables encoding.
 
@@ -144,31 +189,39 @@ def generate_variables_encoding(
                 + dtype="float64"
         utc (bool, optional): Assign UTC timezone and converte
             timezone aware timestamps to UTC. Defaults to True.
+        encoding_preset (str, dict, optional): Compression and chunking
+            preset to apply (see `apply_encoding_preset`). Defaults to None.
 
     Returns:
         xr..Dataset: Dataset with encoding attribute generated.
     """
     for var in variables or ds.variables:
         ds.encoding[var] = {}
-        if "datetime" in ds[var].dtype.name:
+        # Dispatch on the dtype to only inspect the values of object arrays
+        kind = ds[var].dtype.kind
+        if kind == "M":
             ds[var].encoding.update(
                 time_variables_encoding or time_variables_default_encoding
             )
             if "tz" in ds[var].dtype.name or utc:
                 ds[var].encoding["units"] += "Z"
             ds[var].attrs.pop("units", None)
-        elif isinstance(ds[var].dtype, object) and isinstance(
-            ds[var].item(0), pd.Timestamp
-        ):
-            timezone_aware = bool(ds[var].item(0).tz)
+        elif kind == "S":
+            # Fixed width bytes are saved as strings like the object variables
+            ds[var].encoding.update(
+                object_variables_encoding or object_variables_default_encoding
+            )
+        elif kind != "O":
+            continue
+        elif ds[var].size and isinstance(ds[var].values.flat[0], pd.Timestamp):
+            # Timestamp objects are converted in one vectorized call
+            values = ds[var].values
+            timezone_aware = bool(values.flat[0].tz)
+            times = pd.to_datetime(values.ravel(), utc=timezone_aware)
+            if timezone_aware:
+                times = times.tz_convert(None)
             var_attrs = ds[var].attrs
-            if ds[var].size == 1:
-                ds[var] = ds[var].item(0).tz_convert(None)
-            else:
-                ds[var] = (
-                    ds[var].dims,
-                    pd.to_datetime(ds[var].values, utc=timezone_aware).tz_convert(None),
-                )
+            ds[var] = (ds[var].dims, times.values.reshape(values.shape))
             ds[var].attrs = var_attrs
             ds[var].encoding.update(
                 time_variables_encoding or time_variables_default_encoding
@@ -177,11 +230,301 @@ def generate_variables_encoding(
             if timezone_aware:
                 ds[var].attrs["timezone"] = "UTC"
                 ds[var].encoding["units"] += "Z"
-
-        elif ds[var].dtype.name == "object":
+        else:
             ds[var].encoding.update(
                 object_variables_encoding or object_variables_default_encoding
             )
+    if encoding_preset:
+        ds = apply_encoding_preset(ds, encoding_preset)
+    return ds
+
+
+def _get_chunksizes(
+    dims: tuple, shape: tuple, chunk_size: int, chunk_dimension: str = None
+) -> tuple:
+    """Generate chunk sizes from the dimensions lengths.
+
+    Chunks are filled from the last dimension to the first one,
+    the chunk_dimension is filled first if present.
+    """
+    order = list(range(len(dims)))[::-1]
+    if chunk_dimension in dims:
+        order.remove(dims.index(chunk_dimension))
+        order.insert(0, dims.index(chunk_dimension))
+
+    chunks = [1] * len(dims)
+    remaining = chunk_size
+    for index in order:
+        chunks[index] = max(1, min(shape[index], remaining))
+        remaining = max(1, remaining // chunks[index])
+    return tuple(chunks)
+
+
+def apply_encoding_preset(
+    ds: xr.Dataset, preset: Union[str, dict], variables: list = None
+) -> xr.Dataset:
+    """Apply a compression and chunking encoding preset to the dataset variables.
+
+    The preset is resolved for each numeric and time variables with at
+    least one dimension. Chunk sizes are derived from the variable dimensions
+    lengths. String and scalar variables are left unchanged.
+
+    Args:
+        ds (xr.Dataset): Dataset
+        preset (str, dict): Preset name (fast-write, small, timeseries-read)
+            or a dictionary with a "preset" key and a "variables" key
+            which lists variable specific encoding to apply over the preset.
+        variables (list, optional): List of variables to encode.
+            Defaults to all variables.
+
+    Returns:
+        xr.Dataset: Dataset with encoding updated.
+    """
+    variables_encoding = {}
+    if isinstance(preset, dict):
+        variables_encoding = preset.get("variables") or {}
+        preset = preset.get("preset")
+    if preset and preset not in ENCODING_PRESETS:
+        raise ValueError(
+            f"Unknown encoding preset {preset}, "
+            f"should be one of {list(ENCODING_PRESETS.keys())}"
+        )
+
+    preset_encoding = ENCODING_PRESETS.get(preset, {})
+    for var in variables or ds.variables:
+        if ds[var].ndim == 0 or ds[var].dtype.kind not in "fiubM":
+            continue
+
+        encoding = {
+            key: value
+            for key, value in ds[var].encoding.items()
+            if key not in NETCDF_ENCODING_KEYS
+        }
+        encoding.update(
+            {
+                key: value
+                for key, value in preset_encoding.items()
+                if key in NETCDF_ENCODING_KEYS
+            }
+        )
+        if preset_encoding.get("chunk_size"):
+            encoding["chunksizes"] = _get_chunksizes(
+                ds[var].dims,
+                ds[var].shape,
+                preset_encoding["chunk_size"],
+                preset_encoding.get("chunk_dimension"),
+            )
+        encoding.update(variables_encoding.get(var, {}))
+        ds[var].encoding = encoding
+    return ds
+
+
+def pack_variables(
+    ds: xr.Dataset,
+    resolutions: dict = None,
+    variables: list = None,
+    resolution_attribute: str = "resolution",
+    dtypes: tuple = PACKED_DTYPES,
+) -> xr.Dataset:
+    """Pack float variables as integers based on their resolution.
+
+    The smallest integer dtype able to hold the variable range at the
+    given resolution is used with the associated `scale_factor` and
+    `add_offset` encoding. Variables are packed only if the round-trip
+    error stays within the resolution. Flag variables and variables
+    without resolution are left unchanged.
+
+    Args:
+        ds (xr.Dataset): Dataset
+        resolutions (dict, optional): Variable specific resolutions which
+            overwrite the resolution attribute. Defaults to None.
+        variables (list, optional): List of variables to pack.
+            Defaults to all variables.
+        resolution_attribute (str, optional): Variable attribute used to
+            retrieve the resolution. Defaults to "resolution".
+        dtypes (tuple, optional): Integer dtypes to consider by order
+            of preference. Defaults to ("int16", "int32").
+
+    Returns:
+        xr.Dataset: Dataset with packing encoding.
+    """
+    resolutions = resolutions or {}
+    for var in variables or ds.variables:
+        resolution = resolutions.get(var, ds[var].attrs.get(resolution_attribute))
+        if (
+            not resolution
+            or ds[var].dtype.kind != "f"
+            or "flag_values" in ds[var].attrs
+            or ds[var].size == 0
+        ):
+            continue
+
+        values = ds[var].values
+        if "actual_range" in ds[var].attrs:
+            value_min, value_max = ds[var].attrs["actual_range"]
+        else:
+            value_min, value_max = np.nanmin(values), np.nanmax(values)
+        if not np.isfinite([value_min, value_max]).all():
+            continue
+
+        add_offset = round((value_min + value_max) / 2 / resolution) * resolution
+        packed = np.round((values - add_offset) / resolution)
+        max_step = np.nanmax(np.abs(packed))
+        dtype = next(
+            (dtype for dtype in dtypes if max_step < np.iinfo(dtype).max), None
+        )
+        if dtype is None:
+            logger.info("Unable to pack %s within %s", var, dtypes)
+            continue
+
+        error = np.nanmax(np.abs(packed * resolution + add_offset - values))
+        if error > resolution:
+            logger.warning(
+                "Unable to pack %s, round-trip error %s > resolution %s",
+                var,
+                error,
+                resolution,
+            )
+            continue
+
+        ds[var].encoding.update(
+            {
+                "dtype": dtype,
+                "scale_factor": resolution,
+                "add_offset": add_offset,
+                "_FillValue": np.iinfo(dtype).min,
+            }
+        )
+    return ds
+
+
+def _is_flag_variable(name: str, attrs: dict) -> bool:
+    return (
+        "flag_values" in attrs
+        or "flag_meanings" in attrs
+        or bool(re.fullmatch(r"Q[A-Z0-9_]+", name))
+        or bool(re.search(r"(_flag|_qc)$", name, re.IGNORECASE))
+    )
+
+
+def _get_decimal_resolution(values: np.ndarray) -> float:
+    """Get the decimal resolution of float values parsed from text.
+
+    The smallest number of decimals is first retrieved from a sample of
+    the values and then validated on all the values.
+
+    Args:
+        values (np.ndarray): float values
+
+    Returns:
+        float: decimal resolution (ex: 0.001 for 3 decimals) or None
+            if the values have more than MAX_DECIMALS decimals.
+    """
+    values = values[np.isfinite(values)]
+    sample = values[:: -(-values.size // FINGERPRINT_SAMPLE_SIZE) or 1]
+    for decimals in range(MAX_DECIMALS + 1):
+        for subset in (sample, values):
+            scaled = subset * 10.0**decimals
+            if not np.all(
+                np.abs(scaled - np.rint(scaled)) <= 1e-9 * np.maximum(np.abs(scaled), 1)
+            ):
+                break
+        else:
+            return 10.0**-decimals
+
+
+def _get_compact_dtype(name: str, values: np.ndarray, attrs: dict) -> str:
+    """Get the compact dtype of a variable or None if it can't be compacted."""
+    if values.size == 0:
+        return
+    elif _is_flag_variable(name, attrs) and values.dtype.kind in "iuf":
+        is_integer = values.dtype.kind in "iu" or (
+            np.isfinite(values).all() and (np.mod(values, 1) == 0).all()
+        )
+        if (
+            is_integer
+            and values.min() >= np.iinfo("int8").min
+            and values.max() <= np.iinfo("int8").max
+        ):
+            return "int8"
+    elif values.dtype == "float64":
+        resolution = attrs.get("resolution") or _get_decimal_resolution(values)
+        if resolution is None:
+            return
+        error = np.nanmax(np.abs(values.astype("float32") - values), initial=0)
+        if error <= resolution / 2:
+            return "float32"
+    elif values.dtype.kind == "O" and pd.api.types.infer_dtype(values) == "string":
+        try:
+            strings = values.astype("S")
+        except UnicodeEncodeError:
+            return
+        if strings.itemsize <= MAX_COMPACT_STRING_LENGTH and not any(
+            value.endswith("\x00") for value in values.flat
+        ):
+            return strings.dtype.str
+
+
+def apply_dtype_policy(
+    ds: Union[xr.Dataset, pd.DataFrame], dtype_policy: str = "default"
+) -> Union[xr.Dataset, pd.DataFrame]:
+    """Apply a dtype policy to the dataset variables to reduce its memory footprint.
+
+    Parsers accepting a `dtype_policy` argument apply the policy to the data
+    table they read, before generating the dataset, to reduce their peak memory.
+
+    Available policies:
+        - default: leave the dataset unchanged
+        - compact:
+            - float64 -> float32 if the cast error is within half the variable
+              resolution attribute or, if missing, the decimal resolution of
+              the values (ex: 0.001 for values with 3 decimals)
+            - integer flag variables (with `flag_values` or `flag_meanings`
+              attributes, or named `Q[A-Z0-9_]+`, `*_flag` or `*_qc`) -> int8
+            - dataset string variables (not dataframe columns) of ASCII
+              values of at most MAX_COMPACT_STRING_LENGTH characters ->
+              fixed width bytes, saved as strings to NetCDF
+
+    Args:
+        ds (xr.Dataset, pd.DataFrame): Dataset or dataframe
+        dtype_policy (str, optional): Policy to apply. Defaults to "default".
+
+    Returns:
+        xr.Dataset, pd.DataFrame: Dataset or dataframe with the dtype policy applied
+    """
+    if dtype_policy not in DTYPE_POLICIES:
+        raise ValueError(
+            f"Unknown dtype_policy {dtype_policy}, should be one of {DTYPE_POLICIES}"
+        )
+    if dtype_policy == "default":
+        return ds
+
+    if isinstance(ds, pd.DataFrame):
+        for column in ds.columns:
+            values = ds[column].to_numpy()
+            if values.dtype.kind == "O":
+                continue
+            dtype = _get_compact_dtype(str(column), values, {})
+            if dtype:
+                ds[column] = values.astype(dtype)
+        return ds
+
+    for var in ds.variables:
+        variable = ds[var]
+        if var in ds.dims:
+            continue
+        dtype = _get_compact_dtype(var, variable.values, variable.attrs)
+        if dtype is None:
+            continue
+        ds[var] = variable.astype(dtype)
+        ds[var].attrs = variable.attrs
+        ds[var].encoding = variable.encoding
+        if ds[var].dtype.kind == "S":
+            ds[var].encoding["dtype"] = "str"
+        if "actual_range" in ds[var].attrs:
+            ds[var].attrs["actual_range"] = np.array(
+                ds[var].attrs["actual_range"]
+            ).astype(dtype)
     return ds
 
 
@@ -204,6 +547,165 @@ def sort_attributes(attrs: dict, attribute_order: list) -> dict:
     return {**attrs_output, **unknown_order_attrs}
 
 
+class _DataFingerprint:
+    """Fingerprint of a variable data generated from its metadata.
+
+    The fingerprint identifies the array owning the variable memory, which
+    is weakly referenced to make sure that a released array id isn't reused,
+    and a sample of FINGERPRINT_SAMPLE_SIZE evenly spaced values to detect
+    the data modified in place. Smaller arrays are entirely compared.
+    """
+
+    __slots__ = ("key", "owner")
+
+    def __init__(self, variable: xr.Variable):
+        data = variable.data
+        owner = data
+        while isinstance(getattr(owner, "base", None), np.ndarray):
+            owner = owner.base
+        try:
+            self.owner = weakref.ref(owner)
+        except TypeError:
+            self.owner = None
+        interface = getattr(data, "__array_interface__", {})
+        sample = None
+        if isinstance(data, np.ndarray) and data.size:
+            step = -(-data.size // FINGERPRINT_SAMPLE_SIZE)
+            indexes = np.append(np.arange(0, data.size, step), data.size - 1)
+            sample = data.flat[indexes].tobytes()
+        self.key = (
+            variable.dims,
+            str(variable.dtype),
+            variable.shape,
+            id(owner),
+            interface.get("data"),
+            interface.get("strides"),
+            sample,
+        )
+
+    def __eq__(self, other) -> bool:
+        return (
+            isinstance(other, _DataFingerprint)
+            and self.key == other.key
+            and self.owner is not None
+            and other.owner is not None
+            and self.owner() is other.owner() is not None
+        )
+
+    def __getstate__(self):
+        # Weak references can't be pickled and never match once unpickled
+        return self.key
+
+    def __setstate__(self, state):
+        self.key, self.owner = state, None
+
+
+def _get_variable_fingerprint(variable: xr.Variable) -> tuple:
+    """Generate a cheap fingerprint of a variable data and attributes."""
+    return _DataFingerprint(variable), repr(list(variable.attrs.items()))
+
+
+def compute_statistics(values: np.ndarray) -> dict:
+    """Compute the statistics of a numeric array in a single pass.
+
+    The array is processed by chunks of STATISTICS_CHUNK_SIZE elements
+    which are small enough to stay in the CPU cache while the minimum,
+    maximum and counts are computed. NaN and NaT values are ignored.
+
+    Args:
+        values (np.ndarray): float, integer or datetime64 array
+
+    Returns:
+        dict: min, max, count (not NaN/NaT) and finite_count values
+            or None if the array is empty or not numeric.
+    """
+    values = np.asarray(values).ravel()
+    kind = values.dtype.kind
+    if kind not in "fiuM" or values.size == 0:
+        return None
+
+    data = values.view("int64") if kind == "M" else values
+    nat = np.iinfo("int64").min
+    minimums, maximums = [], []
+    count = finite_count = 0
+    for start in range(0, data.size, STATISTICS_CHUNK_SIZE):
+        chunk = data[start : start + STATISTICS_CHUNK_SIZE]
+        if kind == "f":
+            # fmin/fmax ignore NaN values
+            minimums.append(np.fmin.reduce(chunk))
+            maximums.append(np.fmax.reduce(chunk))
+            n_finite = np.count_nonzero(np.isfinite(chunk))
+            finite_count += n_finite
+            if np.isinf(minimums[-1]) or np.isinf(maximums[-1]):
+                count += chunk.size - np.count_nonzero(np.isnan(chunk))
+            else:
+                count += n_finite
+        elif kind == "M":
+            is_valid = chunk != nat
+            n_valid = np.count_nonzero(is_valid)
+            if n_valid:
+                minimums.append(
+                    np.min(chunk, where=is_valid, initial=np.iinfo("int64").max)
+                )
+                maximums.append(np.max(chunk, where=is_valid, initial=nat))
+            count += n_valid
+            finite_count += n_valid
+        else:
+            minimums.append(chunk.min())
+            maximums.append(chunk.max())
+            count += chunk.size
+            finite_count += chunk.size
+
+    if kind == "f":
+        minimum, maximum = np.fmin.reduce(minimums), np.fmax.reduce(maximums)
+    elif kind == "M":
+        minimum, maximum = (min(minimums), max(maximums)) if minimums else (nat, nat)
+        minimum = np.int64(minimum).view(values.dtype)
+        maximum = np.int64(maximum).view(values.dtype)
+    else:
+        minimum, maximum = min(minimums), max(maximums)
+    return {
+        "min": minimum,
+        "max": maximum,
+        "count": int(count),
+        "finite_count": int(finite_count),
+    }
+
+
+def get_variable_statistics(ds: xr.Dataset, variable: str) -> dict:
+    """Get a variable statistics.
+
+    Statistics are cached within the dataset encoding and reused as long
+    as the variable data fingerprint, which samples the data values,
+    is unchanged. The cache is reset by each complete standardization.
+
+    Args:
+        ds (xr.Dataset): Dataset
+        variable (str): Variable name
+
+    Returns:
+        dict: min, max, count and finite_count values (see `compute_statistics`)
+    """
+    fingerprint = _DataFingerprint(ds.variables[variable])
+    cache = ds.encoding.setdefault(VARIABLE_STATISTICS, {})
+    if variable in cache and cache[variable][0] == fingerprint:
+        return cache[variable][1]
+    statistics = compute_statistics(ds[variable].values)
+    cache[variable] = (fingerprint, statistics)
+    return statistics
+
+
+def _to_python_scalar(value):
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _get_min_max(ds: xr.Dataset, variable: str) -> tuple:
+    statistics = get_variable_statistics(ds, variable)
+    if statistics is None:
+        return ds[variable].min().item(0), ds[variable].max().item(0)
+    return statistics["min"], statistics["max"]
+
+
 def standardize_dataset(
     ds: xr.Dataset, time_variables_encoding: dict = None, utc: bool = True
 ) -> xr.Dataset:
@@ -216,6 +718,12 @@ def standardize_dataset(
         - Define time variables encoding
         - Verify attribute names.
 
+    A fingerprint of the standardized dataset is stored within the dataset
+    encoding. Following calls only standardize the variables and attributes
+    modified since the last standardization. Variables modified in place are
+    detected from a sample of their values, drop `STANDARDIZED_FINGERPRINT`
+    from the dataset encoding to standardize again the whole dataset.
+
     Args:
         ds (xr.Dataset): Dataset to standardized
         time_variables_encoding (dict, optional): Time variables encoding.
@@ -227,13 +735,56 @@ def standardize_dataset(
     Returns:
         xr.Dataset: Standardized dataset
     """
-    ds = get_spatial_coverage_attributes(ds, utc=utc)
-    ds = standardize_variable_attributes(ds)
-    ds.attrs = standardize_global_attributes(ds.attrs)
-    ds = generate_variables_encoding(
-        ds, time_variables_encoding=time_variables_encoding, utc=utc
-    )
+    options = (repr(time_variables_encoding), utc)
+    previous = ds.encoding.get(STANDARDIZED_FINGERPRINT)
+    if not previous or previous["options"] != options:
+        variables = list(ds.variables)
+        update_coverage = update_attrs = True
+        ds.encoding.pop(VARIABLE_STATISTICS, None)
+    else:
+        fingerprints = {
+            var: _get_variable_fingerprint(variable)
+            for var, variable in ds.variables.items()
+        }
+        variables = [
+            var
+            for var in ds.variables
+            if previous["variables"].get(var) != fingerprints[var]
+        ]
+        dropped = set(previous["variables"]) - set(ds.variables)
+        update_coverage = any(
+            var in COVERAGE_VARIABLES for var in [*variables, *dropped]
+        )
+        update_attrs = update_coverage or previous["attrs"] != repr(
+            list(ds.attrs.items())
+        )
+        if not variables and not update_attrs:
+            logger.debug("Dataset is already standardized")
+            return ds
+
+    if update_coverage:
+        ds = get_spatial_coverage_attributes(ds, utc=utc)
+    if variables:
+        ds = standardize_variable_attributes(ds, variables=variables)
+    if update_attrs:
+        ds.attrs = standardize_global_attributes(ds.attrs)
+    if variables:
+        ds = generate_variables_encoding(
+            ds,
+            variables=variables,
+            time_variables_encoding=time_variables_encoding,
+            utc=utc,
+        )
     test_attribute_names(ds)
+
+    ds.encoding[STANDARDIZED_FINGERPRINT] = {
+        "options": options,
+        "attrs": repr(list(ds.attrs.items())),
+        "variables": {
+            var: _get_variable_fingerprint(variable)
+            for var, variable in ds.variables.items()
+        },
+    }
     return ds
 
 
@@ -243,9 +794,9 @@ def standardize_global_attributes(attrs):
     return sort_attributes(attrs, global_attributes_order)
 
 
-def standardize_variable_attributes(ds):
+def standardize_variable_attributes(ds, variables: list = None):
     """Method to generate simple generic variable attributes and reorder attributes in a consistent order."""
-    for var in ds.variables:
+    for var in variables or ds.variables:
         # Generate min/max values attributes
         if (
             ds[var].dtype in [float, int, "float32", "float64", "int64", "int32"]
@@ -253,9 +804,7 @@ def standardize_variable_attributes(ds):
             and ds[var].size > 0
         ):
             ds[var].attrs["actual_range"] = np.array(
-                np.array((ds[var].min().item(0), ds[var].max().item(0))).astype(
-                    ds[var].dtype
-                )
+                np.array(_get_min_max(ds, var)).astype(ds[var].dtype)
             )
         ds[var].attrs = standardize_attributes(ds[var].attrs)
         ds[var].attrs = sort_attributes(ds[var].attrs, variable_attributes_order)
@@ -275,14 +824,13 @@ def get_spatial_coverage_attributes(
     # time
     if time in ds.variables and ds[time].size > 0:
         is_utc = ds[time].attrs.get("timezone") == "UTC" or utc
+        time_min, time_max = _get_min_max(ds, time)
         ds.attrs.update(
             {
-                "time_coverage_start": pd.to_datetime(
-                    ds[time].min().item(0), utc=is_utc
-                ),
-                "time_coverage_end": pd.to_datetime(ds[time].max().item(0), utc=is_utc),
+                "time_coverage_start": pd.to_datetime(time_min, utc=is_utc),
+                "time_coverage_end": pd.to_datetime(time_max, utc=is_utc),
                 "time_coverage_duration": pd.to_timedelta(
-                    (ds[time].max() - ds[time].min()).values
+                    time_max - time_min
                 ).isoformat(),
             }
         )
@@ -294,24 +842,27 @@ def get_spatial_coverage_attributes(
         and ds[lat].size > 0
         and ds[lon].size > 0
     ):
+        lat_min, lat_max = _get_min_max(ds, lat)
+        lon_min, lon_max = _get_min_max(ds, lon)
         ds.attrs.update(
             {
-                "geospatial_lat_min": ds[lat].min().item(0),
-                "geospatial_lat_max": ds[lat].max().item(0),
+                "geospatial_lat_min": _to_python_scalar(lat_min),
+                "geospatial_lat_max": _to_python_scalar(lat_max),
                 "geospatial_lat_units": ds[lat].attrs.get("units"),
-                "geospatial_lon_min": ds[lon].min().item(0),
-                "geospatial_lon_max": ds[lon].max().item(0),
+                "geospatial_lon_min": _to_python_scalar(lon_min),
+                "geospatial_lon_max": _to_python_scalar(lon_max),
                 "geospatial_lon_units": ds[lon].attrs.get("units"),
             }
         )
 
     # depth coverage
     if depth in ds.variables and ds[depth].size > 0:
+        depth_min, depth_max = _get_min_max(ds, depth)
         ds["depth"].attrs["positive"] = ds["depth"].attrs.get("positive", "down")
         ds.attrs.update(
             {
-                "geospatial_vertical_min": ds[depth].min().item(0),
-                "geospatial_vertical_max": ds[depth].max().item(0),
+                "geospatial_vertical_min": _to_python_scalar(depth_min),
+                "geospatial_vertical_max": _to_python_scalar(depth_max),
                 "geospatial_vertical_units": ds[depth].attrs["units"],
                 "geospatial_vertical_positive": "down",
             }
@@ -346,6 +897,248 @@ def convert_datetime_str(time_str: str, **to_datetime_kwargs) -> pd.Timestamp:
     return pd.to_datetime(time_str, **to_datetime_kwargs)
 
 
+def _get_lines_array(data: bytes) -> np.ndarray:
+    """Convert text lines to a 2D array of characters (uint8)."""
+    data = data.rstrip(b"\n")
+    line_length = data.find(b"\n") + 1
+    if line_length and (len(data) + 1) % line_length == 0:
+        # Lines of equal length are viewed without copy
+        lines = np.frombuffer(data + b"\n", dtype=np.uint8).reshape(-1, line_length)
+        if (lines[:, -1] == ord("\n")).all():
+            return lines[:, :-1]
+    lines = np.array(data.split(b"\n"), dtype=bytes)
+    return lines.view(np.uint8).reshape(lines.size, -1)
+
+
+def _get_fixed_width_columns(lines: np.ndarray, min_gap: int = 1) -> list:
+    """Detect the columns of a fixed width table.
+
+    A column ends where a character is followed by at least
+    min_gap characters which are blank in every line.
+    Each column includes the blank characters preceding its value.
+
+    Args:
+        lines (np.ndarray): 2D array of characters
+        min_gap (int, optional): Minimum number of blank characters
+            separating two columns. Defaults to 1.
+
+    Returns:
+        list: list of (start, end) column positions
+            or None if the lines can't be split in fixed width columns
+    """
+    is_blank = np.isin(lines, BLANK_CHARACTERS)
+    # Columns are separated by a blank gap in every line
+    blank_columns = np.append(is_blank.all(axis=0), [True] * min_gap)
+    gaps = np.ones(lines.shape[1], dtype=bool)
+    for shift in range(1, min_gap + 1):
+        gaps &= blank_columns[shift : shift + lines.shape[1]]
+    ends = np.flatnonzero(~blank_columns[: lines.shape[1]] & gaps) + 1
+    starts = np.append(0, ends[:-1])
+
+    # Each line should have a single value starting within each column
+    is_gap = np.ones(is_blank.shape, dtype=bool)
+    for shift in range(1, min_gap + 1):
+        is_gap[:, shift:] &= is_blank[:, :-shift]
+    value_starts = ~is_blank & is_gap
+    if not len(starts) or (np.add.reduceat(value_starts, starts, axis=1) != 1).any():
+        return None
+    return list(zip(starts, ends))
+
+
+def _decode_fixed_width_column(
+    column: np.ndarray,
+    dtype,
+    na_values: list,
+    engine: str,
+    encoding: str = "UTF-8",
+    encoding_errors: str = "strict",
+) -> np.ndarray:
+    values = np.ascontiguousarray(column).view(f"S{column.shape[1]}").ravel()
+    if dtype is None:
+        # Infer dtype like pandas: integer, float or string
+        for inferred_dtype in ("int64", "float64"):
+            try:
+                return _decode_fixed_width_column(
+                    column, inferred_dtype, na_values, engine, encoding, encoding_errors
+                )
+            except ValueError:
+                continue
+        dtype = str
+    dtype = np.dtype(dtype)
+    if dtype.kind in "OUS":
+        values = np.char.decode(values, encoding, encoding_errors)
+        return np.char.strip(values).astype(object)
+    elif engine == "pyarrow":
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        values = pc.utf8_trim_whitespace(pa.array(values).cast(pa.string()))
+        values = pc.cast(values, pa.from_numpy_dtype(dtype)).to_numpy()
+    else:
+        values = values.astype(dtype)
+    if na_values and dtype.kind in "fiu":
+        is_null = np.isin(values, na_values)
+        if is_null.any():
+            values = np.where(is_null, np.nan, values)
+    return values
+
+
+def read_whitespace_table(
+    file,
+    names: list,
+    dtype: Union[dict, type] = float,
+    na_values: list = None,
+    engine: str = "pandas-c",
+    min_gap: int = 1,
+    quotechar: str = None,
+    float_precision: str = None,
+    encoding: str = "UTF-8",
+    encoding_errors: str = "strict",
+    **kwargs,
+) -> pd.DataFrame:
+    """Read a whitespace delimited data table.
+
+    Available engines:
+        - pandas-c: pandas C parser with whitespace delimiter
+          (python parser if min_gap > 1)
+        - numpy-fixed-width: detect the fixed width layout of the table
+          and decode each column slice with numpy
+        - pyarrow: same as numpy-fixed-width but decode the columns
+          with the pyarrow compute kernels
+
+    The fixed width engines fall back to pandas if the table doesn't have
+    a fixed width layout or if a value can't be decoded.
+
+    Args:
+        file: file path or file object positioned at the start of the table
+        names (list): columns names
+        dtype (dict, type, optional): columns dtype, missing or None
+            columns dtypes are inferred. Defaults to float.
+        na_values (list, dict, optional): values to replace by NaN,
+            or a dictionary of values per column. Defaults to None.
+        engine (str, optional): engine used to parse the table.
+            Defaults to "pandas-c".
+        min_gap (int, optional): minimum number of whitespaces separating
+            two columns, values can contain shorter whitespaces. Defaults to 1.
+        quotechar (str, optional): character used to quote values containing
+            whitespaces. Quoted values are only handled by pandas. Defaults to None.
+        float_precision (str, optional): pandas float converter. The fixed
+            width engines are always round trip precise. Defaults to None.
+        encoding (str, optional): file encoding. Defaults to "UTF-8".
+        encoding_errors (str, optional): encoding errors handling.
+            Defaults to "strict".
+        **kwargs: keyword arguments passed to pandas.read_csv
+
+    Returns:
+        pd.DataFrame: parsed table
+    """
+    if engine not in TEXT_READER_ENGINES:
+        raise ValueError(
+            f"Unknown engine {engine}, should be one of {TEXT_READER_ENGINES}"
+        )
+    if engine == "pyarrow":
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise RuntimeError(
+                "pyarrow is necessary to use the pyarrow engine. "
+                "Install pyarrow with `pip install pyarrow`"
+            )
+    dtypes = dtype if isinstance(dtype, dict) else dict.fromkeys(names, dtype)
+    dtypes = {name: value for name, value in dtypes.items() if value is not None}
+
+    if engine != "pandas-c":
+        if isinstance(file, (str, Path)):
+            with open(file, "rb") as f:
+                data = f.read()
+        else:
+            data = file.read()
+        if isinstance(data, str):
+            data = data.encode(encoding, errors=encoding_errors)
+
+        df = None
+        if (
+            data.strip()
+            and not kwargs
+            and not (quotechar and quotechar.encode() in data)
+        ):
+            df = _read_fixed_width_table(
+                data,
+                names,
+                dtypes,
+                na_values,
+                engine,
+                min_gap,
+                encoding=encoding,
+                encoding_errors=encoding_errors,
+            )
+        if df is not None:
+            return df
+        logger.debug("Data isn't fixed width, fall back to pandas parser")
+        file = BytesIO(data)
+
+    return pd.read_csv(
+        file,
+        sep=r"\s+" if min_gap == 1 else rf"\s{{{min_gap},}}",
+        engine="c" if min_gap == 1 else "python",
+        header=None,
+        names=names,
+        dtype=dtypes or None,
+        na_values=na_values,
+        quotechar=quotechar or '"',
+        float_precision=float_precision,
+        encoding=encoding,
+        encoding_errors=encoding_errors,
+        **kwargs,
+    )
+
+
+def _read_fixed_width_table(
+    data: bytes,
+    names: list,
+    dtypes: dict,
+    na_values: list,
+    engine: str,
+    min_gap: int,
+    encoding: str = "UTF-8",
+    encoding_errors: str = "strict",
+) -> pd.DataFrame:
+    lines = _get_lines_array(data)
+    columns = _get_fixed_width_columns(lines, min_gap=min_gap)
+    if columns is None or len(columns) != len(names):
+        return None
+
+    if not isinstance(na_values, dict):
+        na_values = dict.fromkeys(names, na_values)
+    numeric_na_values = {}
+    for name in names:
+        numeric_na_values[name] = []
+        for value in np.atleast_1d(na_values.get(name) or []):
+            try:
+                numeric_na_values[name].append(float(value))
+            except ValueError:
+                # Non numeric null values can't be decoded by the fixed width engines
+                if str(value).encode() in data:
+                    return None
+    try:
+        return pd.DataFrame(
+            {
+                name: _decode_fixed_width_column(
+                    lines[:, start:end],
+                    dtypes.get(name),
+                    numeric_na_values[name],
+                    engine,
+                    encoding,
+                    encoding_errors,
+                )
+                for name, (start, end) in zip(names, columns)
+            }
+        )
+    except (ValueError, TypeError) as error:
+        logger.debug("Failed to decode fixed width table: %s", error)
+        return None
+
+
 def apply_function(ds: xr.Dataset, variable: str) -> xr.Dataset:
     """Apply a function to a variable based on the apply_function attribute."""
 
@@ -7,7 +7,7 @@ import re
 import pandas as pd
 import xarray
 
-from ocean_data_parser.parsers.utils import standardize_dataset
+from ocean_data_parser.parsers.utils import apply_dtype_policy, standardize_dataset
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +35,7 @@ def mon(
     convert_pressure_to_dbar: bool = True,
     errors: str = "strict",
     encoding: str = "utf-8",
+    dtype_policy: str = "default",
 ) -> xarray.Dataset:
     """Parse Van Essen Instruments mon format to NetCDF.
 
@@ -45,6 +46,8 @@ def mon(
             cmH2O/mH2O to dbar. Defaults to True.
         encoding (str, optional): File encoding. Defaults to "utf-8".
         errors (str, optional): Error handling. Defaults to "strict".
+        dtype_policy (str, optional): dtype policy applied to the data
+            (see `utils.apply_dtype_policy`). Defaults to "default".
 
     Returns:
         xarray.Dataset: Parsed dataset
@@ -102,6 +105,7 @@ def mon(
             encoding=encoding,
             encoding_errors=errors,
         )
+    df = apply_dtype_policy(df, dtype_policy)
 
     # handle time variable
     df["time"] = pd.to_datetime(df["time"] + timezone, utc=True)
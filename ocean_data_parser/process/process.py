@@ -48,6 +48,7 @@ class Processing:
         overwrite=True,
         time_variables_encoding=None,
         utc=True,
+        encoding_preset=None,
         **kwargs,
     ):
         name = Path(name or self.get_filename_from_convention(suffix=suffix))
@@ -66,6 +67,8 @@ class Processing:
             or utils.time_variables_default_encoding,
             utc=utc,
         )
+        if encoding_preset:
+            ds = utils.apply_encoding_preset(ds, encoding_preset)
         ds.to_netcdf(
             name or self.get_filename_from_convention(suffix=suffix) + ".nc", **kwargs
         )
@@ -1,23 +1,307 @@
 """This module contains all the different tools needed to parse a file."""
 
+import hashlib
+import inspect
 import logging
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from importlib import import_module
 from pathlib import Path
 from typing import Union
 
-import pandas as pd
 import xarray as xr
 
+from ocean_data_parser import __version__
+from ocean_data_parser.parsers.utils import apply_dtype_policy
+
 logger = logging.getLogger(__name__)
 
 
+DETECTION_WINDOW_SIZE = 2**16
+DETECTION_HEADER_LINES = 10
+NMEA_LINE = re.compile(r"\$.*,.*,")
+
+
+class DetectionRule:
+    """File format detection rule associated with a parser.
+
+    A file matches the rule if its extension is within the rule extensions,
+    its first bytes start with one of the signatures, its header contains all
+    the given strings and matches all the patterns and the match function.
+    """
+
+    def __init__(
+        self,
+        parser: str,
+        extensions: list = None,
+        signatures: list = None,
+        contains: list = None,
+        patterns: list = None,
+        match: callable = None,
+        priority: int = 1000,
+    ):
+        """Create a detection rule.
+
+        Args:
+            parser (str): Parser associated with the matching files.
+            extensions (list, optional): Case insensitive file extensions
+                (without dot). Defaults to any extension.
+            signatures (list, optional): Bytes one of which the file
+                should start with.
+            contains (list, optional): Strings the header should contain.
+            patterns (list, optional): Regex patterns the header should match.
+            match (callable, optional): Function `match(path, header) -> bool`
+                for checks not covered by the other arguments.
+            priority (int, optional): Rules are checked by increasing priority.
+                Built-in rules priorities range from 10 to 260. Defaults to 1000.
+        """
+        self.parser = parser
+        self.extensions = (
+            {extension.lower() for extension in extensions} if extensions else None
+        )
+        self.signatures = tuple(signatures or ())
+        self.contains = tuple(contains or ())
+        self.patterns = tuple(re.compile(pattern) for pattern in patterns or ())
+        self.match_function = match
+        self.priority = priority
+
+    def match(self, path: Path, window: bytes, header: str) -> bool:
+        """Check if a file matches the rule (the extension is checked by the registry)."""
+        if self.signatures and not window.startswith(self.signatures):
+            return False
+        if not all(item in header for item in self.contains):
+            return False
+        if not all(pattern.search(header) for pattern in self.patterns):
+            return False
+        return self.match_function is None or bool(self.match_function(path, header))
+
+
+DETECTION_RULES = []
+
+
+def register_detection_rule(parser: str, **kwargs) -> DetectionRule:
+    """Register a new file format detection rule used by `detect_file_format`.
+
+    ```python
+    from ocean_data_parser import read
+
+    read.register_detection_rule(
+        "my_parser.module.parser", extensions=["dat"], contains=["MY HEADER"]
+    )
+    ```
+
+    Args:
+        parser (str): Parser associated with the matching files.
+        **kwargs: `DetectionRule` arguments.
+
+    Returns:
+        DetectionRule: Registered rule
+    """
+    rule = DetectionRule(parser, **kwargs)
+    DETECTION_RULES.append(rule)
+    DETECTION_RULES.sort(key=lambda rule: rule.priority)
+    _get_candidate_rules.cache_clear()
+    get_detection_rules_version.cache_clear()
+    return rule
+
+
+@lru_cache
+def get_detection_rules_version() -> str:
+    """Get a version identifier of the registered detection rules.
+
+    The identifier changes if any rule is registered or modified, or if
+    the package version changes.
+
+    Returns:
+        str: Detection rules version
+    """
+    rules_hash = hashlib.sha256(__version__.encode())
+    for rule in DETECTION_RULES:
+        rules_hash.update(
+            repr(
+                (
+                    rule.parser,
+                    sorted(rule.extensions or []),
+                    rule.signatures,
+                    rule.contains,
+                    [pattern.pattern for pattern in rule.patterns],
+                    getattr(rule.match_function, "__qualname__", None),
+                    rule.priority,
+                )
+            ).encode()
+        )
+    return rules_hash.hexdigest()[:16]
+
+
+@lru_cache
+def _get_candidate_rules(extension: str) -> tuple:
+    return tuple(
+        rule
+        for rule in DETECTION_RULES
+        if rule.extensions is None or extension in rule.extensions
+    )
+
+
+def _has_p_extension(path: Path, header: str) -> bool:
+    return path.suffix[1:2] == "p"
+
+
+def _warn_unknown_odf_institution(path: Path, header: str) -> bool:
+    logger.warning(
+        "Unable to detect ODF related institution code (IML=1830/CaIML;BIO=1810) from header: %s",
+        header,
+    )
+    logger.warning("Default to MLI ODF")
+    return True
+
+
+def _is_nmea(path: Path, header: str) -> bool:
+    lines = [line for line in header.split("\n") if line]
+    return bool(lines) and all(NMEA_LINE.search(line) for line in lines)
+
+
+def _is_hoboconnect_xlsx(path: Path, header: str) -> bool:
+    from ocean_data_parser.parsers import onset
+
+    return onset.is_hoboconnect_xlsx(path)
+
+
+# Built-in detection rules
+register_detection_rule("netcdf", extensions=["nc"], priority=10)
+register_detection_rule(
+    "seabird.btl", extensions=["btl"], contains=["* Sea-Bird"], priority=20
+)
+register_detection_rule(
+    "seabird.cnv", extensions=["cnv"], contains=["* Sea-Bird"], priority=30
+)
+register_detection_rule(
+    "electricblue.csv", extensions=["csv"], contains=["electricblue"], priority=40
+)
+register_detection_rule(
+    "onset.csv", extensions=["csv"], contains=["Plot Title"], priority=50
+)
+register_detection_rule(
+    "onset.csv",
+    extensions=["csv"],
+    contains=["Host Connect"],
+    patterns=[r"Serial Number:\s*\d+\s*"],
+    priority=60,
+)
+register_detection_rule(
+    "onset.csv",
+    extensions=["csv"],
+    contains=["Date Time, GMT"],
+    patterns=[r"\"LGR S\/N:\s*[\d\-]+"],
+    priority=70,
+)
+register_detection_rule(
+    "onset.csv",
+    extensions=["csv"],
+    contains=['#,"Date Time, GMT', "(LGR S/N: "],
+    priority=80,
+)
+register_detection_rule(
+    "electricblue.log_csv",
+    extensions=["csv"],
+    contains=[
+        (
+            "time, action, id, version, name, status, code, sampling interval (s), "
+            "sampling resolution (C), samples, time diff (s), start time, lat, long, accuracy, device"
+        )
+    ],
+    priority=90,
+)
+register_detection_rule(
+    "star_oddi.dat", extensions=["DAT"], contains=["Version\tSeaStar"], priority=100
+)
+register_detection_rule(
+    "amundsen.int_format",
+    extensions=["int"],
+    contains=["% Cruise_Number:"],
+    priority=110,
+)
+register_detection_rule(
+    "amundsen.csv_format",
+    extensions=["csv"],
+    contains=["% Cruise_Number:"],
+    priority=120,
+)
+register_detection_rule("dfo.ios.shell", contains=["*IOS HEADER VERSION"], priority=130)
+register_detection_rule("dfo.nafc.pcnv", extensions=["pcnv"], priority=140)
+register_detection_rule(
+    "dfo.nafc.pfile", contains=["NAFC_Y2K_HEADER"], match=_has_p_extension, priority=150
+)
+register_detection_rule(
+    "dfo.odf.bio_odf",
+    extensions=["ODF"],
+    patterns=[r"COUNTRY_INSTITUTE_CODE\s*=\s*1810"],
+    priority=160,
+)
+register_detection_rule(
+    "dfo.odf.mli_odf",
+    extensions=["ODF"],
+    patterns=[r"COUNTRY_INSTITUTE_CODE\s*=\s*(1830|CaIML)"],
+    priority=170,
+)
+register_detection_rule(
+    "dfo.odf.as_qo_odf",
+    extensions=["ODF"],
+    patterns=[r"Ismer\/Québec-Océan"],
+    priority=180,
+)
+register_detection_rule(
+    "dfo.odf.odf", extensions=["ODF"], match=_warn_unknown_odf_institution, priority=190
+)
+register_detection_rule("van_essen_instruments.mon", extensions=["MON"], priority=200)
+register_detection_rule(
+    "pme.txt", extensions=["txt"], patterns=[r"\A\d+\-\d+\s*\nOS REV\:"], priority=210
+)
+register_detection_rule(
+    "rbr.rtext",
+    extensions=["txt"],
+    patterns=[r"\AModel\=.*\nFirmware\=.*\nSerial\=.*"],
+    priority=220,
+)
+register_detection_rule(
+    "sunburst.super_co2_notes",
+    extensions=["txt"],
+    contains=["Front panel parameter change:"],
+    priority=230,
+)
+register_detection_rule(
+    "sunburst.super_co2",
+    extensions=["txt"],
+    contains=["CO2 surface underway data"],
+    priority=240,
+)
+register_detection_rule("nmea.nmea_0183", match=_is_nmea, priority=250)
+register_detection_rule(
+    "onset.xlsx",
+    extensions=["xlsx"],
+    signatures=[b"PK\x03\x04"],
+    match=_is_hoboconnect_xlsx,
+    priority=260,
+)
+
+
+def _read_header(window: bytes, encoding: str) -> str:
+    """Decode the first lines of a file window with universal newlines."""
+    text = window.decode(encoding, errors="ignore")
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    lines = text.split("\n", DETECTION_HEADER_LINES)
+    if len(lines) <= DETECTION_HEADER_LINES:
+        return text
+    return "\n".join(lines[:DETECTION_HEADER_LINES]) + "\n"
+
+
 def detect_file_format(file: str, encoding: str = "UTF-8") -> str:
     """Detect corresponding data parser for a given file.
 
     The parser suggestion is based on the file extension and the
-    first few lines of the file itself.
+    first few lines of the file itself, matched against the registered
+    detection rules (see `register_detection_rule`).
 
     Args:
         file (str): Path to the file
@@ -26,105 +310,53 @@ def detect_file_format(file: str, encoding: str = "UTF-8") -> str:
     Returns:
         str: Parser compatible with this file format
     """
-    # Retrieve file extension and the first few lines of the file header
+    # Retrieve file extension and the first bytes of the file
     file = Path(file)
     if file.is_dir():
         raise ValueError(f"Directory provided instead of a file: {file}")
-    ext = file.suffix[1:]
-
-    with open(file, encoding=encoding, errors="ignore") as file_handle:
-        header = ""
-        for _ in range(10):
-            try:
-                header += next(file_handle)
-            except StopIteration:
-                break
+    with open(file, "rb") as file_handle:
+        window = file_handle.read(DETECTION_WINDOW_SIZE)
+    header = _read_header(window, encoding)
 
     # Detect the right file format
-    if ext == "nc":
-        parser = "netcdf"
-    elif ext == "btl" and "* Sea-Bird" in header:
-        parser = "seabird.btl"
-    elif ext == "cnv" and "* Sea-Bird" in header:
-        parser = "seabird.cnv"
-    elif ext == "csv" and re.search("electricblue", header):
-        parser = "electricblue.csv"
-    elif ext == "csv" and (
-        "Plot Title" in header
-        or (re.search(r"Serial Number:\s*\d+\s*", header) and "Host Connect" in header)
-        or (re.search(r"\"LGR S\/N:\s*[\d\-]+", header) and "Date Time, GMT" in header)
-        or ('#,"Date Time, GMT' in header and "(LGR S/N: " in header)
-    ):
-        parser = "onset.csv"
-    elif (
-        ext == "csv"
-        and "time, action, id, version, name, status, code, sampling interval (s), "
-        + "sampling resolution (C), samples, time diff (s), start time, lat, long, accuracy, device"
-        in header
-    ):
-        parser = "electricblue.log_csv"
-    elif ext == "DAT" and "Version	SeaStar" in header:
-        parser = "star_oddi.dat"
-    elif ext == "int" and "% Cruise_Number:" in header:
-        parser = "amundsen.int_format"
-    elif ext == "csv" and "% Cruise_Number:" in header:
-        parser = "amundsen.csv_format"
-    elif "*IOS HEADER VERSION" in header:
-        parser = "dfo.ios.shell"
-    elif ext == "pcnv":
-        parser = "dfo.nafc.pcnv"
-    elif ext[0] == "p" and "NAFC_Y2K_HEADER" in header:
-        parser = "dfo.nafc.pfile"
-    elif ext.upper() == "ODF" and re.search(
-        r"COUNTRY_INSTITUTE_CODE\s*=\s*1810", header
-    ):
-        parser = "dfo.odf.bio_odf"
-    elif (
-        ext.upper() == "ODF"
-        and re.search(r"COUNTRY_INSTITUTE_CODE\s*=\s*1830", header)
-        or re.search(r"COUNTRY_INSTITUTE_CODE\s*=\s*CaIML", header)
-    ):
-        parser = "dfo.odf.mli_odf"
-    elif ext.upper() == "ODF" and re.search(r"Ismer\/Québec-Océan", header):
-        parser = "dfo.odf.as_qo_odf"
-    elif ext.upper() == "ODF":
-        logger.warning(
-            "Unable to detect ODF related institution code (IML=1830/CaIML;BIO=1810) from header: %s",
-            header,
-        )
-        logger.warning("Default to MLI ODF")
-        parser = "dfo.odf.odf"
-    elif (
-        ext.lower() in ("ctd", "bot", "che", "drf", "cur", "loop", "tob")
-        and "*IOS HEADER VERSION" in header
-    ):
-        parser = "dfo.ios.shell"
-    elif ext == "MON":
-        parser = "van_essen_instruments.mon"
-    elif ext == "txt" and re.match(r"\d+\-\d+\s*\nOS REV\:", header):
-        parser = "pme.txt"
-    elif ext == "txt" and re.match(r"Model\=.*\nFirmware\=.*\nSerial\=.*", header):
-        parser = "rbr.rtext"
-    elif ext == "txt" and "Front panel parameter change:" in header:
-        parser = "sunburst.super_co2_notes"
-    elif ext == "txt" and "CO2 surface underway data" in header:
-        parser = "sunburst.super_co2"
-    elif all(re.search(r"\$.*,.*,", line) for line in header.split("\n") if line):
-        parser = "nmea.file"
-    elif ext == "xlsx":
-        excel_file = pd.ExcelFile(file)
-        sheet_names = excel_file.sheet_names
-        if (
-            all(sheet in sheet_names for sheet in ("Data", "Events", "Details"))
-            and "HOBOconnect"
-            in excel_file.parse("Details", names=[0, 1, 2, 3])[3].tolist()
-        ):
-            parser = "onset.xlsx"
-    else:
-        raise ImportError(f"Unable to match file to a specific data parser: {file}")
+    for rule in _get_candidate_rules(file.suffix[1:].lower()):
+        if rule.match(file, window, header):
+            logger.debug("Selected parser: %s", rule.parser)
+            return rule.parser
+    raise ImportError(f"Unable to match file to a specific data parser: {file}")
+
+
+def detect_file_formats(
+    paths: list,
+    encoding: str = "UTF-8",
+    errors: str = "raise",
+    max_workers: int = None,
+) -> dict:
+    """Detect the corresponding data parser of multiple files concurrently.
 
-    logger.debug("Selected parser: %s", parser)
-    return parser
+    Args:
+        paths (list): Paths to the files
+        encoding (str, optional): Encoding use to parse files. Defaults to "UTF-8".
+        errors (str, optional): If "ignore", files not matching any parser
+            are associated with None instead of raising. Defaults to "raise".
+        max_workers (int, optional): Maximum number of threads used to read
+            the files. Defaults to ThreadPoolExecutor default.
+
+    Returns:
+        dict: Parser compatible with each file format `{path: parser}`
+    """
+
+    def _detect_file_format(path):
+        try:
+            return detect_file_format(path, encoding=encoding)
+        except ImportError:
+            if errors == "raise":
+                raise
+            logger.warning("Unable to match file to a specific data parser: %s", path)
+
+    paths = list(paths)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip(paths, executor.map(_detect_file_format, paths)))
 
 
 def import_parser(parser: str):
@@ -144,10 +376,16 @@ def import_parser(parser: str):
     return getattr(mod, filetype)
 
 
+@lru_cache
+def _accepts_dtype_policy(parser_func) -> bool:
+    return "dtype_policy" in inspect.signature(parser_func).parameters
+
+
 def file(
     path: str,
     parser: str = None,
     global_attributes=None,
+    dtype_policy: str = "default",
     **kwargs: Union[str, int, float],
 ) -> xr.Dataset:
     """Load compatible file format as an xarray dataset.
@@ -163,6 +401,11 @@ def file(
         parser (str, optional): Parser to use.
                 Defaults to auto `detect_file_format` output if None
         global_attributes (dict, optional): Global attributes to add to the dataset.
+        dtype_policy (str, optional): dtype policy applied to the parsed dataset
+            (default, compact). The compact policy reduces the dataset memory
+            footprint (see `parsers.utils.apply_dtype_policy`) and is passed to
+            the parsers accepting a `dtype_policy` argument to apply it while
+            parsing. Defaults to "default".
         **kwargs: Keyword arguments to pass to the parser
 
     Returns:
@@ -174,7 +417,9 @@ def file(
 
     # Load the appropriate parser and read the file
     parser_func = import_parser(parser) if isinstance(parser, str) else parser
+    if dtype_policy != "default" and _accepts_dtype_policy(parser_func):
+        kwargs["dtype_policy"] = dtype_policy
     ds = parser_func(path, **(kwargs or {}))
     if global_attributes:
         ds.attrs.update(global_attributes)
-    return ds
+    return apply_dtype_policy(ds, dtype_policy)
@@ -1,11 +1,82 @@
+import hashlib
 import json
+import logging
+import os
+import pickle
 import re
+from functools import lru_cache, wraps
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
 
+logger = logging.getLogger(__name__)
+
 VOCABULARIES_DIRECTORY = Path(__file__).parent
+# Directory where the loaded vocabularies are cached, set to None to disable the cache
+# (or set the ODPY_CACHE_DIR environment variable to an empty string or "0")
+_CACHE_DIR_ENV = os.environ.get(
+    "ODPY_CACHE_DIR", str(Path.home() / ".cache" / "ocean_data_parser")
+)
+VOCABULARIES_CACHE_DIRECTORY = (
+    None if _CACHE_DIR_ENV.strip() in ("", "0") else Path(_CACHE_DIR_ENV)
+)
+
+
+def _vocabulary_cache(*sources: str):
+    """Cache on disk the vocabulary generated from the source files.
+
+    The vocabulary is pickled to
+    `{VOCABULARIES_CACHE_DIRECTORY}/{function name}-{hash}.pkl` where the
+    hash is generated from the source files content and the pandas version.
+    Any modification of the sources invalidates the cache.
+
+    Args:
+        *sources (str): Vocabulary source files within VOCABULARIES_DIRECTORY.
+    """
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper():
+            if VOCABULARIES_CACHE_DIRECTORY is None:
+                return func()
+
+            sources_hash = hashlib.sha256(pd.__version__.encode())
+            for source in sources:
+                sources_hash.update((VOCABULARIES_DIRECTORY / source).read_bytes())
+            cache_directory = Path(VOCABULARIES_CACHE_DIRECTORY)
+            cache_file = (
+                cache_directory / f"{func.__name__}-{sources_hash.hexdigest()[:16]}.pkl"
+            )
+            if cache_file.exists():
+                try:
+                    with open(cache_file, "rb") as file:
+                        return pickle.load(file)
+                except (
+                    OSError,
+                    EOFError,
+                    AttributeError,
+                    ImportError,
+                    pickle.UnpicklingError,
+                ) as error:
+                    logger.debug("Failed to load cached %s: %s", cache_file, error)
+
+            vocabulary = func()
+            try:
+                cache_directory.mkdir(parents=True, exist_ok=True)
+                for outdated_file in cache_directory.glob(f"{func.__name__}-*.pkl"):
+                    outdated_file.unlink()
+                temp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+                with open(temp_file, "wb") as file:
+                    pickle.dump(vocabulary, file)
+                os.replace(temp_file, cache_file)
+            except OSError as error:
+                logger.debug("Failed to cache %s: %s", cache_file, error)
+            return vocabulary
+
+        return wrapper
+
+    return decorator
 
 
 def amundsen_vocabulary_df(instrument_vocabulary: str = None) -> pd.DataFrame:
@@ -25,9 +96,32 @@ def amundsen_vocabulary_df(instrument_vocabulary: str = None) -> pd.DataFrame:
     return pd.DataFrame(vocab)
 
 
+@lru_cache
+def _amundsen_vocabulary_index(vocabulary_file: str) -> dict:
+    """Load an Amundsen vocabulary file and index its items by file_type.
+
+    The vocabulary is loaded once per process, the full vocabulary
+    is stored under the None key.
+    """
+    with open(VOCABULARIES_DIRECTORY / vocabulary_file, encoding="UTF-8") as file:
+        vocab = json.load(file)
+    vocab.pop("VARIABLE_NAME")
+
+    index = {}
+    for name, items in vocab.items():
+        for item in items:
+            index.setdefault(item.get("file_type"), {}).setdefault(name, []).append(
+                item
+            )
+    index[None] = vocab
+    return index
+
+
 def amundsen_vocabulary(instrument_vocabulary: str = None) -> dict:
     """Load Amundsen Vocabulary.
 
+    The returned vocabulary is shared between calls and shouldn't be modified.
+
     Args:
         instrument_vocabulary (str): Instrument vocabulary to load. Defaults to None.
 
@@ -35,26 +129,10 @@ def amundsen_vocabulary(instrument_vocabulary: str = None) -> dict:
         dict: Amundsen Vocabulary
     """
     if not instrument_vocabulary or instrument_vocabulary == "rosette":
-        vocabulary_file = VOCABULARIES_DIRECTORY / "amundsen_rosette_vocabulary.json"
-    else:
-        vocabulary_file = VOCABULARIES_DIRECTORY / "amundsen_other_vocabulary.json"
-
-    with open(vocabulary_file) as file:
-        with open(vocabulary_file, encoding="UTF-8") as file:
-            vocab = json.load(file)
-
-    vocab.pop("VARIABLE_NAME")
-    if not instrument_vocabulary or instrument_vocabulary == "rosette":
-        return vocab
-
-    sub_vocab = {}
-    for name, items in vocab.items():
-        for item in items:
-            if item.get("file_type") == instrument_vocabulary:
-                if name not in sub_vocab:
-                    sub_vocab[name] = []
-                sub_vocab[name].append(item)
-    return sub_vocab
+        return _amundsen_vocabulary_index("amundsen_rosette_vocabulary.json")[None]
+    return _amundsen_vocabulary_index("amundsen_other_vocabulary.json").get(
+        instrument_vocabulary, {}
+    )
 
 
 def seabird_vocabulary_df() -> pd.DataFrame:
@@ -66,6 +144,7 @@ def seabird_vocabulary_df() -> pd.DataFrame:
     return pd.DataFrame(vocab)
 
 
+@_vocabulary_cache("seabird_vocabulary.json")
 def seabird_vocabulary() -> dict:
     """Load Seabird Vocabulary."""
     with open(
@@ -77,6 +156,7 @@ def seabird_vocabulary() -> dict:
     return vocabulary
 
 
+@_vocabulary_cache("dfo_platforms.csv")
 def dfo_platforms() -> pd.DataFrame:
     """Retrieve DFO Platforms vocabulary."""
     df = (
@@ -96,6 +176,7 @@ def dfo_platforms() -> pd.DataFrame:
     return df
 
 
+@_vocabulary_cache("dfo_ios_vocabulary.csv")
 def dfo_ios_vocabulary() -> pd.DataFrame:
     return pd.read_csv(VOCABULARIES_DIRECTORY / "dfo_ios_vocabulary.csv")
 
@@ -111,6 +192,7 @@ def as_qo_odf_vocabulary() -> pd.DataFrame:
     return df_vocab
 
 
+@_vocabulary_cache("dfo_odf_vocabulary.csv", "amundsen_rosette_vocabulary.json")
 def dfo_odf_vocabulary() -> pd.DataFrame:
     """Combine DFO ODF and AS QO vocabularies."""
     return (
@@ -125,6 +207,7 @@ def dfo_odf_vocabulary() -> pd.DataFrame:
     )
 
 
+@_vocabulary_cache("dfo_nafc_p_files_vocabulary.csv")
 def dfo_nafc_p_file_vocabulary() -> pd.DataFrame:
     return pd.read_csv(
         VOCABULARIES_DIRECTORY / "dfo_nafc_p_files_vocabulary.csv"
@@ -1,3 +1,11 @@
+import pytest
+
+from ocean_data_parser.vocabularies import load
+
+# Don't use the user vocabularies cache while collecting the tests
+load.VOCABULARIES_CACHE_DIRECTORY = None
+
+
 def pytest_addoption(parser):
     parser.addoption(
         "--nerc-vocab",
@@ -6,3 +14,13 @@ def pytest_addoption(parser):
         default=False,
         help="enable nerc vocabulary tests",
     )
+
+
+@pytest.fixture(scope="session", autouse=True)
+def vocabularies_cache_directory(tmp_path_factory):
+    """Cache the vocabularies within a temporary directory during the tests."""
+    cache_directory = tmp_path_factory.mktemp("odpy_cache")
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(load, "VOCABULARIES_CACHE_DIRECTORY", cache_directory)
+        monkeypatch.setenv("ODPY_CACHE_DIR", str(cache_directory))
+        yield cache_directory
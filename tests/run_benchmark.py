@@ -1,7 +1,28 @@
 import logging
+import os
+import subprocess
+import sys
+from functools import partial
 from glob import glob
+from io import StringIO
+from pathlib import Path
 
-from ocean_data_parser.parsers import amundsen, onset, seabird, van_essen_instruments
+import numpy as np
+import pandas as pd
+import pytest
+import xarray as xr
+
+from ocean_data_parser import read
+from ocean_data_parser.parsers import (
+    amundsen,
+    nmea,
+    onset,
+    pme,
+    seabird,
+    utils,
+    van_essen_instruments,
+)
+from ocean_data_parser.parsers.dfo import nafc
 
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger()
@@ -31,6 +52,13 @@ def test_benchmark_onset_csv(benchmark):
     )
 
 
+def test_benchmark_onset_mixed_datetime(benchmark):
+    times = pd.Series(
+        ["07/04/22 01:02:03 PM", "2022-07-04 13:02:03", "7/4/2022 13:02:03"] * 10**4
+    )
+    benchmark(onset._parse_mixed_datetime, times)
+
+
 def test_benchmark_van_essen_mon(benchmark):
     benchmark(
         batch_parse_and_save_to_netcdf,
@@ -41,17 +69,186 @@ def test_benchmark_van_essen_mon(benchmark):
     )
 
 
-def test_benchmark_seabird_cnv(benchmark):
+@pytest.mark.parametrize("engine", utils.TEXT_READER_ENGINES)
+def test_benchmark_seabird_cnv(benchmark, engine):
     benchmark(
         batch_parse_and_save_to_netcdf,
-        parser=seabird.cnv,
+        parser=partial(seabird.cnv, engine=engine),
         files=glob("tests/parsers_test_files/seabird/**/*.cnv", recursive=True),
     )
 
 
+@pytest.mark.parametrize("engine", utils.TEXT_READER_ENGINES)
+def test_benchmark_nafc_pfile(benchmark, engine):
+    benchmark(
+        batch_parse_and_save_to_netcdf,
+        parser=partial(nafc.pfile, engine=engine),
+        files=glob(
+            "tests/parsers_test_files/dfo/nafc/pfile/**/*.p[0-9][0-9][0-9][0-9]",
+            recursive=True,
+        ),
+    )
+
+
+@pytest.mark.parametrize("engine", utils.TEXT_READER_ENGINES)
+def test_benchmark_read_whitespace_table(benchmark, engine):
+    n_records = 10**5
+    table = "".join(
+        f"{index:8d} {index * 0.001:10.4f} {np.sin(index):12.6f} {index % 7:3d}\n"
+        for index in range(n_records)
+    )
+    benchmark(
+        lambda: utils.read_whitespace_table(
+            StringIO(table), names=["index", "a", "b", "c"], engine=engine
+        )
+    )
+
+
+@pytest.mark.parametrize("engine", nmea.NMEA_0183_ENGINES)
+def test_benchmark_nmea_0183(benchmark, engine):
+    benchmark(
+        batch_parse_and_save_to_netcdf,
+        parser=partial(nmea.nmea_0183, engine=engine),
+        files=glob("tests/parsers_test_files/nmea/**/*.txt", recursive=True),
+    )
+
+
 def test_benchmark_seabird_btl(benchmark):
     benchmark(
         batch_parse_and_save_to_netcdf,
         parser=seabird.btl,
         files=glob("tests/parsers_test_files/seabird/**/*.btl", recursive=True),
     )
+
+
+def _generate_btl_collection(path, n_casts=50, n_repeats=10):
+    """Generate a collection of large btl files by repeating the test file bottles."""
+    lines = (
+        Path("tests/parsers_test_files/seabird/btl/MI18MHDR.btl")
+        .read_text()
+        .splitlines(keepends=True)
+    )
+    n_header = next(
+        index for index, line in enumerate(lines) if line.strip().startswith("Position")
+    )
+    header, data = lines[: n_header + 1], lines[n_header + 1 :]
+    n_bottles = sum(line.rstrip().endswith("(avg)") for line in data)
+    rows = []
+    for repeat in range(n_repeats):
+        for line in data:
+            if line.rstrip().endswith("(avg)"):
+                line = f"{int(line[:10]) + repeat * n_bottles:10d}{line[10:]}"
+            rows.append(line)
+
+    files = []
+    for cast in range(n_casts):
+        file = path / f"cast_{cast}.btl"
+        file.write_text("".join(header + rows))
+        files.append(file)
+    return files
+
+
+def test_benchmark_seabird_btl_collection(benchmark, tmp_path):
+    files = _generate_btl_collection(tmp_path)
+    benchmark(lambda: [seabird.btl(file) for file in files])
+
+
+def _generate_minidot_collection(path, n_files=500, n_records=144):
+    """Generate a collection of daily 10 minutes minidot txt files."""
+    header = (
+        "7450-647102\nOS REV: 1.05 Sensor Cal: 1618335091\n"
+        "Time (sec),  BV (Volts),  T (deg C),  DO (mg/l),  Q ()\n"
+    )
+    start = 1646177940
+    files = []
+    for index in range(n_files):
+        times = start + (index * n_records + np.arange(n_records)) * 600
+        file = path / f"{pd.Timestamp(times[0], unit='s'):%Y-%m-%d %H%M%SZ}.txt"
+        file.write_text(
+            header + "".join(f"{time},+3.48, +7.477,+10.468,+0.984\n" for time in times)
+        )
+        files.append(str(file))
+    return files
+
+
+def test_benchmark_pme_txts(benchmark, tmp_path):
+    files = _generate_minidot_collection(tmp_path)
+    benchmark(pme.txts, files)
+
+
+def _write_with_encoding_preset(ds, preset, path):
+    utils.apply_encoding_preset(ds, preset).to_netcdf(path)
+
+
+@pytest.mark.parametrize("preset", list(utils.ENCODING_PRESETS.keys()))
+def test_benchmark_encoding_presets(benchmark, preset, tmp_path):
+    n_records = 10**6
+    ds = utils.standardize_dataset(
+        xr.Dataset(
+            {
+                "temperature": ("time", np.round(np.random.rand(n_records) * 30, 3)),
+                "pressure": ("time", np.round(np.linspace(0, 200, n_records), 2)),
+                "flag": ("time", np.ones(n_records, dtype="int32")),
+            },
+            coords={"time": pd.date_range("2020-01-01", periods=n_records, freq="1s")},
+        )
+    )
+    path = tmp_path / f"{preset}.nc"
+    benchmark(_write_with_encoding_preset, ds, preset, path)
+    benchmark.extra_info["file_size"] = os.path.getsize(path)
+
+
+@pytest.mark.parametrize("n_records", [10**3, 10**6])
+def test_benchmark_standardize_dataset(benchmark, n_records):
+    ds = xr.Dataset(
+        {f"var{index}": ("time", np.random.rand(n_records)) for index in range(20)},
+        coords={"time": pd.date_range("2020-01-01", periods=n_records, freq="1s")},
+    )
+
+    def _standardize(ds):
+        ds.encoding.clear()
+        return utils.standardize_dataset(ds)
+
+    benchmark(_standardize, ds)
+
+
+@pytest.mark.parametrize("concurrent", [False, True])
+def test_benchmark_detect_file_formats(benchmark, concurrent):
+    paths = Path("tests/parsers_test_files").glob("**/*")
+    detected = read.detect_file_formats(
+        [path for path in paths if path.is_file()], errors="ignore"
+    )
+    files = [path for path, parser in detected.items() if parser]
+
+    def _detect_file_formats(files):
+        if concurrent:
+            return read.detect_file_formats(files)
+        return {path: read.detect_file_format(path) for path in files}
+
+    benchmark(_detect_file_formats, files)
+    benchmark.extra_info["n_files"] = len(files)
+
+
+def _import_module(module):
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "ocean_data_parser.parsers.seabird",
+        "ocean_data_parser.parsers.dfo",
+        "ocean_data_parser.read",
+    ],
+)
+def test_benchmark_import(benchmark, module):
+    importtime = benchmark.pedantic(_import_module, args=(module,), rounds=5)
+    # Last line reports the cumulative import time in us of the requested module
+    benchmark.extra_info["cumulative_import_time_us"] = int(
+        importtime.strip().splitlines()[-1].split("|")[1]
+    )
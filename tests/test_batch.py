@@ -12,6 +12,7 @@ from ocean_data_parser.batch.config import glob
 from ocean_data_parser.batch.convert import (
     BatchConversion,
     FileConversionRegistry,
+    convert_file,
     load_config,
 )
 from ocean_data_parser.batch.convert import cli as convert_cli
@@ -86,9 +87,28 @@ def _run_batch_process(config):
     )
 
 
+def _set_value_in_place(ds, variable, index, value):
+    ds[variable].values[index] = value
+    return ds
+
+
 class TestBatchMode:
     """Series of tests related to the batch conversion process."""
 
+    def test_conversion_with_in_place_pipe(self, tmp_path):
+        config = _get_config(
+            cwd=tmp_path,
+            xarray_pipe=[(_set_value_in_place, "temperature", 1, 100.0)],
+        )
+        output = convert_file(
+            "tests/parsers_test_files/onset/tidbit_v2/"
+            "703_PT_20409269_20220105_corrected.csv",
+            "onset.csv",
+            config,
+        )
+        ds = xr.open_dataset(output)
+        assert ds["temperature"].attrs["actual_range"][1] == 100.0
+
     @pytest.mark.parametrize("multiprocessing", [1, 2, None])
     def test_batch_conversion_multiprocessing(self, tmpdir, multiprocessing):
         config = _get_config(cwd=tmpdir, multiprocessing=multiprocessing)
@@ -125,6 +145,16 @@ class TestBatchMode:
         assert batch.config
         assert batch.registry
 
+    @pytest.mark.parametrize("encoding", ["small", {"preset": "fast-write"}])
+    def test_batch_conversion_with_encoding_preset(self, tmpdir, encoding):
+        config = _get_config(cwd=tmpdir)
+        config["output"]["encoding"] = encoding
+        _run_batch_process(config)
+        output_files = list(Path(tmpdir / "output").glob("*.nc"))
+        assert output_files
+        ds = xr.open_dataset(output_files[0])
+        assert ds["time"].encoding.get("zlib", False) == (encoding == "small")
+
     def test_failed_batch_conversion(self, tmpdir):
         test_file_path = str(tmpdir / "failed_cli_test_file.cnv")
         config = _get_config(
@@ -1,4 +1,6 @@
 import os
+import subprocess
+import sys
 
 import pytest
 from click.testing import CliRunner
@@ -29,6 +31,29 @@ def test_odpy_main_arguments(args, expected_output):
     assert expected_output in results.output
 
 
+@pytest.mark.parametrize("args", ["--help", "--version"])
+def test_odpy_main_does_not_import_subcommands(args):
+    code = (
+        "import sys\n"
+        "from ocean_data_parser import cli\n"
+        f"cli.main([{args!r}], standalone_mode=False)\n"
+        "imported = {'xarray', 'ocean_data_parser.batch.convert'} & set(sys.modules)\n"
+        "assert not imported, imported\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=False
+    )
+    assert result.returncode == 0, result.stderr
+
+
+@pytest.mark.parametrize("name", cli.LAZY_SUBCOMMANDS)
+def test_odpy_main_lazy_subcommands(name):
+    command = cli.main.get_command(None, name)
+    assert command.name == name
+    assert command.help.strip().splitlines()[0] == cli.LAZY_SUBCOMMANDS[name][1]
+    assert name in run_command(cli.main, "--help").output
+
+
 @pytest.mark.parametrize(
     ("args", "expected_output"),
     [("--unknown", "Error: No such option"), ("-1", "Error: No such option")],
@@ -74,6 +99,7 @@ def test_odpy_convert_arguments(args, expected_output):
         ({"ODPY_CONVERT_OVERWRITE": "true"}, "overwrite=True"),
         ({"ODPY_CONVERT_MULTIPROCESSING": "3"}, "multiprocessing=3"),
         ({"ODPY_CONVERT_ERRORS": "raise"}, "errors=raise"),
+        ({"ODPY_CONVERT_REDETECT": "true"}, "redetect=True"),
     ],
 )
 def test_odpy_convert_args_from_env_variables(env, expected_output):
@@ -178,3 +204,24 @@ def test_multiple_input_paths(tmp_path):
     assert "2/2 files needs to be converted" in results.output, (
         "Failed to process two files input paths"
     )
+
+
+def test_odpy_follow(tmp_path):
+    source = "tests/parsers_test_files/nmea/seaspan/nmeadata-2022-07-04_13.txt"
+    with open(source, "rb") as file_handle:
+        lines = file_handle.readlines()
+    path = tmp_path / "nmea.txt"
+    path.write_bytes(b"".join(lines[:100]) + lines[100][:10])
+    args = ["follow", str(path), "--output-dir", str(tmp_path / "output"), "--once"]
+
+    results = run_command(cli.main, args)
+    assert results.exit_code == 0, results.output
+    assert (tmp_path / "output" / "nmea_000000000.nc").exists()
+
+    # Complete the partial line and append new lines
+    with open(path, "ab") as file_handle:
+        file_handle.write(b"".join([lines[100][10:]] + lines[101:200]))
+    results = run_command(cli.main, args)
+    assert results.exit_code == 0, results.output
+    assert (tmp_path / "output" / "nmea_000000100.nc").exists()
+    assert '"row": 200' in (tmp_path / "output" / "nmea.txt.follow.json").read_text()
@@ -0,0 +1,106 @@
+from glob import glob
+
+import numpy as np
+import pytest
+import xarray as xr
+
+from ocean_data_parser.batch.collection import (
+    profiles_to_ragged_array,
+    write_profile_collection,
+)
+
+
+def _get_profile(n, station, with_oxygen=True):
+    ds = xr.Dataset(
+        {
+            "depth": ("index", np.arange(n, dtype=float)),
+            "TEMP": ("index", np.linspace(10, 2, n)),
+            "time": np.datetime64("2020-01-01T00:00:00", "ns"),
+            "latitude": 48.5,
+            "longitude": -123.5,
+        },
+        coords={"index": np.arange(n)},
+        attrs={"station": station, "project": "test"},
+    )
+    if with_oxygen:
+        ds["DOXY"] = ("index", np.full(n, 300.0))
+    ds["TEMP"].attrs["units"] = "degC"
+    return ds
+
+
+class TestRaggedArray:
+    def test_ragged_array_dimensions(self):
+        ds = profiles_to_ragged_array(
+            [_get_profile(10, "S1"), _get_profile(5, "S2"), _get_profile(3, "S3")]
+        )
+        assert ds.sizes == {"obs": 18, "profile": 3}
+        assert ds["rowSize"].values.tolist() == [10, 5, 3]
+        assert ds["rowSize"].attrs["sample_dimension"] == "obs"
+        assert ds["profile_id"].attrs["cf_role"] == "profile_id"
+        assert ds.attrs["featureType"] == "profile"
+        assert ds.attrs["Conventions"] == "CF-1.8"
+
+    def test_ragged_array_variables(self):
+        ds = profiles_to_ragged_array([_get_profile(10, "S1"), _get_profile(5, "S2")])
+        assert ds["TEMP"].dims == ("obs",)
+        assert ds["TEMP"].attrs["units"] == "degC"
+        assert ds["time"].dims == ("profile",)
+        assert ds["station"].values.tolist() == ["S1", "S2"]
+        assert "index" not in ds.variables
+        assert ds.attrs["project"] == "test"
+        assert "station" not in ds.attrs
+
+    def test_ragged_array_missing_variable(self):
+        ds = profiles_to_ragged_array(
+            [
+                _get_profile(4, "S1", with_oxygen=False),
+                _get_profile(3, "S2"),
+                _get_profile(2, "S3", with_oxygen=False),
+            ]
+        )
+        assert np.isnan(ds["DOXY"].values[:4]).all()
+        assert (ds["DOXY"].values[4:7] == 300).all()
+        assert np.isnan(ds["DOXY"].values[7:]).all()
+
+    def test_ragged_array_drop_different_global_attributes(self):
+        profiles = [_get_profile(2, "S1"), _get_profile(2, "S2")]
+        profiles[1].attrs["project"] = "other"
+        ds = profiles_to_ragged_array(profiles)
+        assert "project" not in ds.attrs
+
+    def test_ragged_array_multiple_dimensions(self):
+        ds = _get_profile(2, "S1").expand_dims("other")
+        with pytest.raises(ValueError, match="single dimension"):
+            profiles_to_ragged_array([ds])
+
+    def test_ragged_array_no_profile(self):
+        with pytest.raises(ValueError, match="No profile"):
+            profiles_to_ragged_array([])
+
+
+class TestProfileCollection:
+    def test_seabird_cnv_collection(self, tmp_path):
+        files = sorted(
+            glob("tests/parsers_test_files/seabird/**/*.cnv", recursive=True)
+        )
+        output = write_profile_collection(
+            files, tmp_path / "collection.nc", parser="seabird.cnv"
+        )
+        ds = xr.open_dataset(output)
+        assert ds.sizes["profile"] == len(files)
+        assert ds["source"].values.tolist() == files
+        assert ds["rowSize"].sum() == ds.sizes["obs"]
+
+    def test_odf_collection(self, tmp_path):
+        files = sorted(glob("tests/parsers_test_files/dfo/odf/bio/CTD/CTD_HUD*.ODF"))
+        output = write_profile_collection(
+            files, tmp_path / "collection.nc", parser="dfo.odf.bio_odf"
+        )
+        ds = xr.open_dataset(output)
+        assert ds.sizes["profile"] == len(files)
+        assert ds["time"].dims == ("profile",)
+        assert not ds["time"].isnull().any()
+
+    def test_collection_without_files(self, tmp_path):
+        with pytest.raises(ValueError, match="No files"):
+            write_profile_collection("unknown/*.cnv", tmp_path / "collection.nc")
@@ -3,6 +3,7 @@ from time import sleep
 
 import pandas as pd
 
+from ocean_data_parser import read
 from ocean_data_parser.batch.convert import FileConversionRegistry
 
 from .utils import compare_text_files
@@ -331,3 +332,57 @@ class TestFileRegistry:
         missing_files = file_registry.get_missing_sources()
         assert missing_files, "failed to detect missing file"
         assert missing_files == [test_saved_path]
+
+    def _count_detections(self, monkeypatch) -> list:
+        detections = []
+        detect_file_format = read.detect_file_format
+
+        def _detect_file_format(path, **kwargs):
+            detections.append(path)
+            return detect_file_format(path, **kwargs)
+
+        monkeypatch.setattr(read, "detect_file_format", _detect_file_format)
+        return detections
+
+    def test_detect_file_formats(self, tmp_path, monkeypatch):
+        detections = self._count_detections(monkeypatch)
+        sources = [
+            Path("tests/parsers_test_files/seabird/btl/MI18MHDR.btl"),
+            Path("tests/parsers_test_files/dfo/nafc/pcnv/ctd/cab041_2023_011.pcnv"),
+        ]
+        expected_parsers = dict(zip(sources, ["seabird.btl", "dfo.nafc.pcnv"]))
+        file_registry = FileConversionRegistry(path=tmp_path / "registry.csv")
+        file_registry.add(sources)
+        assert file_registry.detect_file_formats(sources) == expected_parsers
+        assert len(detections) == 2
+        file_registry.save()
+
+        # Reuse the parsers saved in the registry
+        file_registry = FileConversionRegistry(path=tmp_path / "registry.csv")
+        assert file_registry.detect_file_formats(sources) == expected_parsers
+        assert len(detections) == 2, "Parsers were detected again"
+
+        assert file_registry.detect_file_formats(sources, redetect=True) == (
+            expected_parsers
+        )
+        assert len(detections) == 4, "redetect didn't detect the parsers again"
+
+        monkeypatch.setattr(read, "get_detection_rules_version", lambda: "new")
+        assert file_registry.detect_file_formats(sources) == expected_parsers
+        assert len(detections) == 6, "New detection rules didn't detect again"
+
+    def test_detect_file_formats_modified_source(self, tmp_path, monkeypatch):
+        detections = self._count_detections(monkeypatch)
+        source = tmp_path / "MI18MHDR.btl"
+        source.write_bytes(
+            Path("tests/parsers_test_files/seabird/btl/MI18MHDR.btl").read_bytes()
+        )
+        file_registry = FileConversionRegistry(path=tmp_path / "registry.csv")
+        file_registry.add([source])
+        assert file_registry.detect_file_formats() == {source: "seabird.btl"}
+        assert file_registry.detect_file_formats() == {source: "seabird.btl"}
+        assert len(detections) == 1
+
+        source.write_text("unknown file format")
+        assert file_registry.detect_file_formats() == {source: None}
+        assert len(detections) == 2
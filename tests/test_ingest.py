@@ -0,0 +1,187 @@
+import socket
+import struct
+import time
+from functools import reduce
+from glob import glob
+from operator import xor
+from threading import Thread
+
+import pandas as pd
+import pytest
+import xarray as xr
+
+from ocean_data_parser.ingest import NMEAIngest
+from ocean_data_parser.parsers import nmea
+
+NMEA_FILE = "tests/parsers_test_files/nmea/seaspan/nmeadata-2022-07-04_13.txt"
+
+
+def _read_lines(path, n_lines=None):
+    with open(path, "rb") as file_handle:
+        return file_handle.readlines()[:n_lines]
+
+
+def _replay(protocol, address, lines):
+    if protocol == "tcp":
+        with socket.create_connection(address) as sock:
+            sock.sendall(b"".join(lines))
+    else:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            for line in lines:
+                sock.sendto(line, address)
+                time.sleep(0.001)
+
+
+def _serve(ingest, protocol, lines):
+    address = ingest.bind()
+    thread = Thread(target=ingest.serve)
+    thread.start()
+    _replay(protocol, ("127.0.0.1", address[1]), lines)
+    time.sleep(0.5)
+    ingest.stop()
+    thread.join()
+
+
+def _expected_dataframe(lines, tmp_path):
+    source = tmp_path / "source.txt"
+    source.write_bytes(b"".join(lines))
+    return nmea.nmea_0183(source).to_dataframe()
+
+
+@pytest.mark.parametrize(
+    ("protocol", "n_lines"), [("tcp", None), ("udp", 200)], ids=["tcp", "udp"]
+)
+def test_nmea_ingest_socket_replay(protocol, n_lines, tmp_path):
+    lines = _read_lines(NMEA_FILE, n_lines)
+    ingest = NMEAIngest(
+        tmp_path / "output", protocol=protocol, host="127.0.0.1", port=0, max_lines=500
+    )
+    _serve(ingest, protocol, lines)
+
+    assert ingest.outputs
+    result = pd.concat(
+        [xr.open_dataset(file).to_dataframe() for file in ingest.outputs]
+    )
+    expected = _expected_dataframe(lines, tmp_path)
+    assert len(result) == len(expected)
+    assert (result["row"].values == expected["row"].values).all()
+    assert (result["sentence_type"].values == expected["sentence_type"].values).all()
+    assert result["receive_time"].notna().all()
+
+
+def test_nmea_ingest_batches(tmp_path):
+    lines = [line.decode() for line in _read_lines(NMEA_FILE, 300)]
+    ingest = NMEAIngest(tmp_path, max_lines=100, max_interval=60, partition="1h")
+    start = pd.Timestamp("2024-01-01T00:59:00")
+
+    # Flush on size
+    assert len(ingest.add_lines(lines[:250], start)) == 2
+    assert len(ingest.lines) == 50
+    # Flush on time partition
+    outputs = ingest.add_lines(lines[250:260], start + pd.Timedelta("2min"))
+    assert len(outputs) == 1
+    assert "_20240101T000000Z_" in outputs[0].name
+    # Flush on time
+    assert ingest.flush_expired(start + pd.Timedelta("2min30s")) is None
+    output = ingest.flush_expired(start + pd.Timedelta("3min"))
+    assert "_20240101T010000Z_" in output.name
+
+    result = pd.concat(
+        [xr.open_dataset(file).to_dataframe() for file in ingest.outputs]
+    )
+    assert len(result) == len(nmea.nmea_0183_text("".join(lines[:260])).to_dataframe())
+
+
+def test_nmea_ingest_parquet(tmp_path):
+    pytest.importorskip("pyarrow")
+    lines = [line.decode() for line in _read_lines(NMEA_FILE, 100)]
+    ingest = NMEAIngest(tmp_path, output_format="parquet")
+    ingest.add_lines(lines)
+    output = ingest.flush()
+    assert output.suffix == ".parquet"
+    df = pd.read_parquet(output)
+    assert len(df) == len(nmea.nmea_0183_text("".join(lines)).to_dataframe())
+    assert glob(str(tmp_path / "nmea_*.parquet")) == [str(output)]
+
+
+def test_nmea_ingest_failed_flush_keeps_batch(tmp_path):
+    lines = [line.decode() for line in _read_lines(NMEA_FILE, 100)]
+    output_dir = tmp_path / "output"
+    output_dir.write_text("not a directory")
+    ingest = NMEAIngest(output_dir, max_interval=60)
+    start = pd.Timestamp("2024-01-01T00:00:00")
+    ingest.add_lines(lines, start)
+
+    assert ingest.flush_expired(start + pd.Timedelta("1min")) is None
+    assert len(ingest.lines) == 100
+    output_dir.unlink()
+    # Retry once max_interval passed since the failure
+    assert ingest.flush_expired(start + pd.Timedelta("1min30s")) is None
+    output = ingest.flush_expired(start + pd.Timedelta("2min"))
+    assert output.exists()
+    assert not ingest.lines
+    assert len(xr.open_dataset(output)["row"]) == len(
+        nmea.nmea_0183_text("".join(lines)).to_dataframe()
+    )
+
+
+def test_nmea_ingest_failed_flush_bounded_buffer(tmp_path):
+    lines = [line.decode() for line in _read_lines(NMEA_FILE, 250)]
+    output_dir = tmp_path / "output"
+    output_dir.write_text("not a directory")
+    ingest = NMEAIngest(output_dir, max_lines=100, partition="1h")
+    start = pd.Timestamp("2024-01-01T00:00:00")
+
+    assert not ingest.add_lines(lines, start)
+    assert len(ingest.lines) == 100
+    # Lines from a new partition aren't mixed with the pending batch
+    assert not ingest.add_lines(lines[:10], start + pd.Timedelta("1h"))
+    assert len(ingest.lines) == 100
+    output_dir.unlink()
+    outputs = ingest.add_lines(lines[:10], start + pd.Timedelta("1h2min"))
+    assert len(outputs) == 1
+    assert "_20240101T000000Z_" in outputs[0].name
+    assert len(ingest.lines) == 10
+
+
+@pytest.mark.parametrize("engine", nmea.NMEA_0183_ENGINES)
+def test_nmea_ingest_rejected_lines(engine, tmp_path):
+    lines = [line.decode() for line in _read_lines(NMEA_FILE, 100)]
+    # Sentence with a valid checksum and a heading which isn't a number
+    bad_line = f"$GPHDT,abc,T*{reduce(xor, map(ord, 'GPHDT,abc,T')):02X}\n"
+    ingest = NMEAIngest(tmp_path, engine=engine)
+    start = pd.Timestamp("2024-01-01T00:00:00")
+    ingest.add_lines([*lines[:50], bad_line, *lines[50:]], start)
+
+    output = ingest.flush()
+    assert not ingest.lines
+    assert [path.read_text() for path in tmp_path.glob("*.rejected")] == [bad_line]
+    result = xr.open_dataset(output).to_dataframe()
+    expected = nmea.nmea_0183_text("".join(lines)).to_dataframe()
+    assert len(result) == len(expected)
+    assert 50 not in result["row"].values
+
+    # Following lines are still saved
+    ingest.add_lines(lines, start)
+    assert ingest.flush() is not None
+
+
+def test_nmea_ingest_connection_reset(tmp_path):
+    lines = _read_lines(NMEA_FILE, 50)
+    ingest = NMEAIngest(tmp_path, protocol="tcp", host="127.0.0.1", port=0)
+    address = ("127.0.0.1", ingest.bind()[1])
+    thread = Thread(target=ingest.serve)
+    thread.start()
+    # Reset the connection with pending data
+    sock = socket.create_connection(address)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0))
+    sock.sendall(b"".join(lines[:10]))
+    time.sleep(0.2)
+    sock.close()
+    time.sleep(0.2)
+    assert thread.is_alive()
+    _replay("tcp", address, lines[10:])
+    time.sleep(0.5)
+    ingest.stop()
+    thread.join()
+    assert ingest.row == len(lines)
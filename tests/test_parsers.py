@@ -1,13 +1,17 @@
+import os
 import re
 from glob import glob
+from io import BytesIO
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import pytest
 import xarray as xr
 from loguru import logger
 from pytz.exceptions import AmbiguousTimeError
 
+from ocean_data_parser import read
 from ocean_data_parser.batch.utils import get_path_generation_input
 from ocean_data_parser.parsers import (
     amundsen,
@@ -76,6 +80,35 @@ class TestPMEParsers:
         ds = pme.txt(path)
         review_parsed_dataset(ds, path, caplog)
 
+    @pytest.mark.parametrize("instrument", ["minidot", "wiper"])
+    def test_txts_parser(self, instrument):
+        paths = sorted(glob(f"tests/parsers_test_files/pme/{instrument}/*.txt"))
+        ds = pme.txts(paths[::-1])
+        assert ds["time"].dtype == "datetime64[ns]"
+        assert ds.indexes["time"].is_monotonic_increasing
+        assert ds.sizes["time"] == sum(pme.txt(path).sizes["index"] for path in paths)
+
+        # Overlapping files are deduplicated
+        overlapping = pme.txts(paths + paths[:2], max_workers=2)
+        assert overlapping.equals(ds)
+
+    def test_txts_parser_without_renaming(self):
+        paths = sorted(glob("tests/parsers_test_files/pme/minidot/*.txt"))
+        ds = pme.txts(paths, rename_variables=False)
+        assert "Time (sec)" in ds.dims
+        assert ds.indexes["Time (sec)"].is_monotonic_increasing
+
+    def test_txts_parser_without_records(self, tmp_path):
+        path = min(glob("tests/parsers_test_files/pme/minidot/*.txt"))
+        with open(path) as f:
+            header = [f.readline()]
+            while "Time (sec)" not in header[-1]:
+                header.append(f.readline())
+        empty_path = tmp_path / "empty.txt"
+        empty_path.write_text("".join(header))
+        with pytest.raises(ValueError, match="No PME txt file to read"):
+            pme.txts([str(empty_path)])
+
 
 class TestSeabirdParsers:
     @pytest.mark.parametrize("path", glob("tests/parsers_test_files/seabird/**/*.btl"))
@@ -93,6 +126,62 @@ class TestSeabirdParsers:
         ds = seabird.cnv(path, generate_instrument_variables=True)
         review_parsed_dataset(ds, path, caplog, max_log_levelno=20)
 
+    @pytest.mark.parametrize(
+        "path", glob("tests/parsers_test_files/seabird/**/*.cnv", recursive=True)
+    )
+    def test_binary_cnv_parser(self, path, tmp_path):
+        ds = seabird.cnv(path)
+        header, data = Path(path).read_bytes().split(b"*END*", 1)
+        data_start = data.index(b"\n") + 1
+        binary_file = tmp_path / "binary.cnv"
+        binary_file.write_bytes(
+            header.replace(b"file_type = ascii", b"file_type = binary")
+            + b"*END*"
+            + data[:data_start]
+            + np.loadtxt(BytesIO(data[data_start:]), ndmin=2).astype("<f4").tobytes()
+        )
+
+        ds_binary = seabird.cnv(binary_file)
+        assert ds_binary.attrs["file_type"] == "binary"
+        assert list(ds_binary.variables) == list(ds.variables)
+        for var in ds.data_vars:
+            assert ds_binary[var].dtype in ("float32", ds[var].dtype)
+            np.testing.assert_allclose(ds_binary[var], ds[var], rtol=1e-6)
+
+    def test_add_seabird_instruments_by_sdn_parameter_urn(self):
+        path = "tests/parsers_test_files/seabird/ctd/1_datCnv_SBE19plus_01907674_2022_05_17_0002.cnv"
+        header = Path(path).read_text().split("*END*")[0]
+        variables = {
+            "TEMP": ("Temperature", "TEMPPR01"),
+            "FLUO": ("Fluorometer, Seapoint [mg/m^3]", "CPHLPR01"),
+            "FLUO_2": ("Fluorescence, WET Labs ECO-AFL/FL", "CPHLPR01"),
+            "UNKNOWN": ("Unknown", "XXXXXX01"),
+        }
+        ds = xr.Dataset()
+        for var, (long_name, code) in variables.items():
+            ds[var] = ("index", [0.0])
+            ds[var].attrs = {
+                "long_name": long_name,
+                "sdn_parameter_urn": f"SDN:P01::{code}",
+            }
+
+        ds = seabird._add_seabird_instruments(ds, header, match_by="sdn_parameter_urn")
+        assert ds["TEMP"].attrs["instrument"] == "Temperature"
+        assert ds["FLUO"].attrs["instrument"] == "Fluorometer, Seapoint"
+        assert "instrument" not in ds["FLUO_2"].attrs
+        assert "instrument" not in ds["UNKNOWN"].attrs
+
+    def test_cnv_xml_cache(self):
+        path = "tests/parsers_test_files/seabird/ctd/1_datCnv_SBE19plus_01907674_2022_05_17_0002.cnv"
+        seabird._parse_cached_xml.cache_clear()
+        ds = seabird.cnv(path, generate_instrument_variables=True)
+        misses = seabird._parse_cached_xml.cache_info().misses
+        ds_cached = seabird.cnv(path, generate_instrument_variables=True)
+        cache_info = seabird._parse_cached_xml.cache_info()
+        assert cache_info.misses == misses
+        assert cache_info.hits >= misses
+        assert ds_cached.identical(ds)
+
 
 class TestVanEssenParsers:
     @pytest.mark.parametrize(
@@ -133,6 +222,24 @@ class TestOnsetParser:
         with pytest.raises(AmbiguousTimeError):
             onset.csv(path)
 
+    def test_parse_mixed_datetime(self):
+        times = pd.Series(
+            [
+                "07/04/22 01:02:03 PM",
+                "2022-07-04 13:02:03",
+                "7/4/2022 13:02:03",
+                "22-07-04 1:02",
+                "2022-07-04 1:02:03 PM",
+                "2022-07-04T13:02:03",
+                "07/04/22 13:02",
+            ]
+            * 10
+        )
+        expected = times.apply(
+            lambda x: pd.to_datetime(x, format=onset._get_time_format(x))
+        )
+        pd.testing.assert_series_equal(onset._parse_mixed_datetime(times), expected)
+
     @pytest.mark.parametrize("path", glob("tests/parsers_test_files/onset/**/*.xlsx"))
     def test_xlsx_parser(self, path, caplog):
         """Test Onset XLSX parser."""
@@ -150,6 +257,11 @@ class TestOnsetParser:
             ),
         )
 
+    @pytest.mark.parametrize("path", glob("tests/parsers_test_files/onset/**/*.xlsx"))
+    def test_xlsx_detection(self, path):
+        assert read.detect_file_format(path) == "onset.xlsx"
+        assert onset.is_hoboconnect_xlsx(path)
+
 
 class TestRBRParser:
     @pytest.mark.parametrize("path", glob("tests/parsers_test_files/rbr/rtext/*.txt"))
@@ -192,6 +304,70 @@ class TestNMEAParser:
         ds = nmea.nmea_0183(path)
         review_parsed_dataset(ds, path, caplog)
 
+    @pytest.mark.parametrize(
+        "path",
+        [
+            path
+            for path in glob("tests/parsers_test_files/nmea/**/*")
+            if not path.endswith(".nc")
+        ],
+    )
+    def test_nmea_vectorized_engine(self, path):
+        ds = nmea.nmea_0183(path)
+        ds_vectorized = nmea.nmea_0183(path, engine="vectorized")
+        assert ds.identical(ds_vectorized)
+        for var in ds:
+            assert ds[var].dtype == ds_vectorized[var].dtype
+
+    def test_nmea_vectorized_engine_fallback(self, tmp_path):
+        path = tmp_path / "nmea.txt"
+        path.write_text(
+            "\n".join(
+                [
+                    "2022-01-01 $GPGGA,123519,4807.038,N,01131.000,W,1,08,0.9,545.4,M,46.9,M,,*55",
+                    "2022-01-01 $GPRMC,123519.55,A,4807.038,N,01131.000,E,022.4,084.4,230394,003.1,W",
+                    "2022-01-01 $GPZDA,201530.00,04,07,2002,00,00*60",
+                    "2022-01-01 $WIMWV,214.8,R,0.1,M,A*2E",
+                    "2022-01-01 $HCHDT,123.4,T*00",
+                    "2022-01-01 $PGRME,15.0,M,45.0,M,25.0,M*1C",
+                    "2022-01-01 $GPGGA,123519,,N,01131.000,E,1,08,0.9,545.4,M,46.9,M,,",
+                    "missing delimiter",
+                ]
+            )
+        )
+        ds = nmea.nmea_0183(path)
+        ds_vectorized = nmea.nmea_0183(path, engine="vectorized")
+        assert ds.identical(ds_vectorized)
+
+    @pytest.mark.parametrize("engine", nmea.NMEA_0183_ENGINES)
+    def test_nmea_follower(self, engine, tmp_path):
+        source = "tests/parsers_test_files/nmea/seaspan/nmeadata-2022-07-04_13.txt"
+        with open(source, "rb") as file_handle:
+            data = file_handle.read()
+        path = tmp_path / "nmea.txt"
+        path.write_bytes(b"")
+
+        follower = nmea.NMEAFollower(path, engine=engine)
+        assert follower.read() is None
+        datasets = []
+        for start in range(0, len(data), 10000):
+            with open(path, "ab") as file_handle:
+                file_handle.write(data[start : start + 10000])
+            ds = follower.read()
+            if ds is not None:
+                datasets.append(ds.to_dataframe())
+
+        expected = nmea.nmea_0183(source).to_dataframe()
+        result = pd.concat(datasets, ignore_index=True)
+        result.index.name = "index"
+        pd.testing.assert_frame_equal(result[expected.columns], expected)
+        assert follower.state["offset"] == len(data)
+
+        # Truncated files are read again from the beginning
+        path.write_bytes(data[:1000])
+        ds = follower.read()
+        assert ds["row"].values[0] == 0
+
 
 class TestAmundsenParser:
     @pytest.mark.parametrize(
@@ -234,6 +410,38 @@ class TestAmundsenParser:
             ignore_log_records="Duplicated variable",
         )
 
+    def test_amundsen_int_first_record_after_blank_header_line(self):
+        ds = amundsen.int_format(
+            "tests/parsers_test_files/amundsen/12715_TSG_trajectory/"
+            "Amundsen_TSG_V3/Data/TSG_2005001.int"
+        )
+        assert ds["time"].values[0] == pd.Timestamp("2005-08-22T22:26:00")
+        assert ds.attrs["time_coverage_start"] == "2005-08-22T22:26:00Z"
+
+    def test_amundsen_convert_timestamp_60_seconds(self):
+        df = amundsen._convert_timestamp(
+            pd.DataFrame(
+                {
+                    "Date": ["2020-01-01", "2020-01-01"],
+                    "Hour": ["00:00:59", "00:00:60"],
+                }
+            )
+        )
+        assert df["time"].tolist() == [
+            pd.Timestamp("2020-01-01T00:00:59Z"),
+            pd.Timestamp("2020-01-01T00:01:00Z"),
+        ]
+
+    def test_amundsen_vocabulary_loaded_once(self):
+        assert amundsen.amundsen_vocabulary("TSG") is amundsen.amundsen_vocabulary(
+            "TSG"
+        )
+        assert all(
+            item["file_type"] == "TSG"
+            for items in amundsen.amundsen_vocabulary("TSG").values()
+            for item in items
+        )
+
 
 class TestIOSShellParser:
     @pytest.mark.parametrize(
@@ -569,6 +777,44 @@ class TestDfoNafcPcnvFiles:
         assert ds.attrs["swell_height"]
         assert ds.attrs["swell_dir"]
 
+    def test_dfo_nafc_ctd_pcnv_with_given_metqa_file(self, tmp_path):
+        """Test DFO NAFC Pcnv Parser with a metqa file from another directory."""
+        path = tmp_path / "cab041_2023_012.pcnv"
+        path.write_bytes(
+            Path(
+                "tests/parsers_test_files/dfo/nafc/pcnv/ctd/cab041_2023_012.pcnv"
+            ).read_bytes()
+        )
+        ds = dfo.nafc.pcnv(
+            path,
+            metqa_file="tests/parsers_test_files/dfo/nafc/pcnv/ctd/cab041_2023_metqa_updated.csv",
+        )
+        assert ds.attrs["swell_height"]
+        assert ds.attrs["swell_dir"]
+
+    def test_dfo_nafc_metqa_index(self):
+        """Test DFO NAFC metqa table index by station."""
+        index = dfo.nafc._get_metqa_index(
+            "tests/parsers_test_files/dfo/nafc/pcnv/ctd/cab041_2023_metqa_updated.csv"
+        )
+        assert index["cab041_2023_012"]["station"] == "cab041_2023_012"
+        assert index is dfo.nafc._get_metqa_index(
+            "tests/parsers_test_files/dfo/nafc/pcnv/ctd/cab041_2023_metqa_updated.csv"
+        )
+
+    def test_dfo_nafc_list_metqa_files(self, tmp_path):
+        """Test DFO NAFC metqa files listing is refreshed when the directory changes."""
+        (tmp_path / "cab041_2023_metqa_updated.csv").touch()
+        assert list(dfo.nafc._list_metqa_files(tmp_path)) == ["cab041_2023"]
+
+        (tmp_path / "cab042_2023_metqa_updated.csv").touch()
+        modified_time = tmp_path.stat().st_mtime_ns + 10**6
+        os.utime(tmp_path, ns=(modified_time, modified_time))
+        assert sorted(dfo.nafc._list_metqa_files(tmp_path)) == [
+            "cab041_2023",
+            "cab042_2023",
+        ]
+
 
 # pylint: disable=W0212
 class TestDfoNafcPFiles:
@@ -693,6 +939,18 @@ class TestDfoNafcPFiles:
         assert matched_vocabulary
         assert len(matched_vocabulary) == 1
 
+    def test_p_file_variable_vocabulary_mapper_instrument(self):
+        matched_vocabulary = dfo.nafc._get_pfile_variable_vocabulary(
+            "FLOR", "WET Labs ECO-AFL/FL"
+        )
+        assert [item["accepted_instruments"] for item in matched_vocabulary][1:] == [
+            "WET Labs ECO-AFL/FL"
+        ]
+
+        # Returned items can be modified without changing the vocabulary
+        matched_vocabulary[0].pop("variable_name")
+        assert "variable_name" in dfo.nafc._get_pfile_variable_vocabulary("flor")[0]
+
     def test_p_file_unknown_variable_vocabulary_mapper(self):
         matched_vocabulary = dfo.nafc._get_pfile_variable_vocabulary("xxx")
         assert not matched_vocabulary
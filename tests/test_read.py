@@ -5,7 +5,7 @@ from pathlib import Path
 import pytest
 from xarray import Dataset
 
-from ocean_data_parser import read
+from ocean_data_parser import PARSERS, read
 from ocean_data_parser.parsers import onset
 
 logging.basicConfig(level=logging.DEBUG)
@@ -31,18 +31,78 @@ auto_detection_ignore_extensions = (".nc", ".DS_Store")
 def test_automated_parser_detection(file):
     parser = read.detect_file_format(file)
     assert parser, "No parser was associated"
-    parser = parser.replace("_format", "")
+    assert parser in PARSERS, f"Detected parser {parser} is missing from PARSERS"
+    parser = parser.replace("_format", "").replace("_0183", "")
     assert parser, f"Test file {file} doesn't match any parser"
     assert all(item.lower() in file.lower() for item in re.split(r"\.|_", parser)), (
         f"Parser wasn't match to the right parser: {parser}"
     )
 
 
+def test_detection_rules_parsers():
+    assert {rule.parser for rule in read.DETECTION_RULES} <= set(PARSERS)
+
+
+@pytest.mark.parametrize("parser", PARSERS)
+def test_parsers_list(parser):
+    assert len(PARSERS) == len(set(PARSERS)), "PARSERS has duplicated entries"
+    assert callable(read.import_parser(parser))
+
+
 onset_file = (
     "tests/parsers_test_files/onset/tidbit_v2/QU5_Mooring_60m_20392474_20220222.csv"
 )
 
 
+def test_detect_file_formats():
+    files = [
+        "tests/parsers_test_files/seabird/btl/MI18MHDR.btl",
+        "tests/parsers_test_files/dfo/nafc/pcnv/ctd/cab041_2023_011.pcnv",
+        onset_file,
+    ]
+    assert read.detect_file_formats(files) == {
+        file: read.detect_file_format(file) for file in files
+    }
+
+
+def test_detect_file_formats_errors(tmp_path):
+    unknown_file = tmp_path / "unknown.xyz"
+    unknown_file.write_text("unknown file format")
+    with pytest.raises(ImportError):
+        read.detect_file_formats([unknown_file])
+    assert read.detect_file_formats([unknown_file], errors="ignore") == {
+        unknown_file: None
+    }
+
+
+@pytest.fixture
+def detection_rules(monkeypatch):
+    """Restore the detection rules and clear their caches after the test."""
+    monkeypatch.setattr(read, "DETECTION_RULES", list(read.DETECTION_RULES))
+    yield read.DETECTION_RULES
+    read._get_candidate_rules.cache_clear()
+    read.get_detection_rules_version.cache_clear()
+
+
+def test_register_detection_rule(tmp_path, detection_rules):
+    custom_file = tmp_path / "custom.XYZ"
+    custom_file.write_text("CUSTOM HEADER\nSerial=1234\n")
+    rules_version = read.get_detection_rules_version()
+
+    read.register_detection_rule(
+        "custom.parser", extensions=["xyz"], contains=["CUSTOM HEADER"]
+    )
+    assert read.detect_file_format(custom_file) == "custom.parser"
+    read.register_detection_rule(
+        "custom.serial_parser",
+        extensions=["xyz"],
+        patterns=[r"Serial=\d+"],
+        priority=5,
+    )
+    assert read.detect_file_format(custom_file) == "custom.serial_parser"
+    assert read.get_detection_rules_version() != rules_version
+
+
 @pytest.mark.parametrize(
     ("file_path", "parser"),
     [(onset_file, None), (onset_file, "onset.csv"), (onset_file, onset.csv)],
@@ -51,3 +111,34 @@ def test_read_file_parser_inputs(file_path, parser):
     """Test if read.file can accept parsers as None, string and parser it self."""
     dataset = read.file(file_path, parser=parser)
     assert isinstance(dataset, Dataset), "Output isn't an xarray dataset"
+
+
+@pytest.mark.parametrize(
+    ("file_path", "parser"),
+    [
+        (
+            "tests/parsers_test_files/dfo/odf/bio/CTD/CTD_HUD2001061_304_01_DN.ODF",
+            "dfo.odf.bio_odf",
+        ),
+        (
+            "tests/parsers_test_files/seabird/ctd/1_datCnv_SBE19plus_01907674_2022_05_17_0002.cnv",
+            "seabird.cnv",
+        ),
+        ("tests/parsers_test_files/amundsen/11927/1304_112.int", "amundsen.int_format"),
+        (
+            "tests/parsers_test_files/onset/tidbit_v2/703_PT_20409269_20220105_corrected.csv",
+            "onset.csv",
+        ),
+        ("tests/parsers_test_files/star_oddi/S11412/1S11412.DAT", "star_oddi.dat"),
+        (
+            "tests/parsers_test_files/van_essen_instruments/ctd_divers/VEI_X2427_220223095229_X2427.MON",
+            "van_essen_instruments.mon",
+        ),
+    ],
+)
+def test_read_file_compact_dtype_policy(file_path, parser):
+    """Test if the compact dtype policy reduces the dataset memory footprint."""
+    dataset = read.file(file_path, parser=parser)
+    compact = read.file(file_path, parser=parser, dtype_policy="compact")
+    assert compact.nbytes < dataset.nbytes
+    assert set(compact.variables) == set(dataset.variables)
@@ -1,8 +1,11 @@
+import importlib.util
 import json
+from io import StringIO
 
 import numpy as np
 import pandas as pd
 import pytest
+import xarray as xr
 
 from ocean_data_parser.parsers import utils
 
@@ -65,3 +68,390 @@ def test_standardize_attribute(value, dtype, expected_value):
     assert all(is_equal) if isinstance(expected_value, np.ndarray) else is_equal, (
         "Attribute was not converted to expected value"
     )
+
+
+def _get_timeseries_dataset(n=1000):
+    return xr.Dataset(
+        {
+            "temperature": ("time", np.random.rand(n)),
+            "flag": ("time", np.ones(n, dtype="int8")),
+            "comment": ("time", np.array(["test"] * n, dtype=object)),
+            "latitude": 48.5,
+        },
+        coords={"time": pd.date_range("2024-01-01", periods=n, freq="10min")},
+    )
+
+
+@pytest.mark.parametrize("preset", list(utils.ENCODING_PRESETS.keys()))
+def test_encoding_preset(preset, tmp_path):
+    ds = utils.standardize_dataset(_get_timeseries_dataset())
+    ds = utils.apply_encoding_preset(ds, preset)
+    assert ds["temperature"].encoding.get("zlib", False) == utils.ENCODING_PRESETS[
+        preset
+    ].get("zlib", False)
+    assert "zlib" not in ds["comment"].encoding
+    assert "zlib" not in ds["latitude"].encoding
+    assert ds["time"].encoding["units"].startswith("seconds since")
+    ds.to_netcdf(tmp_path / "test.nc")
+    assert xr.open_dataset(tmp_path / "test.nc")["temperature"].size == 1000
+
+
+def test_encoding_preset_chunksizes():
+    ds = utils.apply_encoding_preset(_get_timeseries_dataset(10**6), "timeseries-read")
+    assert ds["temperature"].encoding["chunksizes"] == (2**16,)
+    ds = utils.apply_encoding_preset(_get_timeseries_dataset(1000), "small")
+    assert ds["temperature"].encoding["chunksizes"] == (1000,)
+
+
+@pytest.mark.parametrize(
+    ("dims", "shape", "chunk_dimension", "expected"),
+    [
+        (("time",), (100,), None, (100,)),
+        (("time",), (10**6,), None, (1000,)),
+        (("time", "depth"), (10**6, 10), None, (100, 10)),
+        (("time", "depth"), (10**6, 10), "time", (1000, 1)),
+        (("time",), (0,), None, (1,)),
+    ],
+)
+def test_get_chunksizes(dims, shape, chunk_dimension, expected):
+    assert utils._get_chunksizes(dims, shape, 1000, chunk_dimension) == expected
+
+
+def test_encoding_preset_variables_overwrite():
+    ds = utils.apply_encoding_preset(
+        _get_timeseries_dataset(),
+        {"preset": "small", "variables": {"temperature": {"complevel": 1}}},
+    )
+    assert ds["temperature"].encoding["complevel"] == 1
+    assert ds["flag"].encoding["complevel"] == 9
+
+
+def test_unknown_encoding_preset():
+    with pytest.raises(ValueError, match="Unknown encoding preset"):
+        utils.apply_encoding_preset(_get_timeseries_dataset(), "unknown")
+
+
+def _get_resolution_dataset(n=1000, resolution=0.001, scale=30):
+    ds = xr.Dataset(
+        {
+            "TEMP": ("index", np.round(np.random.rand(n) * scale, 3)),
+            "QTEMP": ("index", np.ones(n)),
+        }
+    )
+    ds["TEMP"].attrs["resolution"] = resolution
+    ds["TEMP"][0] = np.nan
+    ds["QTEMP"].attrs = {"resolution": 1, "flag_values": [0, 1]}
+    return utils.standardize_dataset(ds)
+
+
+@pytest.mark.parametrize(("scale", "dtype"), [(30, "int16"), (3000, "int32")])
+def test_pack_variables(tmp_path, scale, dtype):
+    ds = utils.pack_variables(_get_resolution_dataset(scale=scale))
+    assert ds["TEMP"].encoding["dtype"] == dtype
+    assert ds["TEMP"].encoding["scale_factor"] == 0.001
+    assert "scale_factor" not in ds["QTEMP"].encoding
+
+    ds.to_netcdf(tmp_path / "packed.nc")
+    packed = xr.open_dataset(tmp_path / "packed.nc")
+    assert packed["TEMP"].encoding["dtype"] == np.dtype(dtype)
+    assert np.isnan(packed["TEMP"].values[0])
+    assert np.nanmax(np.abs(packed["TEMP"].values - ds["TEMP"].values)) <= 0.001
+
+
+def test_pack_variables_with_resolutions():
+    ds = _get_resolution_dataset()
+    ds["TEMP"].attrs.pop("resolution")
+    assert "scale_factor" not in utils.pack_variables(ds)["TEMP"].encoding
+    ds = utils.pack_variables(ds, resolutions={"TEMP": 0.01})
+    assert ds["TEMP"].encoding["scale_factor"] == 0.01
+
+
+def test_pack_variables_out_of_range():
+    ds = _get_resolution_dataset(resolution=1e-9)
+    assert "scale_factor" not in utils.pack_variables(ds)["TEMP"].encoding
+
+
+def test_compact_dtype_policy(tmp_path):
+    ds = _get_resolution_dataset()
+    ds["station"] = ("index", np.array(["S1", "S2"] * 500, dtype=object))
+    ds = utils.apply_dtype_policy(ds, "compact")
+    assert ds["TEMP"].dtype == "float32"
+    assert ds["QTEMP"].dtype == "int8"
+    assert ds["station"].dtype == "S2"
+    assert ds["TEMP"].attrs["resolution"] == 0.001
+
+    ds.to_netcdf(tmp_path / "compact.nc")
+    compact = xr.open_dataset(tmp_path / "compact.nc")
+    assert compact["station"].values.tolist()[:2] == ["S1", "S2"]
+
+
+def test_compact_dtype_policy_flag_variables():
+    ds = _get_resolution_dataset()
+    ds["quantity"] = ("index", np.ones(1000))
+    ds["QUANTITY"] = ("index", np.ones(1000))
+    ds["temp_qc"] = ("index", np.ones(1000))
+    ds["status"] = ("index", np.ones(1000), {"flag_meanings": "good bad"})
+    ds = utils.apply_dtype_policy(ds, "compact")
+    assert ds["quantity"].dtype == "float32"
+    assert ds["QUANTITY"].dtype == "int8"
+    assert ds["temp_qc"].dtype == "int8"
+    assert ds["status"].dtype == "int8"
+
+
+def test_compact_dtype_policy_keep_precision():
+    ds = _get_resolution_dataset(resolution=1e-9)
+    ds["comment"] = (
+        "index",
+        np.array([f"comment {i}" for i in range(1000)], dtype=object),
+    )
+    ds = utils.apply_dtype_policy(ds, "compact")
+    assert ds["TEMP"].dtype == "float64"
+    assert ds["comment"].dtype == object
+
+
+def test_compact_dtype_policy_decimal_resolution():
+    values = np.linspace(-2, 30, 1000)
+    ds = xr.Dataset(
+        {
+            "rounded": ("index", values.round(3)),
+            "integers": ("index", values.round()),
+            "full": ("index", values),
+        }
+    )
+    ds = utils.apply_dtype_policy(ds, "compact")
+    assert ds["rounded"].dtype == "float32"
+    assert ds["integers"].dtype == "float32"
+    assert ds["full"].dtype == "float64"
+    assert np.allclose(ds["rounded"], values.round(3), atol=5e-4, rtol=0)
+
+
+def test_compact_dtype_policy_dataframe():
+    df = pd.DataFrame(
+        {
+            "temp": np.linspace(-2, 30, 1000).round(2),
+            "station": ["S1", "S2"] * 500,
+        }
+    )
+    df = utils.apply_dtype_policy(df, "compact")
+    assert df["temp"].dtype == "float32"
+    assert df["station"].dtype == object
+
+
+def test_default_dtype_policy():
+    ds = _get_resolution_dataset()
+    assert utils.apply_dtype_policy(ds, "default")["TEMP"].dtype == "float64"
+    with pytest.raises(ValueError, match="Unknown dtype_policy"):
+        utils.apply_dtype_policy(ds, "unknown")
+
+
+def test_standardize_dataset_fingerprint():
+    ds = utils.standardize_dataset(_get_timeseries_dataset())
+    assert utils.STANDARDIZED_FINGERPRINT in ds.encoding
+    standardized_attrs = dict(ds.attrs)
+    assert utils.standardize_dataset(ds).attrs == standardized_attrs
+
+
+def test_standardize_dataset_modified_variable():
+    ds = utils.standardize_dataset(_get_timeseries_dataset())
+    ds["temperature"] = ds["temperature"] + 10
+    ds["salinity"] = ds["temperature"] * 0 + 30
+    ds = utils.standardize_dataset(ds)
+    assert ds["temperature"].attrs["actual_range"][0] >= 10
+    assert ds["salinity"].attrs["actual_range"].tolist() == [30, 30]
+
+
+def test_standardize_dataset_modified_in_place():
+    ds = utils.standardize_dataset(_get_timeseries_dataset())
+    ds["temperature"][0] = 100
+    ds = utils.standardize_dataset(ds)
+    assert ds["temperature"].attrs["actual_range"][1] == 100
+
+
+def test_standardize_large_dataset_modified_in_place():
+    ds = utils.standardize_dataset(_get_timeseries_dataset(10**5))
+    ds["temperature"] += 100
+    ds = utils.standardize_dataset(ds)
+    assert ds["temperature"].attrs["actual_range"][0] >= 100
+    ds["temperature"].values[:] = 5
+    ds = utils.standardize_dataset(ds)
+    assert ds["temperature"].attrs["actual_range"].tolist() == [5, 5]
+
+
+def test_standardize_dataset_modified_coverage_and_attributes():
+    ds = utils.standardize_dataset(_get_timeseries_dataset())
+    ds["latitude"] = 50.0
+    ds["longitude"] = -60.0
+    ds.attrs["title"] = "test"
+    ds.attrs["project"] = {"name": "test"}
+    ds = utils.standardize_dataset(ds)
+    assert ds.attrs["geospatial_lat_min"] == 50.0
+    assert ds.attrs["project"] == '{"name": "test"}'
+
+
+@pytest.mark.parametrize("dtype", ["float64", "float32", "int32"])
+def test_compute_statistics(dtype):
+    values = np.arange(10**5).astype(dtype)
+    statistics = utils.compute_statistics(values)
+    assert statistics["min"] == 0
+    assert statistics["max"] == values.max()
+    assert statistics["count"] == statistics["finite_count"] == values.size
+
+
+def test_compute_statistics_with_nan():
+    values = np.random.rand(10**5)
+    values[[0, 10, 2**16 + 1]] = np.nan
+    values[5] = np.inf
+    statistics = utils.compute_statistics(values)
+    assert statistics["min"] == np.nanmin(values)
+    assert statistics["max"] == np.inf
+    assert statistics["count"] == values.size - 3
+    assert statistics["finite_count"] == values.size - 4
+
+
+def test_compute_statistics_datetime():
+    values = pd.date_range("2024-01-01", periods=10, freq="1h").values.copy()
+    values[0] = np.datetime64("NaT")
+    statistics = utils.compute_statistics(values)
+    assert statistics["min"] == values[1]
+    assert statistics["max"] == values[-1]
+    assert statistics["count"] == 9
+
+
+def test_compute_statistics_non_numeric():
+    assert utils.compute_statistics(np.array(["a", "b"], dtype=object)) is None
+    assert utils.compute_statistics(np.array([], dtype=float)) is None
+
+
+def test_variable_statistics_cache():
+    ds = utils.standardize_dataset(_get_timeseries_dataset())
+    cache = ds.encoding[utils.VARIABLE_STATISTICS]
+    assert {"temperature", "time", "latitude"} <= set(cache)
+    assert utils.get_variable_statistics(ds, "temperature") is cache["temperature"][1]
+    ds["temperature"] = ds["temperature"] + 100
+    assert utils.get_variable_statistics(ds, "temperature")["min"] >= 100
+
+
+def test_variable_statistics_cache_modified_in_place():
+    ds = utils.standardize_dataset(_get_timeseries_dataset(10**5))
+    ds["temperature"] += 100
+    assert utils.get_variable_statistics(ds, "temperature")["min"] >= 100
+    ds["temperature"].values[:] = np.nan
+    assert utils.get_variable_statistics(ds, "temperature")["count"] == 0
+
+
+def test_variable_statistics_computed_once(monkeypatch):
+    calls = []
+    compute_statistics = utils.compute_statistics
+    monkeypatch.setattr(
+        utils,
+        "compute_statistics",
+        lambda values: calls.append(values) or compute_statistics(values),
+    )
+    ds = utils.standardize_dataset(_get_timeseries_dataset())
+    assert len(calls) == len(ds.encoding[utils.VARIABLE_STATISTICS])
+    ds["temperature"] = ds["temperature"] + 1
+    ds = utils.standardize_dataset(ds)
+    assert len(calls) == len(ds.encoding[utils.VARIABLE_STATISTICS]) + 1
+
+
+@pytest.mark.parametrize("tz", ["UTC", "America/Halifax", None])
+def test_generate_timestamp_objects_encoding(tz):
+    times = pd.date_range("2024-01-01", periods=6, freq="1h", tz=tz)
+    ds = xr.Dataset(
+        {
+            "time": (("x", "y"), times.to_numpy(dtype=object).reshape(2, 3)),
+            "temperature": (("x", "y"), np.ones((2, 3))),
+        }
+    )
+    ds = utils.generate_variables_encoding(ds)
+    assert ds["time"].dtype == "datetime64[ns]"
+    assert ds["time"].dims == ("x", "y")
+    expected = times.tz_convert(None) if tz else times
+    assert (ds["time"].values.ravel() == expected.values).all()
+    assert ds["time"].encoding["units"].endswith("Z")
+    assert ds["time"].attrs.get("timezone") == ("UTC" if tz else None)
+    assert "units" not in ds["temperature"].encoding
+
+
+def test_generate_datetime64_encoding():
+    ds = utils.generate_variables_encoding(_get_timeseries_dataset())
+    assert ds["time"].encoding["units"] == "seconds since 1970-01-01T00:00:00Z"
+    assert ds["comment"].encoding["dtype"] == "str"
+
+
+TEXT_READER_ENGINES = [
+    pytest.param(
+        engine,
+        marks=pytest.mark.skipif(
+            engine == "pyarrow" and importlib.util.find_spec("pyarrow") is None,
+            reason="pyarrow is not installed",
+        ),
+    )
+    for engine in utils.TEXT_READER_ENGINES
+]
+
+
+def _get_whitespace_table(n=100):
+    return "".join(
+        f"{index:6d} {index * 0.125:10.4f} {-index * 1e-3:12.6e}\n"
+        for index in range(n)
+    )
+
+
+@pytest.mark.parametrize("engine", TEXT_READER_ENGINES)
+def test_read_whitespace_table(engine):
+    table = _get_whitespace_table()
+    expected = utils.read_whitespace_table(StringIO(table), names=["a", "b", "c"])
+    df = utils.read_whitespace_table(
+        StringIO(table), names=["a", "b", "c"], engine=engine
+    )
+    pd.testing.assert_frame_equal(df, expected)
+    assert df["b"].iloc[-1] == 99 * 0.125
+
+
+@pytest.mark.parametrize("engine", TEXT_READER_ENGINES)
+def test_read_whitespace_table_inferred_dtypes(engine):
+    table = "  1  2024-01-01 00:00:00  -99.0\n  2  2024-01-01 00:10:00   12.5\n"
+    df = utils.read_whitespace_table(
+        StringIO(table),
+        names=["index", "time", "value"],
+        dtype=None,
+        na_values=[-99],
+        engine=engine,
+        min_gap=2,
+    )
+    assert df["index"].dtype == "int64"
+    assert df["time"].tolist() == ["2024-01-01 00:00:00", "2024-01-01 00:10:00"]
+    assert np.isnan(df["value"].iloc[0])
+    assert df["value"].iloc[1] == 12.5
+
+
+@pytest.mark.parametrize("engine", TEXT_READER_ENGINES)
+def test_read_whitespace_table_not_fixed_width(engine):
+    table = "1 2.5 3\n10 2 30.25\n"
+    df = utils.read_whitespace_table(
+        StringIO(table), names=["a", "b", "c"], engine=engine
+    )
+    assert df["c"].tolist() == [3, 30.25]
+
+
+@pytest.mark.parametrize("engine", TEXT_READER_ENGINES)
+def test_read_whitespace_table_encoding(engine, tmp_path, caplog):
+    caplog.set_level("DEBUG")
+    path = tmp_path / "table.txt"
+    path.write_bytes("  1  café\n  2  thé\n".encode("latin-1"))
+    df = utils.read_whitespace_table(
+        path,
+        names=["index", "name"],
+        dtype=None,
+        engine=engine,
+        min_gap=2,
+        encoding="latin-1",
+    )
+    assert df["name"].tolist() == ["café", "thé"]
+    assert "fall back" not in caplog.text
+
+
+def test_read_whitespace_table_unknown_engine():
+    with pytest.raises(ValueError, match="Unknown engine"):
+        utils.read_whitespace_table(StringIO("1 2\n"), names=["a", "b"], engine="c")
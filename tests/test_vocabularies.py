@@ -1,4 +1,7 @@
+import os
 import re
+import subprocess
+import sys
 
 import pandas as pd
 import pytest
@@ -40,6 +43,68 @@ class TestVocabularyLoad:
         assert isinstance(vocab, pd.DataFrame)
         assert not vocab.empty
 
+    def test_vocabulary_disk_cache(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(load, "VOCABULARIES_CACHE_DIRECTORY", tmp_path)
+        vocab = load.dfo_odf_vocabulary()
+        cached_files = list(tmp_path.glob("dfo_odf_vocabulary-*.pkl"))
+        assert len(cached_files) == 1
+
+        cached_vocab = load.dfo_odf_vocabulary()
+        assert cached_vocab is not vocab
+        pd.testing.assert_frame_equal(cached_vocab, vocab)
+
+    def test_vocabulary_disk_cache_invalidation(self, tmp_path, monkeypatch):
+        vocabularies = tmp_path / "vocabularies"
+        vocabularies.mkdir()
+        source = vocabularies / "dfo_ios_vocabulary.csv"
+        source.write_bytes(
+            (load.VOCABULARIES_DIRECTORY / "dfo_ios_vocabulary.csv").read_bytes()
+        )
+        monkeypatch.setattr(load, "VOCABULARIES_DIRECTORY", vocabularies)
+        monkeypatch.setattr(load, "VOCABULARIES_CACHE_DIRECTORY", tmp_path / "cache")
+        n_terms = len(load.dfo_ios_vocabulary())
+
+        lines = source.read_text().splitlines()
+        source.write_text("\n".join(lines + lines[-1:]) + "\n")
+        assert len(load.dfo_ios_vocabulary()) == n_terms + 1
+        assert len(list((tmp_path / "cache").glob("dfo_ios_vocabulary-*.pkl"))) == 1
+
+    @pytest.mark.parametrize("cache_dir", ["", "0"])
+    def test_vocabulary_disk_cache_disabled(self, cache_dir):
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                (
+                    "from ocean_data_parser.vocabularies import load;"
+                    "assert load.VOCABULARIES_CACHE_DIRECTORY is None"
+                ),
+            ],
+            env={**os.environ, "ODPY_CACHE_DIR": cache_dir},
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        assert result.returncode == 0, result.stderr
+
+    def test_parsers_import_without_loading_vocabularies(self):
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                (
+                    "from ocean_data_parser.vocabularies import load;"
+                    "load.VOCABULARIES_DIRECTORY = None;"
+                    "import ocean_data_parser.parsers.dfo, ocean_data_parser.parsers.seabird,"
+                    "ocean_data_parser.parsers.amundsen"
+                ),
+            ],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        assert result.returncode == 0, result.stderr
+
 
 class TestPlatformVocabulary:
     def test_dfo_platform_load(self):